@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """
 Manual cleanup script untuk menjalankan retention policy tanpa menunggu GitHub Actions
-Gunakan: python manual_cleanup.py [retention_days]
-Contoh: python manual_cleanup.py 30
+Gunakan: python manual_cleanup.py [retention_days] [chunk_size]
+Contoh: python manual_cleanup.py 30 5000
 """
 
 import sys
@@ -14,15 +14,19 @@ load_dotenv()
 
 from src.data.database import init_db, SessionLocal
 from src.data.crud import cleanup_old_data
+from src.data.archive import ArticleArchiver
 
 if __name__ == "__main__":
     # Parse retention days dari argument
     retention_days = 30
+    chunk_size = 5000
     if len(sys.argv) > 1:
         try:
             retention_days = int(sys.argv[1])
+            if len(sys.argv) > 2:
+                chunk_size = int(sys.argv[2])
         except ValueError:
-            print(f"❌ Invalid argument. Usage: python manual_cleanup.py [retention_days]")
+            print(f"❌ Invalid argument. Usage: python manual_cleanup.py [retention_days] [chunk_size]")
             sys.exit(1)
 
     # Init database
@@ -36,10 +40,15 @@ if __name__ == "__main__":
     cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
     print(f"\n📅 Retention Policy: {retention_days} hari")
     print(f"📅 Cutoff date (artikel lebih tua dihapus): {cutoff}")
-    print(f"📅 Hari ini: {datetime.now(timezone.utc)}\n")
+    print(f"📅 Hari ini: {datetime.now(timezone.utc)}")
+    print(f"📦 Chunk size: {chunk_size} id artikel per commit")
+
+    # Data kedaluwarsa diarsipkan ke Parquet dulu jika ARCHIVE_DIR di-set
+    archiver = ArticleArchiver() if os.getenv("ARCHIVE_DIR") else None
+    print(f"🗄️  Arsip Parquet: {archiver.root if archiver else 'nonaktif (ARCHIVE_DIR kosong)'}\n")
 
     # Run cleanup
-    result = cleanup_old_data(db, retention_days=retention_days)
+    result = cleanup_old_data(db, retention_days=retention_days, chunk_size=chunk_size, archiver=archiver)
 
     print("\n" + "=" * 70)
     print("✅ CLEANUP RESULT")
@@ -1,11 +1,75 @@
 """
-Migration script to add source_credibility and noise_probability columns
-Run this once to update existing database schema
+Migration script for existing database schemas. It performs, in order:
+
+- sentiment_logs.source_credibility and sentiment_logs.noise_probability columns
+- articles.title_norm_hash column (title dedup), backfill, and its index
+- dedup of sentiment_logs per article_id, then the unique index on article_id
+- articles.analysis_status work-queue column, backfill, and the (analysis_status, id) index
+- articles.claimed_by / claim_expires_at lease columns and the analysis_attempts counter
+  for analysis workers
+- sentiment_logs.label_source column
+- index on articles.scraped_at for retention cleanup
+
+Every step is idempotent (IF NOT EXISTS), so the script is safe to re-run.
 """
 
 from src.data.database import engine
 from sqlalchemy import text
 
+# Backfill dilakukan per rentang id supaya tidak mengunci seluruh tabel articles sekaligus
+BACKFILL_BATCH_SIZE = 5000
+
+
+def _backfill_title_norm_hash(conn) -> int:
+    """Isi title_norm_hash untuk artikel lama (rumus sama dengan compute_title_norm_hash di crud.py)."""
+    max_id = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM articles")).scalar()
+    updated = 0
+
+    for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+        result = conn.execute(text("""
+            UPDATE articles
+            SET title_norm_hash = md5(regexp_replace(lower(title), '[^a-z0-9]', '', 'g'))
+            WHERE id > :start AND id <= :end
+              AND title_norm_hash IS NULL
+              AND regexp_replace(lower(title), '[^a-z0-9]', '', 'g') <> ''
+        """), {"start": start, "end": start + BACKFILL_BATCH_SIZE})
+        conn.commit()
+        updated += result.rowcount
+
+    return updated
+
+
+def _backfill_analysis_status(conn) -> int:
+    """Tandai artikel yang sudah punya sentiment_logs sebagai 'done'."""
+    max_id = conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM articles")).scalar()
+    updated = 0
+
+    for start in range(0, max_id, BACKFILL_BATCH_SIZE):
+        result = conn.execute(text("""
+            UPDATE articles a
+            SET analysis_status = 'done'
+            WHERE a.id > :start AND a.id <= :end
+              AND a.analysis_status = 'pending'
+              AND EXISTS (SELECT 1 FROM sentiment_logs s WHERE s.article_id = a.id)
+        """), {"start": start, "end": start + BACKFILL_BATCH_SIZE})
+        conn.commit()
+        updated += result.rowcount
+
+    return updated
+
+
+def _dedup_sentiment_logs(conn) -> int:
+    """Hapus sentiment_logs ganda per article_id, sisakan yang id-nya paling kecil."""
+    result = conn.execute(text("""
+        DELETE FROM sentiment_logs s
+        USING sentiment_logs older
+        WHERE s.article_id = older.article_id
+          AND s.id > older.id
+    """))
+    conn.commit()
+    return result.rowcount
+
+
 def migrate():
     print("🔄 Running database migration...")
     
@@ -24,6 +88,86 @@ def migrate():
                 ADD COLUMN IF NOT EXISTS noise_probability FLOAT DEFAULT 0.0
             """))
             print("✅ Added noise_probability column")
+
+            # Add title_norm_hash column (dedup judul via index probe)
+            conn.execute(text("""
+                ALTER TABLE articles
+                ADD COLUMN IF NOT EXISTS title_norm_hash VARCHAR(32)
+            """))
+            conn.commit()
+            print("✅ Added title_norm_hash column")
+
+            backfilled = _backfill_title_norm_hash(conn)
+            print(f"✅ Backfilled title_norm_hash for {backfilled} articles")
+
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_articles_title_norm_hash
+                ON articles (title_norm_hash)
+            """))
+            print("✅ Created index ix_articles_title_norm_hash")
+
+            # Satu log per artikel: buang duplikat lama (simpan log tertua), lalu unique index.
+            # Index ini juga melayani join dashboard, anti-join, cleanup, dan ON CONFLICT (article_id).
+            removed = _dedup_sentiment_logs(conn)
+            print(f"✅ Removed {removed} duplicate sentiment_logs rows")
+
+            conn.execute(text("""
+                CREATE UNIQUE INDEX IF NOT EXISTS ux_sentiment_logs_article_id
+                ON sentiment_logs (article_id)
+            """))
+            # Index non-unique dari migrasi sebelumnya jadi redundan
+            conn.execute(text("DROP INDEX IF EXISTS ix_sentiment_logs_article_id"))
+            conn.commit()
+            print("✅ Created unique index ux_sentiment_logs_article_id")
+
+            # Kolom antrian analisis (default konstan -> tanpa rewrite tabel di Postgres 11+)
+            conn.execute(text("""
+                ALTER TABLE articles
+                ADD COLUMN IF NOT EXISTS analysis_status VARCHAR(16) NOT NULL DEFAULT 'pending'
+            """))
+            conn.commit()
+            print("✅ Added analysis_status column")
+
+            marked = _backfill_analysis_status(conn)
+            print(f"✅ Marked {marked} already-analyzed articles as done")
+
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_articles_analysis_status_id
+                ON articles (analysis_status, id)
+            """))
+            print("✅ Created index ix_articles_analysis_status_id")
+
+            # Lease untuk worker analisis paralel (src/worker.py)
+            conn.execute(text("""
+                ALTER TABLE articles
+                ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(64)
+            """))
+            conn.execute(text("""
+                ALTER TABLE articles
+                ADD COLUMN IF NOT EXISTS claim_expires_at TIMESTAMP WITH TIME ZONE
+            """))
+            print("✅ Added claimed_by / claim_expires_at columns")
+
+            # Jumlah claim per artikel: teks yang selalu gagal berhenti di status 'failed'
+            conn.execute(text("""
+                ALTER TABLE articles
+                ADD COLUMN IF NOT EXISTS analysis_attempts INTEGER NOT NULL DEFAULT 0
+            """))
+            print("✅ Added analysis_attempts column")
+
+            # Asal label sentimen: training cascade hanya memakai label Indo-BERT ("model")
+            conn.execute(text("""
+                ALTER TABLE sentiment_logs
+                ADD COLUMN IF NOT EXISTS label_source VARCHAR(16)
+            """))
+            print("✅ Added label_source column")
+
+            # Retention cleanup mencari rentang artikel kedaluwarsa lewat scraped_at
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS ix_articles_scraped_at
+                ON articles (scraped_at)
+            """))
+            print("✅ Created index ix_articles_scraped_at")
             
             conn.commit()
             print("🎉 Migration completed successfully!")
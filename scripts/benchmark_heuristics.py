@@ -0,0 +1,215 @@
+"""Benchmark lapisan heuristik TruthEngineAI: TextFeatures + Aho-Corasick vs implementasi lama.
+
+`LegacyHeuristics` adalah salinan method heuristik sebelum automaton (regex per keyword,
+normalisasi berulang, scan `any(phrase in text)` terpisah) dan memakai kamus yang sama
+dari instance TruthEngineAI. Model tidak dimuat (load_model=False).
+
+Output: waktu per teks kedua implementasi, speedup, dan jumlah teks yang hasilnya beda
+(gatekeeper, label heuristik, sector hits, noise probability). Exit code 1 jika ada beda.
+
+Contoh:
+    python scripts/benchmark_heuristics.py
+    python scripts/benchmark_heuristics.py --texts 20000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.analysis.sentiment import TruthEngineAI
+
+
+class LegacyHeuristics:
+    """Salinan heuristik lama sebagai baseline (jangan dioptimasi)."""
+
+    def __init__(self, engine: TruthEngineAI):
+        self.positive_keywords = engine.positive_keywords
+        self.negative_keywords = engine.negative_keywords
+        self.sectoral_keywords = engine.sectoral_keywords
+        self.financial_context_keywords = engine.financial_context_keywords
+        self.absolute_positive_phrases = engine.absolute_positive_phrases
+        self.pom_pom_noise_phrases = engine.pom_pom_noise_phrases
+        self.noise_booster_patterns = engine.noise_booster_patterns
+
+    def _normalize_text(self, text: str) -> str:
+        return re.sub(r'\s+', ' ', text.lower()).strip()
+
+    def _count_sector_matches(self, text: str) -> tuple[int, dict[str, int]]:
+        normalized_text = self._normalize_text(text)
+        sector_hits: dict[str, int] = {}
+        total_hits = 0
+
+        for sector, keywords in self.sectoral_keywords.items():
+            hits = 0
+            for keyword in keywords:
+                keyword_norm = keyword.lower()
+                pattern = rf'\b{re.escape(keyword_norm)}\b'
+
+                if re.search(pattern, normalized_text):
+                    hits += 1
+
+            if hits:
+                sector_hits[sector] = hits
+                total_hits += hits
+
+        return total_hits, sector_hits
+
+    def _has_absolute_positive_signal(self, text: str) -> bool:
+        normalized_text = self._normalize_text(text)
+        return any(phrase in normalized_text for phrase in self.absolute_positive_phrases)
+
+    def _has_absolute_negative_signal(self, text: str) -> bool:
+        normalized_text = self._normalize_text(text)
+        negative_signals = [
+            'laba turun', 'rugi naik', 'penurunan laba', 'pemangkasan dividen',
+            'kinerja memburuk', 'ditekan', 'tekanan jual', 'gagal bayar',
+            'kerugian', 'kerugian kuartal', 'phk', 'phk massal', 'pemutusan hubungan kerja',
+            'pemutusan kerja', 'pengurangan karyawan', 'pemangkasan', 'anjlok'
+        ]
+        return any(phrase in normalized_text for phrase in negative_signals)
+
+    def _check_financial_dictionary(self, text: str) -> str:
+        text_lower = self._normalize_text(text)
+        if any(word in text_lower for word in self.positive_keywords):
+            return "POSITIVE"
+        if any(word in text_lower for word in self.negative_keywords):
+            return "NEGATIVE"
+        return None
+
+    def _is_financial_news(self, text: str) -> bool:
+        text_lower = self._normalize_text(text)
+        sector_hits, _ = self._count_sector_matches(text_lower)
+        context_hits = sum(1 for word in self.financial_context_keywords if word in text_lower)
+
+        if sector_hits >= 2:
+            return True
+        if sector_hits >= 1 and context_hits >= 1:
+            return True
+        if self._has_absolute_positive_signal(text_lower):
+            return True
+        if self._has_absolute_negative_signal(text_lower):
+            return True
+        ticker_pattern = r'\b[A-Z]{3,5}\b'
+        if re.search(ticker_pattern, text):
+            return True
+        return False
+
+    def _calculate_noise_probability(self, text: str) -> float:
+        if not text:
+            return 1.0
+        normalized_text = self._normalize_text(text)
+        uppercase_count = sum(1 for c in text if c.isupper())
+        upper_ratio = uppercase_count / len(text) if len(text) > 0 else 0
+        exclamation_count = len(re.findall(r'!', text))
+        noise_score = 0.0
+        if upper_ratio > 0.15:
+            noise_score += 0.4
+        if exclamation_count > 3:
+            noise_score += 0.3
+        if any(phrase in normalized_text for phrase in self.pom_pom_noise_phrases):
+            noise_score += 0.35
+        booster_hits = sum(1 for pattern in self.noise_booster_patterns if re.search(pattern, normalized_text))
+        if booster_hits:
+            noise_score += min(0.25 * booster_hits, 0.5)
+        if re.search(r'\b(pasti|jamin|dijamin|terbukti|auto|mustahil rugi)\b', normalized_text):
+            noise_score += 0.2
+        return min(noise_score, 1.0)
+
+
+def heuristic_outputs(impl, text: str) -> tuple:
+    """Semua keputusan heuristik untuk satu teks (urutan pemanggilan sama dengan analyze)."""
+    safe_text = text[:512]
+    is_financial = impl._is_financial_news(safe_text)
+    absolute_positive = impl._has_absolute_positive_signal(safe_text)
+    dictionary_label = impl._check_financial_dictionary(safe_text)
+    sectors = impl._count_sector_matches(safe_text)
+    noise = impl._calculate_noise_probability(safe_text)
+    return is_financial, absolute_positive, dictionary_label, sectors, noise
+
+
+VOCABULARY = (
+    "saham ihsg emiten bursa investor dividen laba rugi kuartal rupiah obligasi ipo sekuritas "
+    "bbri bmri bca bbca bank npl goto buka e-commerce startup aplikasi properti apartemen "
+    "batubara migas oil gas brent bbm otomotif pabrik ekspansi ritel konsumsi makanan "
+    "naik turun menguat melemah anjlok meroket cuan bandar auto pasti jamin terbukti "
+    "bankrupt gasnya bankir aplikasinya pabrikan oilfield phk kerugian ditekan "
+    "pemerintah cuaca hujan jalan tol sepak bola konser film liburan"
+).split()
+PHRASES = [
+    "laba bersih naik", "bagikan dividen", "rugi menurun", "laba turun", "tekanan jual",
+    "cuan luber", "meroket  tajam", "to the moon", "saham gorengan", "naik gila-gilaan",
+    "bi rate", "suku bunga", "real estate", "platform digital", "volume penjualan",
+    "mustahil rugi", "gagal bayar", "koreksi tajam", "market cap", "reksa dana",
+]
+TICKERS = ["BBRI", "TLKM", "GOTO", "ASII", "IHSG", "OJK", "BI", "Bank", "PT"]
+
+
+def build_corpus(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    corpus = ["", "   ", "!!!!!", "BBRI"]
+    while len(corpus) < count:
+        tokens = []
+        for _ in range(rng.randint(5, 90)):
+            roll = rng.random()
+            if roll < 0.12:
+                tokens.append(rng.choice(PHRASES))
+            elif roll < 0.2:
+                tokens.append(rng.choice(TICKERS))
+            else:
+                word = rng.choice(VOCABULARY)
+                tokens.append(word.upper() if rng.random() < 0.05 else word)
+            if rng.random() < 0.08:
+                tokens[-1] += rng.choice(["!", ",", ".", "-nya", "\n", "\t"])
+        corpus.append(" ".join(tokens))
+    return corpus[:count]
+
+
+def time_impl(impl, corpus: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in corpus:
+            heuristic_outputs(impl, text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--texts", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    engine = TruthEngineAI(load_model=False, use_cache=False)
+    legacy = LegacyHeuristics(engine)
+    corpus = build_corpus(args.texts, args.seed)
+
+    mismatches = [text for text in corpus if heuristic_outputs(legacy, text) != heuristic_outputs(engine, text)]
+
+    legacy_seconds = time_impl(legacy, corpus, args.repeat)
+    engine_seconds = time_impl(engine, corpus, args.repeat)
+
+    print(f"texts            : {len(corpus)}")
+    print(f"legacy           : {legacy_seconds * 1e6 / len(corpus):.1f} µs/teks")
+    print(f"text features    : {engine_seconds * 1e6 / len(corpus):.1f} µs/teks")
+    print(f"speedup          : {legacy_seconds / engine_seconds:.1f}x")
+    print(f"output berbeda   : {len(mismatches)}")
+    for text in mismatches[:5]:
+        print(f"  ✗ {text[:100]!r}")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
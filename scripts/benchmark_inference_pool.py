@@ -0,0 +1,123 @@
+"""Benchmark throughput Indo-BERT: in-process vs inference pool (fork, bobot dibagi copy-on-write).
+
+Model dimuat sekali; setiap konfigurasi `workers x threads` membuat InferencePool baru dari
+pipeline yang sama. Teks diurutkan berdasarkan panjang seperti di analyze_batch, lalu
+dijalankan lewat `_run_model` (hanya forward pass, tanpa heuristik/cache).
+
+Konfigurasi pool dijalankan lebih dulu, baru baseline in-process (workers=0): induk tidak
+boleh menjalankan inferensi torch sebelum fork.
+
+Output per konfigurasi: teks/detik, speedup terhadap baseline in-process pertama,
+PSS total worker (Linux, memori yang benar-benar dipakai setelah berbagi halaman),
+dan apakah label identik dengan baseline.
+
+Contoh:
+    python scripts/benchmark_inference_pool.py
+    python scripts/benchmark_inference_pool.py --workers 0,2,4,8 --threads 1,2,4 --articles 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from scripts.benchmark_sentiment_batch import build_corpus
+from src.analysis.inference_pool import InferencePool
+from src.analysis.sentiment import TruthEngineAI
+
+
+def parse_counts(raw: str) -> list[int]:
+    return [int(value) for value in raw.split(",") if value.strip()]
+
+
+def children_pss_mb() -> float | None:
+    """Jumlah PSS (MB) semua proses anak, dari /proc/<pid>/smaps_rollup."""
+    total_kb = 0
+    for child in multiprocessing.active_children():
+        try:
+            with open(f"/proc/{child.pid}/smaps_rollup", "r", encoding="utf-8") as fh:
+                for line in fh:
+                    if line.startswith("Pss:"):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            return None
+    return total_kb / 1024
+
+
+def run_config(engine: TruthEngineAI, texts: list[str], batch_size: int, repeat: int) -> tuple[float, list[str]]:
+    best = float("inf")
+    labels: list[str] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        outputs = engine._run_model(texts, batch_size)
+        best = min(best, time.perf_counter() - started)
+        labels = [output["label"] for output in outputs]
+    return best, labels
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--workers", default="0,1,2,4", help="Daftar jumlah worker (0 = in-process)")
+    parser.add_argument("--threads", default="1,2,4", help="Daftar torch thread per worker")
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    import torch
+
+    texts = sorted(build_corpus(args.articles, args.seed), key=len)
+    engine = TruthEngineAI(batch_size=args.batch_size, use_cache=False, pool_workers=0)
+
+    workers_grid = parse_counts(args.workers)
+    threads_grid = parse_counts(args.threads)
+    # Pool dulu, in-process terakhir (lihat docstring)
+    configs = [(w, t) for w in workers_grid if w > 0 for t in threads_grid]
+    configs += [(0, t) for t in threads_grid] if 0 in workers_grid else []
+
+    rows = []
+    for workers, threads in configs:
+        pss = None
+        if workers:
+            engine.inference_pool = InferencePool(engine.nlp_pipeline, workers, threads)
+            # Warm-up: lazy init di setiap worker tidak ikut terukur
+            engine._run_model(texts[:args.batch_size * workers], args.batch_size)
+        else:
+            torch.set_num_threads(threads)
+            engine._run_model(texts[:args.batch_size], args.batch_size)
+
+        seconds, labels = run_config(engine, texts, args.batch_size, args.repeat)
+        if workers:
+            pss = children_pss_mb()
+            engine.close()
+        rows.append((workers, threads, seconds, pss, labels))
+
+    baseline = next((row for row in rows if row[0] == 0), rows[0])
+    print(f"articles : {len(texts)}  batch_size : {args.batch_size}  cpu : {multiprocessing.cpu_count()}")
+    print(f"{'workers':>7} {'threads':>7} {'teks/detik':>11} {'speedup':>8} {'PSS MB':>8}  labels")
+    for workers, threads, seconds, pss, labels in rows:
+        pss_text = f"{pss:.0f}" if pss is not None else "-"
+        print(
+            f"{workers or 'in-proc':>7} {threads:>7} {len(texts) / seconds:>11.1f} "
+            f"{baseline[2] / seconds:>7.2f}x {pss_text:>8}  {'identik' if labels == baseline[4] else 'BEDA'}"
+        )
+
+    best = min(rows, key=lambda row: row[2])
+    if best[0]:
+        print(f"terbaik  : SENTIMENT_POOL_WORKERS={best[0]} SENTIMENT_POOL_THREADS={best[1]}")
+    else:
+        print(f"terbaik  : in-process (SENTIMENT_POOL_WORKERS=0), torch {best[1]} thread")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""Benchmark parser RSS streaming (lxml iterparse) vs parser BeautifulSoup lama.
+
+Setiap parser dijalankan di proses terpisah agar peak RSS memory tidak saling
+mempengaruhi. Output juga melaporkan apakah kedua parser menghasilkan item yang sama.
+
+Contoh:
+    python scripts/benchmark_rss_parser.py recorded/google_news_*.xml
+    python scripts/benchmark_rss_parser.py --synthetic 20000 --repeat 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import re
+import resource
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from bs4 import BeautifulSoup
+
+from src.data.scraper import ScrapedData, iter_rss_items
+
+
+def legacy_parse_rss_items(xml_data: bytes, feed_url: str) -> list[ScrapedData]:
+    """Salinan parser lama (BeautifulSoup "xml" + html.parser per description) sebagai baseline."""
+    articles = []
+    soup = BeautifulSoup(xml_data, "xml")
+    for item in soup.find_all("item"):
+        title_el = item.find("title")
+        link_el = item.find("link")
+        description_el = item.find("description")
+        pubdate_el = item.find("pubDate")
+        source_el = item.find("source")
+
+        title = title_el.text.strip() if title_el else "No title"
+        link = link_el.text.strip() if link_el else None
+        description_raw = description_el.text.strip() if description_el else ""
+        description = BeautifulSoup(description_raw, "html.parser").get_text(" ", strip=True)
+        pub_date = pubdate_el.text.strip() if pubdate_el else datetime.now().isoformat()
+
+        domain = "unknown"
+        source_url = source_el.get("url", "").strip() if source_el else ""
+        source_name = source_el.text.strip() if source_el and source_el.text else ""
+        if source_url:
+            match = re.search(r'(?:https?://)?(?:www\.)?([^/]+)', source_url)
+            if match:
+                domain = match.group(1)
+        elif source_name:
+            domain = source_name
+        elif link:
+            match = re.search(r'(?:https?://)?(?:www\.)?([^/]+)', link)
+            if match:
+                domain = match.group(1)
+
+        articles.append(ScrapedData(
+            url=link or feed_url,
+            title=title,
+            content=description or title,
+            source_domain=domain,
+            published_at=pub_date,
+        ))
+    return articles
+
+
+def streaming_parse_rss_items(xml_data: bytes, feed_url: str) -> list[ScrapedData]:
+    return list(iter_rss_items(xml_data, feed_url))
+
+
+PARSERS = {
+    "bs4_legacy": legacy_parse_rss_items,
+    "lxml_iterparse": streaming_parse_rss_items,
+}
+
+
+def build_synthetic_feed(n_items: int) -> bytes:
+    """Feed mirip Google News RSS (description berisi HTML ter-escape)."""
+    portals = [
+        ("https://www.cnbcindonesia.com", "CNBC Indonesia"),
+        ("https://www.kontan.co.id", "Kontan"),
+        ("https://www.bisnis.com", "Bisnis.com"),
+        ("https://www.kompas.com", "Kompas.com"),
+    ]
+    items = []
+    for i in range(n_items):
+        portal_url, portal_name = portals[i % len(portals)]
+        title = f"IHSG ditutup menguat {i % 97} poin, saham BBRI &amp; BMRI jadi penopang - {portal_name}"
+        description = (
+            f"&lt;a href=\"https://news.google.com/rss/articles/CBMi{i:08d}?oc=5\" target=\"_blank\"&gt;"
+            f"{title}&lt;/a&gt;&amp;nbsp;&amp;nbsp;&lt;font color=\"#6f6f6f\"&gt;{portal_name}&lt;/font&gt;"
+        )
+        items.append(
+            "<item>"
+            f"<title>{title}</title>"
+            f"<link>https://news.google.com/rss/articles/CBMi{i:08d}?oc=5</link>"
+            f"<guid isPermaLink=\"false\">CBMi{i:08d}</guid>"
+            f"<pubDate>Mon, 13 Oct 2026 0{i % 10}:15:00 GMT</pubDate>"
+            f"<description>{description}</description>"
+            f"<source url=\"{portal_url}\">{portal_name}</source>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel>'
+        "<title>saham - Google News</title><link>https://news.google.com/</link>"
+        "<lastBuildDate>Mon, 13 Oct 2026 09:00:00 GMT</lastBuildDate>"
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def _peak_rss_kb() -> int:
+    """High-water mark RSS proses ini (VmHWM di Linux; ru_maxrss ikut mewarisi nilai parent)."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as fh:
+            for line in fh:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _run_parser(parser_name: str, feeds: list[tuple[str, bytes]], repeat: int, queue) -> None:
+    parser = PARSERS[parser_name]
+    baseline_rss_kb = _peak_rss_kb()
+
+    items = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for feed_url, xml_data in feeds:
+            items += len(parser(xml_data, feed_url))
+    elapsed = time.perf_counter() - started
+
+    peak_rss_kb = _peak_rss_kb()
+    queue.put({
+        "parser": parser_name,
+        "items": items,
+        "seconds": elapsed,
+        "items_per_sec": items / elapsed if elapsed else 0.0,
+        "peak_rss_delta_mb": (peak_rss_kb - baseline_rss_kb) / 1024,
+    })
+
+
+def _measure(parser_name: str, feeds: list[tuple[str, bytes]], repeat: int) -> dict:
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_run_parser, args=(parser_name, feeds, repeat, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark RSS parser: BeautifulSoup vs lxml iterparse")
+    parser.add_argument("feeds", nargs="*", type=Path, help="File RSS hasil rekaman (XML mentah).")
+    parser.add_argument("--synthetic", type=int, default=0, help="Tambahkan feed sintetis berisi N item.")
+    parser.add_argument("--repeat", type=int, default=3, help="Berapa kali setiap feed di-parse.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    feeds = [(str(path), path.read_bytes()) for path in args.feeds]
+    if args.synthetic or not feeds:
+        feeds.append(("synthetic://google-news", build_synthetic_feed(args.synthetic or 10000)))
+
+    total_mb = sum(len(xml_data) for _, xml_data in feeds) / (1024 * 1024)
+    print(f"Feeds: {len(feeds)} | Total size: {total_mb:.1f} MB | Repeat: {args.repeat}")
+
+    mismatches = 0
+    for feed_url, xml_data in feeds:
+        legacy = legacy_parse_rss_items(xml_data, feed_url)
+        streaming = streaming_parse_rss_items(xml_data, feed_url)
+        if len(legacy) != len(streaming):
+            mismatches += abs(len(legacy) - len(streaming))
+        mismatches += sum(
+            1 for old, new in zip(legacy, streaming)
+            if (old.url, old.title, old.content, old.source_domain) != (new.url, new.title, new.content, new.source_domain)
+        )
+    print(f"Output parity: {'OK' if mismatches == 0 else f'{mismatches} item berbeda'}")
+
+    results = [_measure(name, feeds, args.repeat) for name in PARSERS]
+    print(f"\n{'parser':<16}{'items':>10}{'seconds':>10}{'items/sec':>12}{'peak RSS +MB':>14}")
+    for res in results:
+        print(
+            f"{res['parser']:<16}{res['items']:>10}{res['seconds']:>10.2f}"
+            f"{res['items_per_sec']:>12.0f}{res['peak_rss_delta_mb']:>14.1f}"
+        )
+
+    baseline, candidate = results
+    if candidate["seconds"]:
+        print(f"\nSpeedup lxml_iterparse vs bs4_legacy: {baseline['seconds'] / candidate['seconds']:.1f}x")
+    return 0 if mismatches == 0 else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+"""Cek paritas akurasi backend ONNX int8 vs backend torch pada fixture berlabel.
+
+Kedua backend dijalankan langsung pada model (tanpa gatekeeper/heuristik) supaya
+yang dibandingkan benar-benar output transformer. Output: akurasi masing-masing
+backend terhadap label fixture, tingkat kesepakatan label, selisih confidence,
+latensi per artikel, dan peak RSS tiap backend (diukur di proses terpisah).
+
+Exit code 1 jika akurasi ONNX turun lebih dari --max-accuracy-drop dibanding torch.
+
+Contoh:
+    python scripts/check_onnx_parity.py
+    python scripts/check_onnx_parity.py --fixture tests/fixtures/sentiment_labeled.json --max-accuracy-drop 0.03
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing as mp
+import sys
+import time
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+DEFAULT_FIXTURE = ROOT_DIR / "tests" / "fixtures" / "sentiment_labeled.json"
+
+
+def _peak_rss_mb() -> float:
+    # VmHWM = peak RSS proses ini saja (ru_maxrss ikut mewarisi nilai proses induk)
+    with open("/proc/self/status", encoding="utf-8") as fh:
+        for line in fh:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _run_backend(backend: str, texts: list[str], queue) -> None:
+    from src.analysis.sentiment import LABEL_MAP, TruthEngineAI
+
+    started = time.perf_counter()
+    engine = TruthEngineAI(backend=backend)
+    load_seconds = time.perf_counter() - started
+
+    # Per artikel (batch 1), sama seperti jalur analyze()
+    engine.nlp_pipeline(texts[0])
+    started = time.perf_counter()
+    outputs = [engine.nlp_pipeline(text[:512])[0] for text in texts]
+    infer_seconds = time.perf_counter() - started
+
+    queue.put({
+        "labels": [LABEL_MAP.get(output["label"], output["label"].upper()) for output in outputs],
+        "scores": [float(output["score"]) for output in outputs],
+        "load_seconds": load_seconds,
+        "ms_per_article": infer_seconds * 1000 / len(texts),
+        "peak_rss_mb": _peak_rss_mb(),
+    })
+
+
+def run_in_process(backend: str, texts: list[str]) -> dict:
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_run_backend, args=(backend, texts, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixture", type=Path, default=DEFAULT_FIXTURE)
+    parser.add_argument("--max-accuracy-drop", type=float, default=0.02)
+    args = parser.parse_args()
+
+    samples = json.loads(args.fixture.read_text(encoding="utf-8"))
+    texts = [sample["text"] for sample in samples]
+    gold = [sample["label"] for sample in samples]
+
+    results = {backend: run_in_process(backend, texts) for backend in ("torch", "onnx")}
+
+    def accuracy(labels: list[str]) -> float:
+        return sum(label == expected for label, expected in zip(labels, gold)) / len(gold)
+
+    torch_result, onnx_result = results["torch"], results["onnx"]
+    agreement = sum(a == b for a, b in zip(torch_result["labels"], onnx_result["labels"])) / len(texts)
+    max_score_diff = max(abs(a - b) for a, b in zip(torch_result["scores"], onnx_result["scores"]))
+
+    print(f"fixture           : {args.fixture} ({len(texts)} sampel)")
+    for backend, result in results.items():
+        print(
+            f"{backend:<6} accuracy   : {accuracy(result['labels']):.3f} | "
+            f"load {result['load_seconds']:.1f}s | {result['ms_per_article']:.1f} ms/artikel | "
+            f"peak RSS {result['peak_rss_mb']:.0f} MB"
+        )
+    print(f"label agreement   : {agreement:.3f}")
+    print(f"max |Δscore|      : {max_score_diff:.4f}")
+
+    accuracy_drop = accuracy(torch_result["labels"]) - accuracy(onnx_result["labels"])
+    if accuracy_drop > args.max_accuracy_drop:
+        print(f"❌ Akurasi ONNX turun {accuracy_drop:.3f} (batas {args.max_accuracy_drop:.3f})")
+        return 1
+
+    print("✅ Paritas ONNX int8 dalam batas toleransi")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+Tier tengah cascade TruthEngineAI: model linear kecil sebelum Indo-BERT.
+
+Urutan di analyze / analyze_batch:
+    gatekeeper -> frase absolut / kamus -> model linear (jika yakin) -> Indo-BERT
+
+Model: HashingVectorizer (unigram + bigram, tanpa vocabulary) -> TF-IDF -> LogisticRegression,
+dilatih offline dari label Indo-BERT di sentiment_logs (tools/train_cascade_model.py).
+Teks dijawab model linear hanya jika probabilitas kelas teratas >= threshold
+(CASCADE_CONFIDENCE_THRESHOLD, default: saran dari training); sisanya jatuh ke Indo-BERT.
+
+Metrik per run (`summary()`):
+- fallthrough_rate     : porsi teks yang tetap ke Indo-BERT
+- agreement            : kecocokan dengan Indo-BERT pada sampel shadow jawaban yakin
+                         (CASCADE_SHADOW_RATE, teks sampel tetap dijalankan ke Indo-BERT)
+- fallthrough_agreement: kecocokan tebakan (tidak yakin) model linear pada teks yang jatuh ke Indo-BERT
+
+scikit-learn opsional: tanpa paket itu atau tanpa file model, cascade nonaktif.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import random
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence
+
+from src.data.local_store import cache_path
+
+logger = logging.getLogger(__name__)
+
+CASCADE_LABELS = ("NEGATIVE", "NEUTRAL", "POSITIVE")
+DEFAULT_THRESHOLD = 0.9
+
+
+def default_model_path() -> Path:
+    """CASCADE_MODEL_PATH jika di-set, selain itu SENTI_CACHE_DIR/cascade/model.pkl."""
+    override = os.getenv("CASCADE_MODEL_PATH")
+    if override:
+        return Path(override)
+    return cache_path("cascade") / "model.pkl"
+
+
+def build_estimator(n_features: int = 2 ** 18, C: float = 4.0):
+    """Pipeline sklearn yang belum dilatih (import sklearn hanya saat training / load)."""
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+
+    return make_pipeline(
+        HashingVectorizer(n_features=n_features, ngram_range=(1, 2), alternate_sign=False, norm=None),
+        TfidfTransformer(sublinear_tf=True),
+        LogisticRegression(C=C, max_iter=2000),
+    )
+
+
+def save_model(estimator, metadata: dict, path: Optional[Path] = None) -> Path:
+    """Simpan atomik (tmp + rename) supaya daemon/cron yang sedang memuat tidak membaca file setengah jadi."""
+    path = Path(path or default_model_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"estimator": estimator, "metadata": {**metadata, "saved_at": datetime.now(timezone.utc).isoformat()}}
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return path
+
+
+class CascadeDecision(NamedTuple):
+    label: str
+    confidence: float
+    confident: bool
+
+
+class CascadeClassifier:
+    def __init__(self, estimator, threshold: float, metadata: Optional[dict] = None,
+                 shadow_rate: float = 0.0, version: str = "untracked"):
+        self.estimator = estimator
+        self.threshold = threshold
+        self.metadata = metadata or {}
+        self.shadow_rate = shadow_rate
+        self.version = version
+        self._labels = [str(label) for label in estimator.classes_]
+        self._rng = random.Random()
+        self.stats = {
+            "evaluated": 0, "answered": 0, "fallthrough": 0,
+            "shadow_checked": 0, "shadow_agreed": 0,
+            "fallthrough_checked": 0, "fallthrough_agreed": 0,
+        }
+
+    def decide(self, texts: Sequence[str]) -> List[CascadeDecision]:
+        """Label + probabilitas kelas teratas per teks; `confident` jika >= threshold."""
+        if not texts:
+            return []
+        decisions = []
+        for row in self.estimator.predict_proba(list(texts)):
+            best = int(row.argmax())
+            confidence = float(row[best])
+            decisions.append(CascadeDecision(self._labels[best], confidence, confidence >= self.threshold))
+
+        answered = sum(1 for decision in decisions if decision.confident)
+        self.stats["evaluated"] += len(decisions)
+        self.stats["answered"] += answered
+        self.stats["fallthrough"] += len(decisions) - answered
+        return decisions
+
+    def sample_shadow(self) -> bool:
+        """True jika jawaban yakin ini juga harus dicek Indo-BERT (untuk metrik agreement)."""
+        return self.shadow_rate > 0 and self._rng.random() < self.shadow_rate
+
+    def record_shadow(self, cascade_label: str, model_label: str) -> None:
+        self.stats["shadow_checked"] += 1
+        self.stats["shadow_agreed"] += int(cascade_label == model_label)
+
+    def record_fallthrough(self, cascade_label: str, model_label: str) -> None:
+        self.stats["fallthrough_checked"] += 1
+        self.stats["fallthrough_agreed"] += int(cascade_label == model_label)
+
+    def summary(self) -> dict:
+        stats = self.stats
+
+        def _ratio(part: int, whole: int) -> Optional[float]:
+            return round(part / whole, 4) if whole else None
+
+        return {
+            **stats,
+            "threshold": self.threshold,
+            "version": self.version,
+            "fallthrough_rate": _ratio(stats["fallthrough"], stats["evaluated"]),
+            "agreement": _ratio(stats["shadow_agreed"], stats["shadow_checked"]),
+            "fallthrough_agreement": _ratio(stats["fallthrough_agreed"], stats["fallthrough_checked"]),
+        }
+
+
+def load_cascade(path: Optional[Path] = None, threshold: Optional[float] = None,
+                 shadow_rate: Optional[float] = None) -> Optional[CascadeClassifier]:
+    """Muat model cascade; None (cascade nonaktif) jika file atau scikit-learn tidak ada."""
+    path = Path(path or default_model_path())
+    if not path.exists():
+        logger.info(f"ℹ️ Model cascade belum ada di {path}, semua teks non-heuristik ke Indo-BERT.")
+        return None
+
+    try:
+        raw = path.read_bytes()
+        payload = pickle.loads(raw)
+    except ImportError as e:
+        logger.warning(f"⚠️ Cascade nonaktif, scikit-learn tidak tersedia: {e}")
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError) as e:
+        logger.warning(f"⚠️ Model cascade {path} tidak bisa dibaca, cascade nonaktif: {e}")
+        return None
+
+    # File lama / rusak / bukan hasil save_model: jangan sampai KeyError menghentikan engine
+    estimator = payload.get("estimator") if isinstance(payload, dict) else None
+    metadata = payload.get("metadata", {}) if isinstance(payload, dict) else None
+    if not (hasattr(estimator, "predict_proba") and hasattr(estimator, "classes_") and isinstance(metadata, dict)):
+        logger.warning(
+            f"⚠️ Model cascade {path} tidak valid (butuh 'estimator' dengan predict_proba/classes_ "
+            f"dan 'metadata'), cascade nonaktif. Latih ulang dengan tools/train_cascade_model.py."
+        )
+        return None
+
+    if threshold is None:
+        env_threshold = os.getenv("CASCADE_CONFIDENCE_THRESHOLD")
+        threshold = float(env_threshold) if env_threshold else float(metadata.get("suggested_threshold", DEFAULT_THRESHOLD))
+    if shadow_rate is None:
+        shadow_rate = float(os.getenv("CASCADE_SHADOW_RATE", "0.05"))
+
+    version = hashlib.blake2b(raw, digest_size=6).hexdigest()
+    cascade = CascadeClassifier(estimator, threshold, metadata, shadow_rate, version)
+    logger.info(
+        f"🪜 Cascade linear dimuat ({path}, {metadata.get('samples', '?')} sampel, "
+        f"threshold {threshold}, shadow {shadow_rate:.0%})."
+    )
+    return cascade
@@ -27,6 +27,11 @@ for p in _POSSIBLE_PATHS:
 _SORTED_NAMES = sorted(list(_MAPPING.keys()), key=len, reverse=True)
 
 
+def get_emiten_mapping() -> Dict[str, str]:
+    """Copy of the loaded company name -> ticker mapping."""
+    return dict(_MAPPING)
+
+
 def get_ticker_from_text(text: str) -> Optional[str]:
     """
     Search for company names in `text` using the loaded mapping.
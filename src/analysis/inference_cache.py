@@ -0,0 +1,148 @@
+"""
+Memoization hasil TruthEngineAI per teks.
+
+Berita wire yang sama sering muncul di beberapa portal dengan deskripsi identik.
+Hasil gatekeeper + heuristik + Indo-BERT untuk `text[:512]` disimpan dengan key
+hash(versi model/backend + versi kamus + teks), di dua tingkat:
+
+1. LRU di memori proses
+2. SQLite di SENTI_CACHE_DIR (bertahan antar cron run, aman dipakai beberapa worker)
+
+Yang disimpan hanya bagian yang tidak bergantung pada sumber (label, confidence,
+noise, dan JSON berisi asal label serta sentimen per ticker pada mode window);
+`integrity_score` selalu dihitung ulang dari credibility sumber saat hit.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.data.local_store import cache_path
+
+logger = logging.getLogger(__name__)
+
+# (sentiment_label, confidence, noise_probability, extra JSON: label_source & ticker_sentiment)
+CachedInference = Tuple[str, float, float, Optional[str]]
+
+# Batas parameter per query IN (...) SQLite
+_SQLITE_CHUNK = 500
+
+
+def make_cache_key(text: str, model_version: str, lexicon_version: str) -> str:
+    # Teks sudah berupa input model (512 karakter, atau gabungan kalimat pada mode window)
+    payload = f"{model_version}\x1f{lexicon_version}\x1f{text}".encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class InferenceCache:
+    def __init__(self, path: Optional[Path] = None, max_memory_items: int = 10000, max_age_days: int = 30):
+        self.path = Path(path or cache_path("inference_cache.sqlite3"))
+        self.max_memory_items = max_memory_items
+        self.max_age_days = max_age_days
+        self._memory: "OrderedDict[str, CachedInference]" = OrderedDict()
+        self._pending: Dict[str, CachedInference] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        # Koneksi SQLite tidak boleh dipakai lintas proses: buka ulang jika PID berubah (fork)
+        if self._conn is not None and self._conn_pid == os.getpid():
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS inference_cache ("
+                "key TEXT PRIMARY KEY, label TEXT NOT NULL, confidence REAL NOT NULL, "
+                "noise REAL NOT NULL, created_at REAL NOT NULL, extra TEXT)"
+            )
+            conn.execute(
+                "DELETE FROM inference_cache WHERE created_at < ?",
+                (time.time() - self.max_age_days * 86400,),
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"⚠️ Inference cache {self.path} tidak bisa dibuka, hanya pakai memori: {e}")
+            self._conn, self._conn_pid = None, os.getpid()
+            return None
+
+        self._conn, self._conn_pid = conn, os.getpid()
+        return conn
+
+    def _remember(self, key: str, value: CachedInference) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, CachedInference]:
+        found: Dict[str, CachedInference] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                found[key] = self._memory[key]
+                self.stats["memory_hits"] += 1
+            else:
+                missing.append(key)
+
+        conn = self._connection() if missing else None
+        if conn is not None:
+            for start in range(0, len(missing), _SQLITE_CHUNK):
+                chunk = missing[start:start + _SQLITE_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                try:
+                    rows = conn.execute(
+                        f"SELECT key, label, confidence, noise, extra FROM inference_cache WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                except sqlite3.Error as e:
+                    logger.warning(f"⚠️ Gagal membaca inference cache: {e}")
+                    break
+                for key, label, confidence, noise, extra in rows:
+                    found[key] = (label, confidence, noise, extra)
+                    self._remember(key, found[key])
+                    self.stats["disk_hits"] += 1
+
+        self.stats["misses"] += sum(1 for key in missing if key not in found)
+        return found
+
+    def get(self, key: str) -> Optional[CachedInference]:
+        return self.get_many([key]).get(key)
+
+    def put(self, key: str, value: CachedInference) -> None:
+        self._remember(key, value)
+        self._pending[key] = value
+
+    def flush(self) -> None:
+        """Tulis entri baru ke SQLite dalam satu transaksi."""
+        if not self._pending:
+            return
+        conn = self._connection()
+        if conn is not None:
+            now = time.time()
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO inference_cache (key, label, confidence, noise, extra, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (key, label, confidence, noise, extra, now)
+                        for key, (label, confidence, noise, extra) in self._pending.items()
+                    ],
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"⚠️ Gagal menulis inference cache: {e}")
+        self._pending.clear()
+
+    def summary(self) -> dict:
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        return {**self.stats, "lookups": lookups, "hit_rate": round(hits / lookups, 4) if lookups else 0.0}
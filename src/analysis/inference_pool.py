@@ -0,0 +1,115 @@
+"""
+Pool proses untuk forward pass Indo-BERT (mode multi-core TruthEngineAI).
+
+Intra-op thread torch kurang efektif untuk input pendek (512 karakter): di VPS 4-8 vCPU
+lebih cepat menjalankan beberapa proses dengan sedikit thread masing-masing.
+Model dimuat sekali di proses induk, lalu worker di-fork sehingga bobot model
+(storage tensor, buffer mentah di luar objek Python) dibagi copy-on-write.
+
+- `gc.freeze()` sebelum fork: GC di worker tidak menyentuh header objek milik induk,
+  jadi halaman memori induk tidak ikut tersalin
+- `torch.set_num_threads(threads)` di setiap worker (initializer); default thread per worker
+  = budget CPU proses ini (SENTIMENT_CPU_THREADS, selain itu semua core) dibagi jumlah worker
+- batch model yang sudah diurutkan panjangnya dibagi ke worker (satu chunk = satu forward pass)
+
+Hanya untuk backend torch: session ONNX Runtime tidak aman dipakai setelah fork
+(untuk onnx, atur ONNX_INTRA_OP_THREADS saja).
+
+Fork harus terjadi sebelum induk menjalankan inferensi torch apa pun (thread pool
+OpenMP yang sudah hidup tidak ikut ter-fork), karena itu pool dibuat di akhir
+TruthEngineAI.__init__.
+"""
+
+import gc
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Pipeline milik induk; diwarisi worker lewat fork (tidak pernah di-pickle)
+_POOL_PIPELINE = None
+
+
+def cpu_thread_budget() -> int:
+    """Thread CPU untuk inferensi di proses ini: SENTIMENT_CPU_THREADS jika di-set, selain itu semua core."""
+    return int(os.getenv("SENTIMENT_CPU_THREADS") or 0) or os.cpu_count() or 1
+
+
+def default_threads_per_worker(workers: int) -> int:
+    return max(1, cpu_thread_budget() // max(1, workers))
+
+
+def limit_process_threads(threads: int) -> None:
+    """
+    Batasi thread inferensi proses ini ke `threads`. Harus dipanggil sebelum torch/onnxruntime
+    di-import (thread pool OpenMP/MKL dibuat saat import). Nilai env yang sudah di-set user tetap dipakai.
+    """
+    os.environ["SENTIMENT_CPU_THREADS"] = str(threads)
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "ONNX_INTRA_OP_THREADS"):
+        os.environ.setdefault(name, str(threads))
+
+
+def _init_worker(threads: int) -> None:
+    import torch
+
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Sudah di-set/dipakai di induk: abaikan, intra-op yang menentukan
+        pass
+
+
+def _warmup() -> int:
+    return os.getpid()
+
+
+def _run_chunk(texts: List[str], batch_size: int) -> List[dict]:
+    # Hanya label & score yang dikirim balik (pickle kecil)
+    return [
+        {"label": output["label"], "score": float(output["score"])}
+        for output in _POOL_PIPELINE(texts, batch_size=batch_size)
+    ]
+
+
+class InferencePool:
+    def __init__(self, nlp_pipeline, workers: int, threads_per_worker: Optional[int] = None):
+        global _POOL_PIPELINE
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Mode pool butuh start method 'fork' (Linux/macOS)")
+
+        self.workers = workers
+        self.threads_per_worker = threads_per_worker or default_threads_per_worker(workers)
+
+        _POOL_PIPELINE = nlp_pipeline
+        gc.collect()
+        gc.freeze()
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker,),
+        )
+        # Dengan konteks fork semua worker dibuat pada submit pertama: fork sekarang,
+        # selagi induk belum punya thread pool torch / thread lain
+        self.pids = sorted({future.result() for future in [self._executor.submit(_warmup) for _ in range(workers)]})
+        logger.info(
+            f"🧵 Inference pool siap: {workers} worker x {self.threads_per_worker} thread "
+            f"(pid {', '.join(str(pid) for pid in self.pids)})."
+        )
+
+    def run(self, texts: Sequence[str], batch_size: int) -> List[dict]:
+        """Sama dengan `nlp_pipeline(texts, batch_size=...)`, dibagi per chunk ke worker (urutan dijaga)."""
+        chunks = [list(texts[start:start + batch_size]) for start in range(0, len(texts), batch_size)]
+        outputs: List[dict] = []
+        for chunk_outputs in self._executor.map(_run_chunk, chunks, [batch_size] * len(chunks)):
+            outputs.extend(chunk_outputs)
+        return outputs
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
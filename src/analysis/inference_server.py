@@ -0,0 +1,432 @@
+"""
+Daemon inferensi lokal: TruthEngineAI tetap di memori di antara cron run.
+
+Setiap `python -m src.main` yang membuat `TruthEngineAI()` sendiri harus meng-import
+torch/transformers dan memuat model dari disk lagi. Daemon ini memuat model sekali
+lalu melayani permintaan lewat Unix domain socket:
+
+- protokol: satu baris JSON per request/response (texts boleh berisi newline, sudah di-escape JSON)
+- request dari beberapa client yang datang bersamaan digabung jadi satu `analyze_batch`
+- `{"op": "health"}` mengembalikan status model, uptime, dan statistik batch/cache
+- `{"op": "stats"}` hanya statistik inference cache & cascade (kumulatif sejak daemon start)
+
+Pipeline memakai `get_inference_engine()`: InferenceClient jika daemon hidup,
+selain itu TruthEngineAI in-process seperti sebelumnya.
+
+Contoh:
+    python -m src.analysis.inference_server
+    python -m src.analysis.inference_server --socket /run/senti-quant/inference.sock --backend onnx
+    python -m src.analysis.inference_server --health
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import signal
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from src.data.local_store import cache_path
+
+logger = logging.getLogger(__name__)
+
+# Batas ukuran satu baris request; pemotongan teks diserahkan ke TruthEngineAI._prepare_input
+_MAX_LINE_BYTES = 64 * 1024 * 1024
+
+
+def default_socket_path() -> Path:
+    """INFERENCE_SOCKET jika di-set, selain itu SENTI_CACHE_DIR/inference.sock."""
+    override = os.getenv("INFERENCE_SOCKET")
+    if override:
+        return Path(override)
+    return cache_path("inference.sock")
+
+
+def _send(stream, payload: dict) -> None:
+    stream.write(json.dumps(payload, ensure_ascii=False).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def _receive(stream) -> Optional[dict]:
+    line = stream.readline(_MAX_LINE_BYTES)
+    if not line:
+        return None
+    return json.loads(line)
+
+
+class _PendingRequest:
+    __slots__ = ("texts", "credibilities", "results", "error", "done")
+
+    def __init__(self, texts: List[str], credibilities: List[float]):
+        self.texts = texts
+        self.credibilities = credibilities
+        self.results = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class BatchingEngine:
+    """
+    Satu thread inferensi di depan TruthEngineAI (engine tidak thread-safe).
+    Request yang menunggu di antrian digabung sampai `max_batch_texts` teks atau
+    `max_wait_ms` sejak request pertama, lalu dijalankan sebagai satu analyze_batch.
+    """
+
+    def __init__(self, engine, max_batch_texts: int = 256, max_wait_ms: float = 10.0):
+        self.engine = engine
+        self.max_batch_texts = max_batch_texts
+        self.max_wait = max_wait_ms / 1000.0
+        self.stats = {"requests": 0, "texts": 0, "batches": 0, "errors": 0}
+        self._queue: "queue.Queue[Optional[_PendingRequest]]" = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="inference-batcher", daemon=True)
+        self._thread.start()
+
+    def analyze_batch(self, texts: List[str], credibilities: List[float]) -> List[dict]:
+        if self._stopped.is_set():
+            raise RuntimeError("Daemon inferensi sedang berhenti")
+        request = _PendingRequest(texts, credibilities)
+        self._queue.put(request)
+        while not request.done.wait(timeout=1.0):
+            if not self._thread.is_alive():
+                raise RuntimeError("Daemon inferensi sedang berhenti")
+        if request.error is not None:
+            raise request.error
+        return request.results
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._queue.put(None)
+        self._thread.join(timeout=30)
+        # Request yang masuk antrian setelah sinyal stop tidak akan diproses
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is not None:
+                request.error = RuntimeError("Daemon inferensi sedang berhenti")
+                request.done.set()
+
+    def _collect(self, first: _PendingRequest) -> List[_PendingRequest]:
+        batch = [first]
+        size = len(first.texts)
+        deadline = time.monotonic() + self.max_wait
+        while size < self.max_batch_texts:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if request is None:
+                # Sinyal stop: proses batch ini dulu, lalu berhenti
+                self._queue.put(None)
+                break
+            batch.append(request)
+            size += len(request.texts)
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = self._collect(first)
+
+            texts = [text for request in batch for text in request.texts]
+            credibilities = [cred for request in batch for cred in request.credibilities]
+            try:
+                results = self.engine.analyze_batch(texts, credibilities) if texts else []
+            except Exception as e:
+                logger.error(f"❌ Inferensi batch gagal ({len(texts)} teks): {e}")
+                self.stats["errors"] += 1
+                for request in batch:
+                    request.error = e
+                    request.done.set()
+                continue
+
+            self.stats["requests"] += len(batch)
+            self.stats["texts"] += len(texts)
+            self.stats["batches"] += 1
+
+            offset = 0
+            for request in batch:
+                request.results = results[offset:offset + len(request.texts)]
+                offset += len(request.texts)
+                request.done.set()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        # Satu koneksi boleh mengirim banyak request berurutan
+        while True:
+            try:
+                request = _receive(self.rfile)
+            except ValueError as e:
+                _send(self.wfile, {"ok": False, "error": f"JSON tidak valid: {e}"})
+                return
+            if request is None:
+                return
+            _send(self.wfile, self.server.dispatch(request))
+
+
+class InferenceServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, engine, max_batch_texts: int = 256, max_wait_ms: float = 10.0):
+        self.socket_path = Path(socket_path)
+        self.engine = engine
+        self.batcher = BatchingEngine(engine, max_batch_texts=max_batch_texts, max_wait_ms=max_wait_ms)
+        self.started_at = time.time()
+        _prepare_socket_path(self.socket_path)
+        super().__init__(str(self.socket_path), _RequestHandler)
+        os.chmod(self.socket_path, 0o660)
+
+    def dispatch(self, request: dict) -> dict:
+        op = request.get("op")
+        try:
+            if op == "health":
+                return {"ok": True, **self.health()}
+            if op == "stats":
+                return {"ok": True, **self.engine.stats()}
+            if op == "analyze_batch":
+                texts = [str(text) for text in request.get("texts", [])]
+                credibilities = request.get("credibilities") or [0.5] * len(texts)
+                if len(credibilities) != len(texts):
+                    return {"ok": False, "error": "Jumlah credibilities tidak sama dengan texts"}
+                return {"ok": True, "results": self.batcher.analyze_batch(texts, [float(c) for c in credibilities])}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+        return {"ok": False, "error": f"op tidak dikenal: {op}"}
+
+    def health(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "model_version": self.engine.model_version,
+            "lexicon_version": self.engine.lexicon_version,
+            "batch_size": self.engine.batch_size,
+            "stats": dict(self.batcher.stats),
+            **self.engine.stats(),
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.batcher.stop()
+        if self.engine.inference_cache is not None:
+            self.engine.inference_cache.flush()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _prepare_socket_path(socket_path: Path) -> None:
+    """Hapus socket basi dari daemon yang mati; tolak jika daemon lain masih hidup."""
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if not socket_path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(socket_path))
+    except OSError:
+        socket_path.unlink()
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"Daemon inferensi lain sudah berjalan di {socket_path}")
+
+
+class InferenceDaemonError(RuntimeError):
+    """Daemon tidak bisa dihubungi (socket, timeout, koneksi terputus, respons rusak)."""
+
+
+class InferenceEngineError(RuntimeError):
+    """Daemon hidup tapi engine gagal memproses request (mis. teks yang membuat model error)."""
+
+
+class InferenceClient:
+    """
+    Client tipis dengan signature `analyze` / `analyze_batch` yang sama dengan TruthEngineAI.
+    Jika daemon mati di tengah run, client memuat TruthEngineAI in-process (sekali) dan lanjut.
+    Error dari engine di sisi daemon diteruskan ke pemanggil sebagai InferenceEngineError:
+    model lokal yang sama akan gagal pada input yang sama, jadi tidak ada gunanya dimuat.
+    """
+
+    def __init__(self, socket_path: Optional[Path] = None, timeout: float = 300.0, fallback: bool = True):
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.timeout = timeout
+        self.fallback = fallback
+        self._sock: Optional[socket.socket] = None
+        self._stream = None
+        self._local_engine = None
+
+    def _connect(self):
+        if self._stream is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError:
+                sock.close()
+                raise
+            self._sock, self._stream = sock, sock.makefile("rwb")
+        return self._stream
+
+    def close(self) -> None:
+        if self._stream is not None:
+            try:
+                self._stream.close()
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock, self._stream = None, None
+
+    def _request(self, payload: dict) -> dict:
+        try:
+            stream = self._connect()
+            _send(stream, payload)
+            response = _receive(stream)
+        except (OSError, ValueError) as e:
+            self.close()
+            raise InferenceDaemonError(f"Daemon inferensi tidak bisa dihubungi ({self.socket_path}): {e}") from e
+        if response is None:
+            self.close()
+            raise InferenceDaemonError("Daemon inferensi menutup koneksi")
+        if not response.get("ok"):
+            raise InferenceEngineError(response.get("error", "error tidak diketahui"))
+        return response
+
+    def health(self) -> dict:
+        return self._request({"op": "health"})
+
+    def stats(self) -> dict:
+        """
+        Sama dengan TruthEngineAI.stats, diambil dari daemon (kumulatif sejak daemon start).
+        Setelah fallback in-process: statistik engine lokal.
+        """
+        if self._local_engine is not None:
+            return self._local_engine.stats()
+        try:
+            response = self._request({"op": "stats"})
+        except (InferenceDaemonError, InferenceEngineError) as e:
+            logger.warning(f"⚠️ Statistik daemon inferensi tidak tersedia: {e}")
+            return {"inference_cache": None, "cascade": None}
+        return {"inference_cache": response.get("inference_cache"), "cascade": response.get("cascade")}
+
+    def _local(self):
+        if self._local_engine is None:
+            from src.analysis.sentiment import TruthEngineAI
+
+            logger.warning("⚠️ Daemon inferensi tidak tersedia, memuat TruthEngineAI in-process.")
+            self._local_engine = TruthEngineAI()
+        return self._local_engine
+
+    def analyze_batch(
+        self,
+        texts: Sequence[str],
+        credibilities: Optional[Sequence[float]] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[dict]:
+        if self._local_engine is not None:
+            return self._local_engine.analyze_batch(texts, credibilities, batch_size)
+        if credibilities is None:
+            credibilities = [0.5] * len(texts)
+        try:
+            # batch_size diatur daemon (request digabung lintas client)
+            return self._request({
+                "op": "analyze_batch",
+                "texts": list(texts),
+                "credibilities": list(credibilities),
+            })["results"]
+        except InferenceDaemonError as e:
+            if not self.fallback:
+                raise
+            logger.warning(f"⚠️ {e}")
+            return self._local().analyze_batch(texts, credibilities, batch_size)
+
+    def analyze(self, text: str, source_credibility: float = 0.5) -> dict:
+        return self.analyze_batch([text], [source_credibility])[0]
+
+
+def get_inference_engine(socket_path: Optional[Path] = None):
+    """
+    InferenceClient jika daemon di socket_path sehat, selain itu TruthEngineAI in-process.
+    INFERENCE_SERVER_ENABLED=false melewati daemon sama sekali.
+    """
+    if os.getenv("INFERENCE_SERVER_ENABLED", "true").lower() in ("1", "true", "yes"):
+        client = InferenceClient(socket_path)
+        if client.socket_path.exists():
+            try:
+                health = client.health()
+                logger.info(
+                    f"🔌 Memakai daemon inferensi {client.socket_path} "
+                    f"(pid {health['pid']}, {health['model_version']}, uptime {health['uptime_seconds']}s)."
+                )
+                return client
+            except (InferenceDaemonError, InferenceEngineError) as e:
+                logger.warning(f"⚠️ {e}")
+            client.close()
+
+    from src.analysis.sentiment import TruthEngineAI
+
+    return TruthEngineAI()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Daemon inferensi sentimen Senti-Quant (Unix socket)")
+    parser.add_argument("--socket", type=Path, default=None, help="Path socket (default: INFERENCE_SOCKET / SENTI_CACHE_DIR)")
+    parser.add_argument("--backend", default=None, help="torch atau onnx (default: SENTIMENT_BACKEND)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Teks per forward pass (default: SENTIMENT_BATCH_SIZE)")
+    parser.add_argument("--max-batch-texts", type=int, default=256, help="Maksimal teks per batch gabungan")
+    parser.add_argument("--max-wait-ms", type=float, default=10.0, help="Jeda menunggu request lain untuk digabung")
+    parser.add_argument("--health", action="store_true", help="Cek daemon yang sedang berjalan lalu keluar")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - [%(module)s] - %(message)s'
+    )
+    socket_path = args.socket or default_socket_path()
+
+    if args.health:
+        client = InferenceClient(socket_path, timeout=10, fallback=False)
+        try:
+            print(json.dumps(client.health(), indent=2, ensure_ascii=False))
+        except (InferenceDaemonError, InferenceEngineError) as e:
+            print(f"❌ {e}")
+            raise SystemExit(1)
+        finally:
+            client.close()
+        return
+
+    from src.analysis.sentiment import TruthEngineAI
+
+    engine = TruthEngineAI(batch_size=args.batch_size, backend=args.backend)
+    server = InferenceServer(socket_path, engine, max_batch_texts=args.max_batch_texts, max_wait_ms=args.max_wait_ms)
+
+    def _stop(signum, frame):
+        # shutdown() harus dipanggil dari thread lain selain serve_forever
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, _stop)
+    logger.info(f"🧠 Daemon inferensi siap di {socket_path} ({engine.model_version}).")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"🛑 Daemon inferensi berhenti. Statistik: {server.batcher.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Pencocokan semua kamus heuristik TruthEngineAI dalam satu pass (Aho-Corasick).
+
+Setiap frase didaftarkan sekali ke automaton beserta kategori-kategori pemiliknya.
+Satu iterasi atas teks ternormalisasi menghasilkan himpunan frase yang cocok per
+kategori. Dua semantik dipertahankan persis seperti kode lama:
+
+- substring  : `phrase in text`
+- word       : `re.search(rf'\\b{re.escape(phrase)}\\b', text)`
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+import ahocorasick
+
+SUBSTRING = "substring"
+WORD = "word"
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+def _is_word_char(char: str) -> bool:
+    # Sama dengan \w pada regex str Python (alnum Unicode atau underscore)
+    return char.isalnum() or char == "_"
+
+
+def boundary_pattern_to_phrase(pattern: str) -> str:
+    """
+    Ubah pola booster seperti r'\\bcuan\\s+luber\\b' menjadi frase 'cuan luber'.
+    Valid karena teks sudah dinormalisasi (whitespace selalu satu spasi).
+    """
+    if not (pattern.startswith(r"\b") and pattern.endswith(r"\b")):
+        raise ValueError(f"Pola tidak didukung matcher: {pattern}")
+    phrase = pattern[2:-2].replace(r"\s+", " ")
+    if re.search(r"[\\^$.|?*+()\[\]{}]", phrase):
+        raise ValueError(f"Pola tidak didukung matcher: {pattern}")
+    return phrase
+
+
+class LexiconMatcher:
+    """
+    lexicons: kategori -> (daftar frase, SUBSTRING | WORD).
+    `match(normalized_text)` -> kategori -> frozenset frase yang ditemukan.
+    """
+
+    def __init__(self, lexicons: Dict[str, Tuple[Iterable[str], str]]):
+        self.categories = list(lexicons)
+        owners: Dict[str, List[Tuple[str, bool]]] = {}
+        for category, (phrases, mode) in lexicons.items():
+            if mode not in (SUBSTRING, WORD):
+                raise ValueError(f"Mode tidak dikenal untuk {category}: {mode}")
+            for phrase in phrases:
+                # Kode lama me-lowercase keyword hanya untuk pencocokan regex \b
+                key = phrase.lower() if mode == WORD else phrase
+                owners.setdefault(key, []).append((category, mode == WORD))
+
+        self._automaton = ahocorasick.Automaton()
+        for phrase, phrase_owners in owners.items():
+            needs_boundary = any(word for _, word in phrase_owners)
+            # Sifat \w karakter pertama/terakhir frase sudah pasti: saat match cukup cek tetangganya
+            self._automaton.add_word(phrase, (
+                phrase, tuple(phrase_owners), needs_boundary,
+                len(phrase), _is_word_char(phrase[0]), _is_word_char(phrase[-1]),
+            ))
+        self._automaton.make_automaton()
+
+    def match(self, normalized_text: str) -> Dict[str, FrozenSet[str]]:
+        found: Dict[str, set] = {}
+        text_length = len(normalized_text)
+
+        for end, (phrase, phrase_owners, needs_boundary, length, first_word, last_word) in self._automaton.iter(normalized_text):
+            bounded = False
+            if needs_boundary:
+                start = end - length + 1
+                before = start > 0 and _is_word_char(normalized_text[start - 1])
+                after = end + 1 < text_length and _is_word_char(normalized_text[end + 1])
+                bounded = before != first_word and after != last_word
+
+            for category, word in phrase_owners:
+                if not word or bounded:
+                    found.setdefault(category, set()).add(phrase)
+
+        # Kategori tanpa hit berbagi frozenset kosong yang sama (tidak ada alokasi per teks)
+        result = dict.fromkeys(self.categories, _EMPTY)
+        for category, phrases in found.items():
+            result[category] = frozenset(phrases)
+        return result
@@ -0,0 +1,171 @@
+"""
+Backend inferensi ONNX Runtime (int8) untuk TruthEngineAI.
+
+Model Hugging Face diekspor sekali ke ONNX, lalu dikuantisasi dinamis ke int8
+(`onnxruntime.quantization.quantize_dynamic`). Runtime hanya butuh onnxruntime,
+tokenizers, dan numpy: torch/transformers hanya di-import saat ekspor.
+
+Ekspor manual (sekali, di mesin yang punya torch):
+    python -m src.analysis.onnx_backend --export
+
+Pakai di pipeline:
+    SENTIMENT_BACKEND=onnx python -m src.main
+"""
+
+import argparse
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import onnxruntime as ort
+from tokenizers import Tokenizer
+
+from src.data.local_store import cache_path
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILENAME = "model.int8.onnx"
+LABELS_FILENAME = "labels.json"
+
+
+def default_model_dir(model_name: str) -> Path:
+    """Lokasi model ONNX: ONNX_MODEL_DIR jika di-set, selain itu SENTI_CACHE_DIR/onnx/<model>."""
+    override = os.getenv("ONNX_MODEL_DIR")
+    if override:
+        return Path(override)
+    return cache_path("onnx") / model_name.replace("/", "__")
+
+
+def export_onnx_model(model_name: str, output_dir: Optional[Path] = None, opset: int = 14) -> Path:
+    """Ekspor model HF ke ONNX lalu kuantisasi dinamis int8. Return folder model."""
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    output_dir = Path(output_dir or default_model_dir(model_name))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    logger.info(f"📦 Mengekspor {model_name} ke ONNX ({output_dir})...")
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+
+    dummy = tokenizer(["IHSG ditutup menguat pada perdagangan hari ini"], return_tensors="pt")
+    # Urutan harus sama dengan parameter forward() BERT
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in dummy]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    fp32_path = output_dir / "model.fp32.onnx"
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            ({name: dummy[name] for name in input_names},),
+            str(fp32_path),
+            input_names=input_names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+
+    quantize_dynamic(str(fp32_path), str(output_dir / MODEL_FILENAME), weight_type=QuantType.QInt8)
+    fp32_path.unlink()
+
+    tokenizer.save_pretrained(str(output_dir))
+    id2label = {int(index): label for index, label in model.config.id2label.items()}
+    (output_dir / LABELS_FILENAME).write_text(json.dumps(id2label), encoding="utf-8")
+
+    logger.info(f"✅ Model int8 tersimpan: {output_dir / MODEL_FILENAME}")
+    return output_dir
+
+
+def _pad_token(model_dir: Path) -> str:
+    special_tokens = model_dir / "special_tokens_map.json"
+    if special_tokens.exists():
+        pad = json.loads(special_tokens.read_text(encoding="utf-8")).get("pad_token")
+        if isinstance(pad, dict):
+            pad = pad.get("content")
+        if pad:
+            return pad
+    return "[PAD]"
+
+
+class OnnxSentimentPipeline:
+    """
+    Pengganti `transformers.pipeline("sentiment-analysis")` berbasis ONNX Runtime.
+    Dipanggil dengan satu teks atau list teks, return list {"label", "score"}.
+    """
+
+    def __init__(self, model_dir: Path, max_length: int = 512, intra_op_threads: Optional[int] = None):
+        model_dir = Path(model_dir)
+
+        self.tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_length)
+        pad_token = _pad_token(model_dir)
+        self.tokenizer.enable_padding(pad_id=self.tokenizer.token_to_id(pad_token) or 0, pad_token=pad_token)
+
+        labels = json.loads((model_dir / LABELS_FILENAME).read_text(encoding="utf-8"))
+        self.id2label = {int(index): label for index, label in labels.items()}
+
+        options = ort.SessionOptions()
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = ort.InferenceSession(
+            str(model_dir / MODEL_FILENAME), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        """Panjang token tiap teks tanpa token spesial (untuk windowing kalimat)."""
+        encodings = self.tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [sum(e.attention_mask) for e in encodings]
+
+    def __call__(self, texts: Union[str, List[str]], batch_size: int = 1) -> List[dict]:
+        if isinstance(texts, str):
+            texts = [texts]
+
+        results = []
+        for start in range(0, len(texts), max(1, batch_size)):
+            # Padding dinamis: tiap batch dipad ke teks terpanjang di batch itu saja
+            encodings = self.tokenizer.encode_batch(texts[start:start + batch_size])
+            feeds = {
+                "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+                "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+                "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+            }
+            logits = self.session.run(["logits"], {k: v for k, v in feeds.items() if k in self.input_names})[0]
+
+            # Softmax stabil numerik, sama dengan pipeline HF
+            exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+            probs = exp / exp.sum(axis=1, keepdims=True)
+            for row in probs:
+                best = int(row.argmax())
+                results.append({"label": self.id2label[best], "score": float(row[best])})
+
+        return results
+
+
+def load_onnx_pipeline(model_name: str, model_dir: Optional[Path] = None) -> OnnxSentimentPipeline:
+    """Muat model int8; ekspor dulu jika belum ada (butuh torch sekali saja)."""
+    model_dir = Path(model_dir or default_model_dir(model_name))
+    if not (model_dir / MODEL_FILENAME).exists():
+        logger.warning(f"⚠️ Model ONNX belum ada di {model_dir}, mengekspor dari {model_name}...")
+        export_onnx_model(model_name, model_dir)
+    threads = os.getenv("ONNX_INTRA_OP_THREADS")
+    return OnnxSentimentPipeline(model_dir, intra_op_threads=int(threads) if threads else None)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Ekspor model sentimen ke ONNX int8")
+    parser.add_argument("--export", action="store_true", help="Ekspor (ulang) model ke ONNX int8")
+    parser.add_argument("--model", default="mdhugol/indonesia-bert-sentiment-classification")
+    parser.add_argument("--output-dir", type=Path, default=None)
+    args = parser.parse_args()
+
+    if args.export:
+        export_onnx_model(args.model, args.output_dir)
+    else:
+        parser.print_help()
@@ -1,10 +1,84 @@
+import hashlib
+import json
 import logging
-import torch
+import os
 import re
-from transformers import pipeline
+from typing import List, Optional, Sequence
+
+from src.analysis.cascade import load_cascade
+from src.analysis.inference_cache import InferenceCache, make_cache_key
+from src.analysis.lexicon_matcher import SUBSTRING, WORD, LexiconMatcher, boundary_pattern_to_phrase
+from src.analysis.text_features import TextFeatures
+from src.analysis.windowing import SentenceWindower, TickerMatcher, WindowedText, make_token_counter
 
 logger = logging.getLogger(__name__)
 
+# Standarisasi Label (karena tiap model beda output nama labelnya)
+LABEL_MAP = {
+    "LABEL_0": "NEGATIVE",
+    "LABEL_1": "NEUTRAL",
+    "LABEL_2": "POSITIVE",
+    "negative": "NEGATIVE",
+    "neutral": "NEUTRAL",
+    "positive": "POSITIVE",
+    "label_0": "NEGATIVE",
+    "label_1": "NEUTRAL",
+    "label_2": "POSITIVE"
+}
+
+# Jumlah teks per forward pass transformer di analyze_batch
+DEFAULT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", "16"))
+
+# Kita gunakan pre-trained model Bahasa Indonesia yang solid untuk sentimen
+MODEL_NAME = "mdhugol/indonesia-bert-sentiment-classification"
+
+# Ticker saham (huruf kapital 3-5) dicek pada teks asli, bukan teks ternormalisasi
+_TICKER_RE = re.compile(r'\b[A-Z]{3,5}\b')
+
+# Naikkan setiap kali kamus, heuristik, atau rumus noise berubah: hasil inference cache lama
+# otomatis tidak dipakai lagi (isi kamus di instance juga ikut di-fingerprint)
+LEXICON_VERSION = "1"
+
+# Backend inferensi: "torch" (HF pipeline) atau "onnx" (ONNX Runtime int8, tanpa import torch)
+SENTIMENT_BACKENDS = ("torch", "onnx")
+
+# Input model: "truncate" (512 karakter pertama) atau "window" (kalimat relevan, window per budget token)
+INPUT_MODES = ("truncate", "window")
+
+
+def _weighted_vote(scores: Sequence[tuple]) -> tuple:
+    """
+    Agregasi skor window (label, confidence, token, tickers): label dengan bobot token x confidence
+    terbesar; confidence = bobot label itu / total token (window yang tidak setuju menurunkannya).
+    """
+    if len(scores) == 1:
+        return scores[0][0], scores[0][1]
+    weights: dict = {}
+    total_tokens = 0
+    for label, confidence, tokens, _ in scores:
+        weights[label] = weights.get(label, 0.0) + tokens * confidence
+        total_tokens += tokens
+    label = max(weights, key=weights.get)
+    return label, weights[label] / total_tokens
+
+
+def _load_torch_pipeline(model_name: str):
+    # torch & transformers butuh beberapa detik untuk di-import: hanya dimuat jika backend torch dipakai
+    import torch
+    from transformers import pipeline
+
+    # Deteksi otomatis apakah laptop punya GPU (CUDA/MPS) atau pakai CPU
+    device = 0 if torch.cuda.is_available() else -1
+
+    # Inisialisasi Hugging Face Pipeline
+    return pipeline(
+        "sentiment-analysis", 
+        model=model_name, 
+        tokenizer=model_name,
+        device=device
+    )
+
+
 class TruthEngineAI:
     """
     Core AI Module untuk Senti-Quant.
@@ -12,28 +86,29 @@ class TruthEngineAI:
     dan Kamus Finansial (Financial Dictionary).
     """
     
-    def __init__(self):
-        logger.info("🧠 Memuat model NLP Transformer... (Mungkin butuh waktu beberapa detik)")
-        
-        # Deteksi otomatis apakah laptop punya GPU (CUDA/MPS) atau pakai CPU
-        self.device = 0 if torch.cuda.is_available() else -1
-        
-        # Kita gunakan pre-trained model Bahasa Indonesia yang solid untuk sentimen
-        self.model_name = "mdhugol/indonesia-bert-sentiment-classification"
-        
-        try:
-            # Inisialisasi Hugging Face Pipeline
-            self.nlp_pipeline = pipeline(
-                "sentiment-analysis", 
-                model=self.model_name, 
-                tokenizer=self.model_name,
-                device=self.device
-            )
-            logger.info("✅ Model NLP berhasil dimuat ke memori!")
-        except Exception as e:
-            logger.error(f"❌ Gagal memuat model: {e}")
-            raise e
-            
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        backend: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        load_model: bool = True,
+        use_cascade: Optional[bool] = None,
+        input_mode: Optional[str] = None,
+        pool_workers: Optional[int] = None,
+        pool_threads: Optional[int] = None,
+    ):
+        self.batch_size = batch_size or DEFAULT_BATCH_SIZE
+        self.backend = (backend or os.getenv("SENTIMENT_BACKEND", "torch")).lower()
+        if self.backend not in SENTIMENT_BACKENDS:
+            raise ValueError(f"SENTIMENT_BACKEND tidak dikenal: {self.backend} (pilihan: {', '.join(SENTIMENT_BACKENDS)})")
+
+        self.model_name = MODEL_NAME
+        self.nlp_pipeline = None
+
+        # load_model=False: hanya lapisan heuristik (benchmark / tooling tanpa model)
+        if load_model:
+            self._load_model()
+
         # --- KAMUS SAHAM (FINANCIAL HEURISTICS) ---
         # Kata kunci yang memaksa AI untuk mengubah sentimen
         self.positive_keywords = [
@@ -102,195 +177,626 @@ class TruthEngineAI:
             r'\bto\s+the\s+moon\b'
         ]
 
-    def _normalize_text(self, text: str) -> str:
-        return re.sub(r'\s+', ' ', text.lower()).strip()
+        self.absolute_negative_phrases = [
+            'laba turun', 'rugi naik', 'penurunan laba', 'pemangkasan dividen',
+            'kinerja memburuk', 'ditekan', 'tekanan jual', 'gagal bayar',
+            'kerugian', 'kerugian kuartal', 'phk', 'phk massal', 'pemutusan hubungan kerja',
+            'pemutusan kerja', 'pengurangan karyawan', 'pemangkasan', 'anjlok'
+        ]
+
+        # Kata klaim berlebihan (bagian dari noise score)
+        self.hype_claim_words = ['pasti', 'jamin', 'dijamin', 'terbukti', 'auto', 'mustahil rugi']
+
+        # Semua kamus di atas dikompilasi sekali ke satu automaton Aho-Corasick
+        self.build_lexicon_matcher()
+
+        # --- INPUT WINDOWING (opsional): kalimat relevan dikemas per budget token ---
+        self.input_mode = (input_mode or os.getenv("SENTIMENT_INPUT_MODE", "truncate")).lower()
+        if self.input_mode not in INPUT_MODES:
+            raise ValueError(f"SENTIMENT_INPUT_MODE tidak dikenal: {self.input_mode} (pilihan: {', '.join(INPUT_MODES)})")
+        self.windower = self._build_windower() if self.input_mode == "window" else None
+
+        # --- CASCADE: model linear kecil sebelum Indo-BERT (opsional, butuh model hasil training) ---
+        if use_cascade is None:
+            use_cascade = os.getenv("CASCADE_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.cascade = load_cascade() if use_cascade and load_model else None
+
+        # --- INFERENCE CACHE (memoization per teks) ---
+        if use_cache is None:
+            use_cache = os.getenv("INFERENCE_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.model_version = f"{self.model_name}:{self.backend}"
+        if self.windower is not None:
+            self.model_version += f"+window:{self.windower.max_tokens}x{self.windower.max_windows}"
+        if self.cascade is not None:
+            # Model/threshold cascade lain -> hasil lain: cache lama tidak dipakai
+            self.model_version += f"+cascade:{self.cascade.version}@{self.cascade.threshold}"
+        self.lexicon_version = f"{LEXICON_VERSION}-{self._lexicon_fingerprint()}"
+        self.inference_cache = (
+            InferenceCache(max_memory_items=int(os.getenv("INFERENCE_CACHE_SIZE", "10000")))
+            if use_cache else None
+        )
+
+        # --- INFERENCE POOL (opsional, multi-core) ---
+        # Dibuat paling akhir: worker di-fork dari induk yang sudah memuat model
+        if pool_workers is None:
+            pool_workers = int(os.getenv("SENTIMENT_POOL_WORKERS", "0"))
+        if pool_threads is None and os.getenv("SENTIMENT_POOL_THREADS"):
+            pool_threads = int(os.getenv("SENTIMENT_POOL_THREADS"))
+        self.inference_pool = None
+        if load_model and pool_workers > 0:
+            if self.backend == "torch":
+                from src.analysis.inference_pool import InferencePool
+                self.inference_pool = InferencePool(self.nlp_pipeline, pool_workers, pool_threads)
+            else:
+                logger.warning("⚠️ SENTIMENT_POOL_WORKERS hanya untuk backend torch, diabaikan untuk onnx.")
+
+    def _load_model(self):
+        logger.info(f"🧠 Memuat model NLP Transformer ({self.backend})... (Mungkin butuh waktu beberapa detik)")
+        try:
+            if self.backend == "onnx":
+                from src.analysis.onnx_backend import load_onnx_pipeline
+                self.nlp_pipeline = load_onnx_pipeline(self.model_name)
+            else:
+                self.nlp_pipeline = _load_torch_pipeline(self.model_name)
+            logger.info("✅ Model NLP berhasil dimuat ke memori!")
+        except Exception as e:
+            logger.error(f"❌ Gagal memuat model: {e}")
+            raise e
+
+    def build_lexicon_matcher(self) -> None:
+        """(Re)kompilasi kamus ke automaton. Panggil ulang jika list kamus diubah setelah init."""
+        lexicons = {
+            "positive": (self.positive_keywords, SUBSTRING),
+            "negative": (self.negative_keywords, SUBSTRING),
+            "context": (self.financial_context_keywords, SUBSTRING),
+            "absolute_positive": (self.absolute_positive_phrases, SUBSTRING),
+            "absolute_negative": (self.absolute_negative_phrases, SUBSTRING),
+            "pom_pom": (self.pom_pom_noise_phrases, SUBSTRING),
+            "booster": ([boundary_pattern_to_phrase(p) for p in self.noise_booster_patterns], WORD),
+            "hype_claim": (self.hype_claim_words, WORD),
+        }
+        for sector, keywords in self.sectoral_keywords.items():
+            lexicons[f"sector:{sector}"] = (keywords, WORD)
+
+        self._lexicon_matcher = LexiconMatcher(lexicons)
+        # (sektor, kategori automaton, keyword lowercase) supaya extract_features tidak membangun string per teks
+        self._sector_lookup = [
+            (sector, f"sector:{sector}", [keyword.lower() for keyword in keywords])
+            for sector, keywords in self.sectoral_keywords.items()
+        ]
+        self._last_features = None
+
+    def extract_features(self, text: str) -> TextFeatures:
+        """
+        Hitung semua fitur heuristik teks dalam satu langkah: satu normalisasi, satu pass
+        automaton, satu scan huruf kapital. Hasil untuk teks terakhir di-memo, jadi semua
+        tahap keputusan (dan pemanggil luar seperti dashboard) berbagi record yang sama.
+        """
+        last = self._last_features
+        if last is not None and text == last[0]:
+            return last[1]
 
-    def _count_sector_matches(self, text: str) -> tuple[int, dict[str, int]]:
         normalized_text = self._normalize_text(text)
+        hits = self._lexicon_matcher.match(normalized_text)
+
         sector_hits: dict[str, int] = {}
-        total_hits = 0
+        sector_total = 0
+        for sector, category, keywords in self._sector_lookup:
+            matched = hits[category]
+            if not matched:
+                continue
+            sector_count = sum(1 for keyword in keywords if keyword in matched)
+            if sector_count:
+                sector_hits[sector] = sector_count
+                sector_total += sector_count
 
-        for sector, keywords in self.sectoral_keywords.items():
-            hits = 0
-            for keyword in keywords:
-                keyword_norm = keyword.lower()
-                pattern = rf'\b{re.escape(keyword_norm)}\b'
+        context = hits["context"]
+        context_hits = sum(1 for word in self.financial_context_keywords if word in context) if context else 0
+
+        if hits["positive"]:
+            dictionary_label = "POSITIVE"
+        elif hits["negative"]:
+            dictionary_label = "NEGATIVE"
+        else:
+            dictionary_label = None
+
+        length = len(text)
+        features = TextFeatures(
+            normalized=normalized_text,
+            length=length,
+            sector_hits=sector_hits,
+            sector_total=sector_total,
+            context_hits=context_hits,
+            has_absolute_positive=bool(hits["absolute_positive"]),
+            has_absolute_negative=bool(hits["absolute_negative"]),
+            dictionary_label=dictionary_label,
+            has_ticker=_TICKER_RE.search(text) is not None,
+            upper_ratio=sum(map(str.isupper, text)) / length if length else 0,
+            exclamation_count=text.count('!'),
+            has_pom_pom=bool(hits["pom_pom"]),
+            booster_hits=len(hits["booster"]),
+            has_hype_claim=bool(hits["hype_claim"]),
+        )
+        self._last_features = (text, features)
+        return features
+
+    def extract_features_batch(self, texts: Sequence[str]) -> List[TextFeatures]:
+        """Fitur untuk banyak teks, dihitung dari input yang sama dengan analyze (_prepare_input)."""
+        return [self.extract_features(self._prepare_input(text)[0]) for text in texts]
+
+    def _build_windower(self) -> SentenceWindower:
+        from src.analysis.emiten_mapping import get_emiten_mapping
 
-                if re.search(pattern, normalized_text):
-                    hits += 1
+        def _is_context(sentence: str) -> bool:
+            features = self.extract_features(sentence)
+            return bool(features.context_hits or features.sector_total)
 
-            if hits:
-                sector_hits[sector] = hits
-                total_hits += hits
+        return SentenceWindower(
+            token_counter=make_token_counter(self.nlp_pipeline),
+            is_context=_is_context,
+            ticker_matcher=TickerMatcher(get_emiten_mapping()),
+            max_tokens=int(os.getenv("SENTIMENT_WINDOW_TOKENS", "510")),
+            max_windows=int(os.getenv("SENTIMENT_MAX_WINDOWS", "4")),
+        )
 
-        return total_hits, sector_hits
+    def _prepare_input(self, text: str) -> tuple:
+        """
+        (teks untuk cache key / heuristik / cascade, WindowedText atau None).
+        Mode truncate, atau tanpa kalimat relevan: 512 karakter pertama seperti biasa.
+        """
+        if self.windower is not None:
+            windowed = self.windower.build(text)
+            if windowed is not None:
+                return windowed.text, windowed
+        return text[:512], None
+
+    def _lexicon_fingerprint(self) -> str:
+        lexicons = repr((
+            self.positive_keywords, self.negative_keywords, self.sectoral_keywords,
+            self.financial_context_keywords, self.absolute_positive_phrases,
+            self.absolute_negative_phrases, self.pom_pom_noise_phrases,
+            self.noise_booster_patterns, self.hype_claim_words,
+        ))
+        return hashlib.blake2b(lexicons.encode("utf-8"), digest_size=6).hexdigest()
+
+    def _normalize_text(self, text: str) -> str:
+        return re.sub(r'\s+', ' ', text.lower()).strip()
+
+    # Helper lama berbasis teks: sekarang hanya membaca TextFeatures (dipakai benchmark & skrip lama)
+
+    def _count_sector_matches(self, text: str) -> tuple[int, dict[str, int]]:
+        features = self.extract_features(text)
+        return features.sector_total, dict(features.sector_hits)
 
     def _has_absolute_positive_signal(self, text: str) -> bool:
-        normalized_text = self._normalize_text(text)
-        return any(phrase in normalized_text for phrase in self.absolute_positive_phrases)
+        return self.extract_features(text).has_absolute_positive
 
     def _has_absolute_negative_signal(self, text: str) -> bool:
-        normalized_text = self._normalize_text(text)
-        negative_signals = [
-            'laba turun', 'rugi naik', 'penurunan laba', 'pemangkasan dividen',
-            'kinerja memburuk', 'ditekan', 'tekanan jual', 'gagal bayar',
-            'kerugian', 'kerugian kuartal', 'phk', 'phk massal', 'pemutusan hubungan kerja',
-            'pemutusan kerja', 'pengurangan karyawan', 'pemangkasan', 'anjlok'
-        ]
-        return any(phrase in normalized_text for phrase in negative_signals)
+        return self.extract_features(text).has_absolute_negative
 
     def _check_financial_dictionary(self, text: str) -> str:
         """Mengecek apakah ada kata kunci saham yang sangat kuat di dalam teks."""
-        text_lower = self._normalize_text(text)
-        
-        # Cek kata positif dulu
-        if any(word in text_lower for word in self.positive_keywords):
-            return "POSITIVE"
-            
-        # Cek kata negatif
-        if any(word in text_lower for word in self.negative_keywords):
-            return "NEGATIVE"
-            
-        # Kalau tidak ada kata kunci sakti, kembalikan None (Biar AI BERT yang mikir)
-        return None
-    
+        # Kalau tidak ada kata kunci sakti, None (Biar AI BERT yang mikir)
+        return self.extract_features(text).dictionary_label
+
     def _is_financial_news(self, text: str) -> bool:
         """Memeriksa apakah artikel benar-benar membahas keuangan/saham."""
-        text_lower = self._normalize_text(text)
-        sector_hits, _ = self._count_sector_matches(text_lower)
-        context_hits = sum(1 for word in self.financial_context_keywords if word in text_lower)
+        return self._is_financial(self.extract_features(text))
+
+    def _calculate_noise_probability(self, text: str) -> float:
+        return self._noise_from_features(self.extract_features(text))
 
-        if sector_hits >= 2:
+    def _is_financial(self, features: TextFeatures) -> bool:
+        if features.sector_total >= 2:
             return True
 
-        if sector_hits >= 1 and context_hits >= 1:
+        if features.sector_total >= 1 and features.context_hits >= 1:
             return True
 
-        if self._has_absolute_positive_signal(text_lower):
+        if features.has_absolute_positive:
             return True
 
-        if self._has_absolute_negative_signal(text_lower):
+        if features.has_absolute_negative:
             return True
 
-        ticker_pattern = r'\b[A-Z]{3,5}\b'
-        if re.search(ticker_pattern, text):
+        if features.has_ticker:
             return True
 
         return False
-    
-    def _calculate_noise_probability(self, text: str) -> float:
+
+    def _noise_from_features(self, features: TextFeatures) -> float:
         """
         [Inovasi Senti-Quant] - De-noising Logic.
         Menghitung seberapa 'clickbait' atau manipulatif teks tersebut.
         Versi ini menambahkan deteksi pom-pom saham dan superlatif kosong.
         """
-        if not text:
+        if not features.length:
             return 1.0  # 100% noise kalau kosong
 
-        normalized_text = self._normalize_text(text)
-            
-        # Hitung persentase huruf kapital
-        uppercase_count = sum(1 for c in text if c.isupper())
-        upper_ratio = uppercase_count / len(text) if len(text) > 0 else 0
-        
-        # Hitung jumlah tanda seru (biasanya dipakai untuk pump & dump / FOMO)
-        exclamation_count = len(re.findall(r'!', text))
-        
         noise_score = 0.0
-        
+
         # Logika Kritis (Creativity + Logic = Innovation)
-        if upper_ratio > 0.15:  # Jika lebih dari 15% teks adalah huruf besar
+        if features.upper_ratio > 0.15:  # Jika lebih dari 15% teks adalah huruf besar
             noise_score += 0.4
-        if exclamation_count > 3:  # Terlalu banyak tanda seru
+        if features.exclamation_count > 3:  # Terlalu banyak tanda seru (pump & dump / FOMO)
             noise_score += 0.3
 
-        if any(phrase in normalized_text for phrase in self.pom_pom_noise_phrases):
+        if features.has_pom_pom:
             noise_score += 0.35
 
-        booster_hits = sum(1 for pattern in self.noise_booster_patterns if re.search(pattern, normalized_text))
-        if booster_hits:
-            noise_score += min(0.25 * booster_hits, 0.5)
+        if features.booster_hits:
+            noise_score += min(0.25 * features.booster_hits, 0.5)
 
-        if re.search(r'\b(pasti|jamin|dijamin|terbukti|auto|mustahil rugi)\b', normalized_text):
+        if features.has_hype_claim:
             noise_score += 0.2
-            
+
         # Batasi maksimal 1.0 (100%)
         return min(noise_score, 1.0)
 
-    def analyze(self, text: str, source_credibility: float = 0.5) -> dict:
-        """
-        Menganalisis teks dan mengembalikan Sentiment + Integrity Score.
-        
-        Args:
-            text: Konten artikel yang akan dianalisis
-            source_credibility: Kredibilitas sumber (0.0 - 1.0), default 0.5
-        
-        Returns:
-            Dict dengan sentiment_label, confidence, integrity_score, dll
-        """
-        # Truncate teks ke 512 karakter pertama (batasan token BERT) agar cepat dan tidak crash
-        safe_text = text[:512]
-        
-        # 0. GATEKEEPER: Buang berita non-finansial
-        if not self._is_financial_news(safe_text):
-            return {
-                "sentiment_label": "IRRELEVANT",
-                "confidence": 0.0,
-                "noise_probability": 1.0,
-                "source_credibility": source_credibility,
-                "integrity_score": 0.0
-            }
-        
+    def _irrelevant_result(self, source_credibility: float, label_source: str = "gatekeeper") -> dict:
+        return {
+            "sentiment_label": "IRRELEVANT",
+            "confidence": 0.0,
+            "noise_probability": 1.0,
+            "source_credibility": source_credibility,
+            "integrity_score": 0.0,
+            "label_source": label_source,
+        }
+
+    def _heuristic_label(self, features: TextFeatures) -> Optional[tuple]:
+        """Label dari frase absolut / kamus saham, atau None jika harus diputuskan Indo-BERT."""
         # 1. CEK FRASE POSITIF ABSOLUT TERLEBIH DAHULU (Bypass AI jika ketemu)
-        if self._has_absolute_positive_signal(safe_text):
-            std_label = "POSITIVE"
-            confidence = 0.98
+        if features.has_absolute_positive:
             logger.info("💡 Absolute positive financial signal terdeteksi, bypass Indo-BERT.")
+            return "POSITIVE", 0.98
+
+        # 2. CEK KAMUS SAHAM TERLEBIH DAHULU (Bypass AI jika ketemu)
+        heuristic_label = features.dictionary_label
+        if heuristic_label:
+            logger.info(f"💡 Heuristik Terdeteksi! Kata kunci memicu sentimen: {heuristic_label}")
+            return heuristic_label, 0.95
+
+        return None
+
+    def _apply_cascade(
+        self,
+        indices: List[int],
+        safe_texts: Sequence[str],
+        features: dict,
+        credibilities: Sequence[float],
+        results: List[Optional[dict]],
+        windowed: Sequence[Optional[WindowedText]],
+    ) -> tuple:
+        """
+        Tier cascade: isi `results` untuk teks yang dijawab yakin oleh model linear.
+        Return (indeks yang tetap ke Indo-BERT, tebakan cascade untuk indeks itu -> metrik agreement).
+        """
+        if self.cascade is None or not indices:
+            return indices, {}
+
+        remaining, guesses = [], {}
+        decisions = self.cascade.decide([safe_texts[index] for index in indices])
+        for index, decision in zip(indices, decisions):
+            if decision.confident and not self.cascade.sample_shadow():
+                results[index] = self._build_result(
+                    features[index], decision.label, decision.confidence, credibilities[index], "cascade",
+                    self._uniform_ticker_sentiment(windowed[index], decision.label, decision.confidence),
+                )
+            else:
+                remaining.append(index)
+                guesses[index] = decision
+        return remaining, guesses
+
+    def _record_cascade_agreement(self, guesses: dict, index: int, model_label: str) -> None:
+        decision = guesses.get(index)
+        if decision is None:
+            return
+        if decision.confident:
+            self.cascade.record_shadow(decision.label, model_label)
         else:
-            # 2. CEK KAMUS SAHAM TERLEBIH DAHULU (Bypass AI jika ketemu)
-            heuristic_label = self._check_financial_dictionary(safe_text)
+            self.cascade.record_fallthrough(decision.label, model_label)
+
+    def _uniform_ticker_sentiment(self, windowed: Optional[WindowedText], label: str, confidence: float):
+        # Jawaban heuristik/cascade berlaku untuk seluruh artikel: semua ticker dapat label yang sama
+        if windowed is None or not windowed.tickers:
+            return None
+        return {
+            ticker: {"sentiment_label": label, "confidence": confidence, "windows": 0}
+            for ticker in sorted(windowed.tickers)
+        }
 
-            if heuristic_label:
-                std_label = heuristic_label
-                confidence = 0.95
-                logger.info(f"💡 Heuristik Terdeteksi! Kata kunci memicu sentimen: {std_label}")
+    def _model_predictions(
+        self,
+        indices: List[int],
+        safe_texts: Sequence[str],
+        windowed: Sequence[Optional[WindowedText]],
+        batch_size: int,
+    ) -> dict:
+        """
+        Jalankan Indo-BERT untuk semua input (teks 512 karakter atau window) dari `indices` dalam
+        satu batch yang diurutkan panjangnya. Return index -> (label, confidence, ticker_sentiment).
+        """
+        inputs = []
+        for index in indices:
+            if windowed[index] is None:
+                inputs.append((index, safe_texts[index], 1, frozenset()))
             else:
-                # 3. JIKA TIDAK ADA DI KAMUS, BIARKAN AI BERT BEKERJA
-                ai_result = self.nlp_pipeline(safe_text)[0]
-                raw_label = ai_result['label']
-                confidence = ai_result['score']
-
-                # Standarisasi Label (karena tiap model beda output nama labelnya)
-                label_map = {
-                    "LABEL_0": "NEGATIVE",
-                    "LABEL_1": "NEUTRAL",
-                    "LABEL_2": "POSITIVE",
-                    "negative": "NEGATIVE",
-                    "neutral": "NEUTRAL",
-                    "positive": "POSITIVE",
-                    "label_0": "NEGATIVE",
-                    "label_1": "NEUTRAL",
-                    "label_2": "POSITIVE"
-                }
-                std_label = label_map.get(raw_label, raw_label.upper())
-
-        # 3. Hitung Truth Metrics (Inovasi kita)
-        noise_prob = self._calculate_noise_probability(safe_text)
-        
+                inputs.extend((index, window.text, window.tokens, window.tickers) for window in windowed[index].windows)
+        inputs.sort(key=lambda item: len(item[1]))
+
+        if len(inputs) != len(indices):
+            logger.info(f"🪟 Window kalimat: {len(inputs)} input Indo-BERT untuk {len(indices)} teks.")
+        outputs = self._run_model([item[1] for item in inputs], batch_size)
+
+        scores: dict = {}
+        for (index, _, tokens, tickers), ai_result in zip(inputs, outputs):
+            std_label, confidence = self._standardize_model_output(ai_result)
+            scores.setdefault(index, []).append((std_label, confidence, max(1, tokens), tickers))
+
+        predictions = {}
+        for index, window_scores in scores.items():
+            std_label, confidence = _weighted_vote(window_scores)
+            ticker_sentiment = None
+            if windowed[index] is not None and windowed[index].tickers:
+                ticker_sentiment = {}
+                for ticker in sorted(windowed[index].tickers):
+                    ticker_scores = [score for score in window_scores if ticker in score[3]]
+                    ticker_label, ticker_confidence = _weighted_vote(ticker_scores)
+                    ticker_sentiment[ticker] = {
+                        "sentiment_label": ticker_label,
+                        "confidence": ticker_confidence,
+                        "windows": len(ticker_scores),
+                    }
+            predictions[index] = (std_label, confidence, ticker_sentiment)
+        return predictions
+
+    def _run_model(self, texts: List[str], batch_size: int) -> List[dict]:
+        """Forward pass Indo-BERT: dibagi ke inference pool jika aktif, selain itu in-process."""
+        if self.inference_pool is not None:
+            return self.inference_pool.run(texts, batch_size)
+        return self.nlp_pipeline(texts, batch_size=batch_size)
+
+    def stats(self) -> dict:
+        """Ringkasan inference cache & cascade (None jika nonaktif) untuk logging metrik pipeline."""
+        return {
+            "inference_cache": self.inference_cache.summary() if self.inference_cache is not None else None,
+            "cascade": self.cascade.summary() if self.cascade is not None else None,
+        }
+
+    def close(self) -> None:
+        """Hentikan worker inference pool (jika ada)."""
+        if self.inference_pool is not None:
+            self.inference_pool.close()
+            self.inference_pool = None
+
+    def _standardize_model_output(self, ai_result: dict) -> tuple:
+        raw_label = ai_result['label']
+        return LABEL_MAP.get(raw_label, raw_label.upper()), ai_result['score']
+
+    def _build_result(
+        self,
+        features: TextFeatures,
+        std_label: str,
+        confidence: float,
+        source_credibility: float,
+        label_source: str,
+        ticker_sentiment: Optional[dict] = None,
+    ) -> dict:
+        # Hitung Truth Metrics (Inovasi kita)
+        noise_prob = self._noise_from_features(features)
+        return self._result_with_credibility(
+            std_label, confidence, noise_prob, source_credibility, label_source, ticker_sentiment
+        )
+
+    def _result_with_credibility(
+        self,
+        std_label: str,
+        confidence: float,
+        noise_prob: float,
+        source_credibility: float,
+        label_source: str,
+        ticker_sentiment: Optional[dict] = None,
+    ) -> dict:
         # Konversi sentimen ke skalar untuk perhitungan (-1, 0, 1)
         scalar_map = {"NEGATIVE": -1, "NEUTRAL": 0, "POSITIVE": 1}
         s_value = scalar_map.get(std_label, 0)
         
-        # 4. Rumus Truth Engine Lengkap: Si × Ci × (1 - Ni)
+        # Rumus Truth Engine Lengkap: Si × Ci × (1 - Ni)
         # Si = Sentiment Score
         # Ci = Source Credibility
         # Ni = Noise Probability
         integrity_score = s_value * source_credibility * (1.0 - noise_prob)
 
-        return {
+        result = {
             "sentiment_label": std_label,
             "confidence": confidence,
             "noise_probability": noise_prob,
             "source_credibility": source_credibility,
-            "integrity_score": integrity_score
-        }
\ No newline at end of file
+            "integrity_score": integrity_score,
+            # heuristic | cascade | model | gatekeeper (training cascade hanya memakai "model");
+            # hasil cache membawa label_source aslinya
+            "label_source": label_source,
+        }
+        if ticker_sentiment:
+            # Mode window: sentimen per ticker dari window yang menyebut ticker tersebut
+            result["ticker_sentiment"] = ticker_sentiment
+        return result
+
+    def _cache_key(self, safe_text: str) -> str:
+        return make_cache_key(safe_text, self.model_version, self.lexicon_version)
+
+    def _from_cache(self, cached: tuple, source_credibility: float) -> dict:
+        # Label, confidence, noise dari cache; integrity_score dihitung ulang untuk sumber ini
+        std_label, confidence, noise_prob, extra = cached
+        payload = json.loads(extra)
+        # Asal label asli (model/heuristic/...) dipertahankan supaya distilasi cascade tidak kehilangan
+        # label Indo-BERT yang datang dari cache
+        label_source = payload["label_source"]
+
+        if std_label == "IRRELEVANT":
+            result = self._irrelevant_result(source_credibility, label_source)
+        else:
+            result = self._result_with_credibility(
+                std_label, confidence, noise_prob, source_credibility, label_source,
+                payload.get("ticker_sentiment"),
+            )
+        result["cache_hit"] = True
+        return result
+
+    def _cache_value(self, result: dict) -> tuple:
+        payload = {"label_source": result.get("label_source")}
+        if result.get("ticker_sentiment"):
+            payload["ticker_sentiment"] = result["ticker_sentiment"]
+        return (
+            result["sentiment_label"], result["confidence"], result["noise_probability"],
+            json.dumps(payload, ensure_ascii=False),
+        )
+
+    def _remember(self, key: str, result: dict) -> None:
+        self.inference_cache.put(key, self._cache_value(result))
+
+    def analyze(self, text: str, source_credibility: float = 0.5) -> dict:
+        """
+        Menganalisis teks dan mengembalikan Sentiment + Integrity Score.
+        
+        Args:
+            text: Konten artikel yang akan dianalisis
+            source_credibility: Kredibilitas sumber (0.0 - 1.0), default 0.5
+        
+        Returns:
+            Dict dengan sentiment_label, confidence, integrity_score, dll
+        """
+        # Truncate teks ke 512 karakter pertama (batasan token BERT) agar cepat dan tidak crash,
+        # atau (mode window) hanya kalimat relevan yang dikemas per budget token
+        safe_text, windowed = self._prepare_input(text)
+
+        cache_key = None
+        if self.inference_cache is not None:
+            cache_key = self._cache_key(safe_text)
+            cached = self.inference_cache.get(cache_key)
+            if cached:
+                return self._from_cache(cached, source_credibility)
+
+        result = self._analyze_uncached(safe_text, source_credibility, windowed)
+
+        if cache_key:
+            self._remember(cache_key, result)
+            self.inference_cache.flush()
+        return result
+
+    def _analyze_uncached(
+        self, safe_text: str, source_credibility: float, windowed: Optional[WindowedText] = None
+    ) -> dict:
+        features = self.extract_features(safe_text)
+
+        # 0. GATEKEEPER: Buang berita non-finansial
+        if not self._is_financial(features):
+            return self._irrelevant_result(source_credibility)
+        
+        heuristic = self._heuristic_label(features)
+        if heuristic:
+            return self._build_result(
+                features, *heuristic, source_credibility, "heuristic",
+                self._uniform_ticker_sentiment(windowed, *heuristic),
+            )
+
+        # 3. MODEL LINEAR CASCADE: jawab langsung jika yakin
+        results: List[Optional[dict]] = [None]
+        remaining, guesses = self._apply_cascade(
+            [0], [safe_text], {0: features}, [source_credibility], results, [windowed]
+        )
+        if not remaining:
+            return results[0]
+
+        # 4. SISANYA (TIDAK ADA DI KAMUS, CASCADE RAGU), BIARKAN AI BERT BEKERJA
+        std_label, confidence, ticker_sentiment = self._model_predictions(
+            [0], [safe_text], [windowed], self.batch_size
+        )[0]
+        self._record_cascade_agreement(guesses, 0, std_label)
+        return self._build_result(features, std_label, confidence, source_credibility, "model", ticker_sentiment)
+
+    def analyze_batch(
+        self,
+        texts: Sequence[str],
+        credibilities: Optional[Sequence[float]] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Versi batch dari `analyze` dengan hasil yang sama per teks.
+
+        Teks yang sudah ada di inference cache tidak dianalisis ulang, dan teks identik
+        di dalam batch hanya dianalisis sekali. Gatekeeper, heuristik, lalu cascade linear
+        dijalankan dulu; hanya teks sisanya yang masuk Indo-BERT, diurutkan berdasarkan panjang supaya
+        setiap batch berisi teks yang mirip panjangnya (padding dinamis per batch jadi minimal).
+        """
+        if credibilities is None:
+            credibilities = [0.5] * len(texts)
+        batch_size = batch_size or self.batch_size
+
+        prepared = [self._prepare_input(text) for text in texts]
+        safe_texts = [safe_text for safe_text, _ in prepared]
+        windowed = [windowed_text for _, windowed_text in prepared]
+        results: List[Optional[dict]] = [None] * len(texts)
+
+        cache_keys = None
+        if self.inference_cache is not None:
+            cache_keys = [self._cache_key(safe_text) for safe_text in safe_texts]
+            cached = self.inference_cache.get_many(cache_keys)
+            for index, key in enumerate(cache_keys):
+                if key in cached:
+                    results[index] = self._from_cache(cached[key], credibilities[index])
+
+        # Satu wakil per teks unik yang belum punya hasil
+        representative = {}
+        for index, safe_text in enumerate(safe_texts):
+            if results[index] is None:
+                representative.setdefault(safe_text, index)
+
+        features = {}
+        model_queue = []
+        for index in representative.values():
+            features[index] = text_features = self.extract_features(safe_texts[index])
+
+            if not self._is_financial(text_features):
+                results[index] = self._irrelevant_result(credibilities[index])
+                continue
+
+            heuristic = self._heuristic_label(text_features)
+            if heuristic:
+                results[index] = self._build_result(
+                    text_features, *heuristic, credibilities[index], "heuristic",
+                    self._uniform_ticker_sentiment(windowed[index], *heuristic),
+                )
+            else:
+                model_queue.append(index)
+
+        model_queue, guesses = self._apply_cascade(
+            model_queue, safe_texts, features, credibilities, results, windowed
+        )
+
+        if model_queue:
+            logger.info(
+                f"🧮 Indo-BERT batch: {len(model_queue)}/{len(texts)} teks "
+                f"(batch_size={batch_size}), sisanya selesai lewat cache/heuristik/cascade."
+            )
+            predictions = self._model_predictions(model_queue, safe_texts, windowed, batch_size)
+
+            for index in model_queue:
+                std_label, confidence, ticker_sentiment = predictions[index]
+                self._record_cascade_agreement(guesses, index, std_label)
+                results[index] = self._build_result(
+                    features[index], std_label, confidence, credibilities[index], "model", ticker_sentiment
+                )
+
+        # Salinan teks identik: hasil wakilnya, dengan integrity_score untuk sumbernya sendiri
+        for index, safe_text in enumerate(safe_texts):
+            if results[index] is None:
+                source = results[representative[safe_text]]
+                results[index] = self._from_cache(self._cache_value(source), credibilities[index])
+
+        if cache_keys is not None:
+            for index in representative.values():
+                self._remember(cache_keys[index], results[index])
+            self.inference_cache.flush()
+
+        return results
@@ -0,0 +1,69 @@
+"""
+Record fitur heuristik per teks.
+
+Dihitung sekali oleh `TruthEngineAI.extract_features` (satu normalisasi, satu pass
+Aho-Corasick, satu scan karakter) lalu dibaca oleh semua tahap keputusan:
+gatekeeper, label heuristik, dan noise probability. Pemanggil lain (batch, dashboard)
+bisa memakai record yang sama tanpa menganalisis ulang.
+"""
+
+from typing import Dict, Optional
+
+
+class TextFeatures:
+    __slots__ = (
+        "normalized",
+        "length",
+        "sector_hits",
+        "sector_total",
+        "context_hits",
+        "has_absolute_positive",
+        "has_absolute_negative",
+        "dictionary_label",
+        "has_ticker",
+        "upper_ratio",
+        "exclamation_count",
+        "has_pom_pom",
+        "booster_hits",
+        "has_hype_claim",
+    )
+
+    def __init__(
+        self,
+        normalized: str,
+        length: int,
+        sector_hits: Dict[str, int],
+        sector_total: int,
+        context_hits: int,
+        has_absolute_positive: bool,
+        has_absolute_negative: bool,
+        dictionary_label: Optional[str],
+        has_ticker: bool,
+        upper_ratio: float,
+        exclamation_count: int,
+        has_pom_pom: bool,
+        booster_hits: int,
+        has_hype_claim: bool,
+    ):
+        self.normalized = normalized
+        self.length = length
+        self.sector_hits = sector_hits
+        self.sector_total = sector_total
+        self.context_hits = context_hits
+        self.has_absolute_positive = has_absolute_positive
+        self.has_absolute_negative = has_absolute_negative
+        self.dictionary_label = dictionary_label
+        self.has_ticker = has_ticker
+        self.upper_ratio = upper_ratio
+        self.exclamation_count = exclamation_count
+        self.has_pom_pom = has_pom_pom
+        self.booster_hits = booster_hits
+        self.has_hype_claim = has_hype_claim
+
+    def as_dict(self) -> dict:
+        """Untuk logging / dashboard (tanpa teks ternormalisasi)."""
+        return {name: getattr(self, name) for name in self.__slots__ if name != "normalized"}
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.as_dict().items())
+        return f"TextFeatures({fields})"
@@ -0,0 +1,186 @@
+"""
+Windowing kalimat sadar-ticker untuk input Indo-BERT (SENTIMENT_INPUT_MODE=window).
+
+Mode default memotong konten ke 512 karakter pertama: untuk full-body artikel itu
+sering berisi boilerplate, atau justru melewatkan kalimat yang menyebut emiten.
+Mode window:
+
+1. pecah konten jadi kalimat (singkatan umum seperti "PT." / "Tbk." / "Rp." tidak memecah)
+2. simpan hanya kalimat yang menyebut ticker, nama emiten, atau kata konteks finansial
+3. kelompokkan per ticker (kalimat tanpa ticker satu grup, kalimat multi-ticker satu grup)
+4. kemas tiap grup ke window dengan budget token dari tokenizer model (bukan karakter);
+   kalimat yang sendirian melebihi budget dipecah dulu, jadi tokenizer tidak pernah memotong window
+
+Skor per window lalu diagregasi di TruthEngineAI menjadi sentimen artikel dan per ticker.
+"""
+
+import re
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple
+
+from src.analysis.lexicon_matcher import WORD, LexiconMatcher
+
+# Batas kalimat: tanda akhir + spasi + awal kalimat baru, atau baris baru
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+(?=["“‘(\[]?[A-Z0-9])|\s*\n+\s*')
+
+# Token (lowercase) yang diakhiri titik tapi bukan akhir kalimat
+_ABBREVIATIONS = frozenset({
+    "pt.", "tbk.", "rp.", "no.", "dr.", "ir.", "drs.", "prof.", "h.", "hj.", "st.", "jl.",
+    "dll.", "dsb.", "dst.", "sdr.", "bpk.", "yth.", "tn.", "ny.", "mr.", "mrs.", "vs.",
+})
+
+# Ticker di teks asli: 4 huruf kapital, opsional diawali "$"
+_TICKER_TOKEN_RE = re.compile(r'(?<![A-Za-z0-9])\$?([A-Z]{4})(?![A-Za-z0-9])')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class Window(NamedTuple):
+    text: str
+    tokens: int
+    tickers: FrozenSet[str]
+
+
+class WindowedText(NamedTuple):
+    # Gabungan kalimat terpilih: dipakai untuk cache key, heuristik, dan cascade
+    text: str
+    windows: List[Window]
+    tickers: FrozenSet[str]
+
+
+def _is_abbreviation(sentence: str) -> bool:
+    last_token = sentence.rsplit(None, 1)[-1].lower()
+    # Inisial nama ("A.") juga bukan akhir kalimat
+    return last_token in _ABBREVIATIONS or (len(last_token) == 2 and last_token[0].isalpha())
+
+
+def split_sentences(text: str) -> List[str]:
+    sentences: List[str] = []
+    for piece in _SENTENCE_SPLIT_RE.split(text):
+        piece = piece.strip()
+        if not piece:
+            continue
+        if sentences and _is_abbreviation(sentences[-1]):
+            sentences[-1] = f"{sentences[-1]} {piece}"
+        else:
+            sentences.append(piece)
+    return sentences
+
+
+class TickerMatcher:
+    """Ticker IHSG yang disebut dalam kalimat: kode (BBRI / $BBRI) atau nama emiten."""
+
+    def __init__(self, mapping: Dict[str, str]):
+        self.tickers = frozenset(mapping.values())
+        self._name_to_ticker = {name.lower(): ticker for name, ticker in mapping.items()}
+        self._matcher = LexiconMatcher({"company": (list(self._name_to_ticker), WORD)}) if mapping else None
+
+    def find(self, sentence: str) -> FrozenSet[str]:
+        found = {match.group(1) for match in _TICKER_TOKEN_RE.finditer(sentence) if match.group(1) in self.tickers}
+        if self._matcher is not None:
+            normalized = _WHITESPACE_RE.sub(" ", sentence.lower()).strip()
+            found.update(self._name_to_ticker[name] for name in self._matcher.match(normalized)["company"])
+        return frozenset(found)
+
+
+def make_token_counter(nlp_pipeline) -> Callable[[List[str]], List[int]]:
+    """
+    Penghitung panjang token (tanpa token spesial) dari tokenizer model yang sedang dipakai.
+    Tanpa tokenizer (load_model=False / pipeline tiruan): perkiraan 4 karakter per token.
+    """
+    count_tokens = getattr(nlp_pipeline, "count_tokens", None)
+    if callable(count_tokens):
+        return count_tokens
+
+    tokenizer = getattr(nlp_pipeline, "tokenizer", None)
+    if tokenizer is not None and callable(tokenizer):
+        def _hf_count(texts: List[str]) -> List[int]:
+            return [len(ids) for ids in tokenizer(texts, add_special_tokens=False)["input_ids"]]
+        return _hf_count
+
+    return lambda texts: [max(1, len(text) // 4) for text in texts]
+
+
+class SentenceWindower:
+    def __init__(
+        self,
+        token_counter: Callable[[List[str]], List[int]],
+        is_context: Callable[[str], bool],
+        ticker_matcher: Optional[TickerMatcher] = None,
+        max_tokens: int = 510,
+        max_windows: int = 4,
+        max_sentence_chars: int = 512,
+    ):
+        self.token_counter = token_counter
+        self.is_context = is_context
+        self.ticker_matcher = ticker_matcher
+        self.max_tokens = max_tokens
+        self.max_windows = max_windows
+        self.max_sentence_chars = max_sentence_chars
+
+    def _select(self, text: str) -> List[Tuple[str, FrozenSet[str]]]:
+        selected = []
+        for sentence in split_sentences(text):
+            tickers = self.ticker_matcher.find(sentence) if self.ticker_matcher else frozenset()
+            if tickers or self.is_context(sentence):
+                # Kalimat super panjang (tabel, teks tanpa titik) dipotong dulu supaya tokenisasi murah;
+                # budget token per kalimat ditegakkan di _fit
+                selected.append((sentence[:self.max_sentence_chars], tickers))
+        return selected
+
+    def _fit(self, sentence: str, length: int) -> List[Tuple[str, int]]:
+        """Pecah kalimat di spasi terdekat dari tengah (atau di tengah) sampai tiap potongan muat budget."""
+        if length <= self.max_tokens or len(sentence) < 2:
+            return [(sentence, length)]
+        middle = len(sentence) // 2
+        spaces = [cut for cut in (sentence.rfind(" ", 0, middle), sentence.find(" ", middle)) if cut > 0]
+        cut = min(spaces, key=lambda position: abs(position - middle)) if spaces else middle
+        halves = [sentence[:cut].strip(), sentence[cut:].strip()]
+        if not all(halves):
+            halves = [sentence[:middle], sentence[middle:]]
+        pieces: List[Tuple[str, int]] = []
+        for half, half_length in zip(halves, self.token_counter(halves)):
+            pieces.extend(self._fit(half, half_length))
+        return pieces
+
+    def _pack(self, sentences: Sequence[Tuple[str, int, FrozenSet[str]]]) -> List[Window]:
+        windows: List[Window] = []
+        parts: List[str] = []
+        tokens = 0
+        tickers: set = set()
+        for sentence, length, sentence_tickers in sentences:
+            # +1: perkiraan token pemisah antar kalimat
+            if parts and tokens + 1 + length > self.max_tokens:
+                windows.append(Window(" ".join(parts), tokens, frozenset(tickers)))
+                parts, tokens, tickers = [], 0, set()
+            tokens += length + (1 if parts else 0)
+            parts.append(sentence)
+            tickers.update(sentence_tickers)
+        if parts:
+            windows.append(Window(" ".join(parts), tokens, frozenset(tickers)))
+        return windows
+
+    def build(self, text: str) -> Optional[WindowedText]:
+        """None jika tidak ada kalimat relevan (pemanggil kembali ke mode potong 512 karakter)."""
+        selected = self._select(text)
+        if not selected:
+            return None
+
+        lengths = self.token_counter([sentence for sentence, _ in selected])
+
+        # Grup per ticker (urutan kemunculan pertama): satu ticker -> grupnya sendiri,
+        # tanpa ticker -> grup umum, multi-ticker -> grup bersama
+        groups: Dict[object, List[Tuple[str, int, FrozenSet[str]]]] = {}
+        for (sentence, tickers), length in zip(selected, lengths):
+            key = next(iter(tickers)) if len(tickers) == 1 else (tickers or None)
+            groups.setdefault(key, []).extend(
+                (piece, piece_length, tickers) for piece, piece_length in self._fit(sentence, length)
+            )
+
+        windows: List[Window] = []
+        for group in groups.values():
+            windows.extend(self._pack(group))
+        windows = windows[:self.max_windows]
+
+        dense_text = " ".join(window.text for window in windows)
+        tickers = frozenset(ticker for window in windows for ticker in window.tickers)
+        return WindowedText(dense_text, windows, tickers)
@@ -0,0 +1,33 @@
+# Article Body Selectors
+# XPath paragraf isi berita per portal (portal yang ada di CREDIBILITY_SCORES).
+# Dipakai oleh extractor full-body; portal yang tidak terdaftar jatuh ke heuristik <p> generik.
+
+ARTICLE_BODY_XPATHS = {
+    "www.cnbcindonesia.com": "//div[contains(@class, 'detail_text') or contains(@class, 'detail-text')]//p",
+    "www.kompas.com": "//div[contains(@class, 'read__content')]//p",
+    "www.tempo.co": "//div[@id='isi']//p | //div[contains(@class, 'detail-in')]//p",
+    "www.detik.com": "//div[contains(@class, 'detail__body-text')]//p",
+    "www.kontan.co.id": "//div[contains(@class, 'tmpt-desk-kon')]//p",
+    "www.liputan6.com": "//div[contains(@class, 'article-content-body__item-content')]//p",
+    "www.tribunnews.com": "//div[contains(@class, 'txt-article')]//p",
+    "www.okezone.com": "//div[@id='contentx']//p",
+}
+
+
+def get_body_xpath(domain: str):
+    """
+    Ambil XPath isi berita untuk domain (subdomain seperti market.bisnis.com / finance.detik.com
+    ikut dicocokkan ke domain induknya). Return None jika portal belum punya selector.
+    """
+    host = (domain or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+
+    while host:
+        xpath = ARTICLE_BODY_XPATHS.get(f"www.{host}")
+        if xpath:
+            return xpath
+        if "." not in host:
+            break
+        host = host.split(".", 1)[1]
+    return None
@@ -0,0 +1,187 @@
+"""
+Arsip Parquet untuk data yang dihapus retention cleanup.
+
+Setiap chunk cleanup ditulis sebagai baris denormalisasi (article + sentiment_log + news_source)
+ke `<ARCHIVE_DIR>/date=YYYY-MM-DD/part-<start_id>-<end_id>.parquet` (zstd, tanggal UTC), sebelum
+chunk itu dihapus dari database. Memori hanya sebesar satu chunk, berapa pun total baris yang diarsip.
+Nama file ditentukan oleh batas chunk (kelipatan chunk_size, lihat cleanup_old_data). Jika file
+partisi itu sudah ada (cleanup berikutnya mengenai tanggal & chunk yang sama), isinya digabung
+dengan baris baru, bukan ditimpa: baris yang sudah dihapus dari database tetap ada di arsip,
+dan chunk yang diarsip ulang setelah cleanup gagal sebelum commit tidak menghasilkan duplikat.
+
+Untuk riset/backtesting, `load_archive` membuka arsip sebagai pyarrow Dataset (lazy):
+hanya partisi tanggal & kolom yang diminta yang dibaca dari disk.
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.data.models import Article, NewsSource, SentimentLog
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SCHEMA = pa.schema([
+    ("article_id", pa.int64()),
+    ("url", pa.string()),
+    ("title", pa.string()),
+    ("content", pa.string()),
+    ("published_at", pa.timestamp("us", tz="UTC")),
+    ("scraped_at", pa.timestamp("us", tz="UTC")),
+    ("source_domain", pa.string()),
+    ("source_name", pa.string()),
+    ("source_credibility_score", pa.float64()),
+    ("source_is_trusted", pa.bool_()),
+    ("sentiment_label", pa.string()),
+    ("sentiment_score", pa.float64()),
+    ("confidence", pa.float64()),
+    ("source_credibility", pa.float64()),
+    ("noise_probability", pa.float64()),
+    ("integrity_score", pa.float64()),
+    ("label_source", pa.string()),
+    ("analyzed_at", pa.timestamp("us", tz="UTC")),
+])
+
+PARTITIONING = ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive")
+DATASET_SCHEMA = ARCHIVE_SCHEMA.append(pa.field("date", pa.string()))
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # SQLite mengembalikan datetime naive (UTC); Postgres timezone-aware dalam zona waktu session
+    if value is None:
+        return value
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class ArticleArchiver:
+    def __init__(self, root: Optional[Path] = None, compression_level: int = 9):
+        root = root or os.getenv("ARCHIVE_DIR")
+        if not root:
+            raise ValueError("ARCHIVE_DIR belum di-set")
+        self.root = Path(root)
+        self.compression_level = compression_level
+        self.stats = {"archived_rows": 0, "archive_files": 0, "archive_bytes": 0}
+
+    def archive_chunk(self, db: Session, start_id: int, end_id: int, cutoff: datetime) -> int:
+        """
+        Tulis artikel dengan start_id <= id < end_id dan scraped_at < cutoff (beserta log &
+        sumbernya) ke Parquet. Dipanggil sebelum chunk yang sama dihapus. Return jumlah baris.
+        """
+        rows = db.execute(
+            select(
+                Article.id.label("article_id"),
+                Article.url,
+                Article.title,
+                Article.content,
+                Article.published_at,
+                Article.scraped_at,
+                NewsSource.domain.label("source_domain"),
+                NewsSource.name.label("source_name"),
+                NewsSource.credibility_score.label("source_credibility_score"),
+                NewsSource.is_trusted.label("source_is_trusted"),
+                SentimentLog.sentiment_label,
+                SentimentLog.sentiment_score,
+                SentimentLog.confidence,
+                SentimentLog.source_credibility,
+                SentimentLog.noise_probability,
+                SentimentLog.integrity_score,
+                SentimentLog.label_source,
+                SentimentLog.analyzed_at,
+            )
+            .join(NewsSource, Article.source_id == NewsSource.id)
+            .outerjoin(SentimentLog, SentimentLog.article_id == Article.id)
+            .where(Article.id >= start_id, Article.id < end_id, Article.scraped_at < cutoff)
+            .order_by(Article.id)
+        ).mappings().all()
+
+        if not rows:
+            return 0
+
+        # Kelompokkan per tanggal scraped_at (UTC) -> satu file per partisi
+        by_date = {}
+        for row in rows:
+            row = dict(row)
+            for column in ("published_at", "scraped_at", "analyzed_at"):
+                row[column] = _as_utc(row[column])
+            by_date.setdefault(row["scraped_at"].date().isoformat(), []).append(row)
+
+        for date_key, date_rows in by_date.items():
+            self._write_partition(date_key, start_id, end_id, date_rows)
+
+        self.stats["archived_rows"] += len(rows)
+        return len(rows)
+
+    def _write_partition(self, date_key: str, start_id: int, end_id: int, rows: List[dict]) -> None:
+        directory = self.root / f"date={date_key}"
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"part-{start_id}-{end_id}.parquet"
+        tmp_path = path.with_suffix(".parquet.tmp")
+
+        table = pa.Table.from_pylist(rows, schema=ARCHIVE_SCHEMA)
+        if path.exists():
+            # Baris dari run sebelumnya sudah tidak ada di database; versi baru menang jika id sama
+            existing = pq.read_table(path, schema=ARCHIVE_SCHEMA)
+            existing = existing.filter(pc.invert(pc.is_in(existing["article_id"], value_set=table["article_id"])))
+            table = pa.concat_tables([existing, table]).sort_by("article_id")
+
+        pq.write_table(
+            table,
+            tmp_path,
+            compression="zstd",
+            compression_level=self.compression_level,
+        )
+        # File baru terlihat utuh atau tidak sama sekali
+        os.replace(tmp_path, path)
+
+        self.stats["archive_files"] += 1
+        self.stats["archive_bytes"] += path.stat().st_size
+
+
+def load_archive(root: Optional[Path] = None) -> ds.Dataset:
+    """
+    Buka arsip sebagai pyarrow Dataset tanpa membaca datanya.
+
+    Contoh:
+        dataset = load_archive()
+        table = dataset.to_table(
+            columns=["scraped_at", "title", "sentiment_label", "integrity_score"],
+            filter=(ds.field("date") >= "2026-01-01") & (ds.field("sentiment_label") == "POSITIVE"),
+        )
+        df = table.to_pandas()
+    """
+    root = root or os.getenv("ARCHIVE_DIR")
+    if not root:
+        raise ValueError("ARCHIVE_DIR belum di-set")
+    # Skema eksplisit: file arsip lama tanpa kolom baru (mis. label_source) terbaca sebagai null
+    return ds.dataset(str(root), format="parquet", partitioning=PARTITIONING, schema=DATASET_SCHEMA)
+
+
+def read_archive(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    columns: Optional[List[str]] = None,
+    root: Optional[Path] = None,
+):
+    """
+    Baca sebagian arsip ke pandas DataFrame. Tanggal (YYYY-MM-DD, inklusif) memangkas partisi,
+    jadi hanya file pada rentang itu yang dibuka.
+    """
+    dataset = load_archive(root)
+    condition = None
+    if start_date:
+        condition = ds.field("date") >= start_date
+    if end_date:
+        end_condition = ds.field("date") <= end_date
+        condition = end_condition if condition is None else condition & end_condition
+    return dataset.to_table(columns=columns, filter=condition).to_pandas()
@@ -1,17 +1,129 @@
 from datetime import datetime, timedelta, timezone
+import os
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy import func
+from sqlalchemy import select, update, delete, func, or_, and_, case
+from sqlalchemy.dialects import postgresql, sqlite
 import hashlib
-from thefuzz import fuzz
-from src.data.models import Article, NewsSource, SentimentLog
+import re
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from src.data.models import (
+    Article, NewsSource, SentimentLog, ANALYSIS_PENDING, ANALYSIS_PROCESSING, ANALYSIS_DONE, ANALYSIS_FAILED,
+)
 from src.data.scraper import ScrapedData
 from src.config.credibility import get_credibility
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Batas claim per artikel: teks yang selalu gagal dianalisis ditandai 'failed', bukan di-claim selamanya
+ANALYSIS_MAX_ATTEMPTS = int(os.getenv("ANALYSIS_MAX_ATTEMPTS", "3"))
+
+
+def normalize_title(title: str) -> str:
+    """Normalisasi judul untuk dedup: lowercase lalu buang semua karakter non-alphanumeric."""
+    return re.sub(r'[^a-z0-9]', '', (title or "").lower())
+
+
+def compute_title_norm_hash(title: str):
+    """
+    md5 dari judul ternormalisasi (disimpan di kolom ter-index `articles.title_norm_hash`).
+    Return None untuk judul yang kosong setelah normalisasi, supaya tidak saling dianggap duplikat.
+    """
+    normalized = normalize_title(title)
+    if not normalized:
+        return None
+    return hashlib.md5(normalized.encode('utf-8')).hexdigest()
+
+
+@dataclass(frozen=True)
+class SourceInfo:
+    """Snapshot ringan dari baris news_sources (aman dipakai lintas session)."""
+    id: int
+    domain: str
+    credibility_score: float
+    is_trusted: bool
+
+
+class _SourceCache:
+    """
+    Cache domain -> SourceInfo per proses.
+    Dimuat penuh dengan satu query (jumlah sumber hanya puluhan), lalu kedaluwarsa setelah TTL.
+    Sumber baru yang di-insert proses ini langsung ditulis ke cache (write-through).
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.by_domain: Dict[str, SourceInfo] = {}
+        self.by_id: Dict[int, SourceInfo] = {}
+        self.loaded_at = 0.0
+
+    def is_fresh(self) -> bool:
+        return bool(self.loaded_at) and time.monotonic() - self.loaded_at < self.ttl_seconds
+
+    def load(self, db: Session) -> None:
+        rows = db.execute(
+            select(NewsSource.id, NewsSource.domain, NewsSource.credibility_score, NewsSource.is_trusted)
+        ).all()
+        self.by_domain.clear()
+        self.by_id.clear()
+        for row in rows:
+            self.put(SourceInfo(row.id, row.domain, row.credibility_score, row.is_trusted))
+        self.loaded_at = time.monotonic()
+
+    def ensure_fresh(self, db: Session) -> None:
+        if not self.is_fresh():
+            self.load(db)
+
+    def put(self, info: SourceInfo) -> None:
+        self.by_domain[info.domain] = info
+        self.by_id[info.id] = info
+
+    def invalidate(self) -> None:
+        self.by_domain.clear()
+        self.by_id.clear()
+        self.loaded_at = 0.0
+
+
+_source_cache = _SourceCache(ttl_seconds=float(os.getenv("SOURCE_CACHE_TTL_SECONDS", "600")))
+
+
+def preload_sources(db: Session) -> int:
+    """Muat semua news_sources ke cache dalam satu query. Return jumlah sumber."""
+    _source_cache.load(db)
+    return len(_source_cache.by_domain)
+
+
+def invalidate_source_cache() -> None:
+    _source_cache.invalidate()
+
+
+def get_source_credibility(db: Session, source_id: int, default: float = 0.5) -> float:
+    """Credibility score sumber berdasarkan id, tanpa lazy-load relationship per artikel."""
+    _source_cache.ensure_fresh(db)
+    info = _source_cache.by_id.get(source_id)
+    if info is None:
+        # Sumber dibuat proses lain setelah cache dimuat: muat ulang sekali
+        _source_cache.load(db)
+        info = _source_cache.by_id.get(source_id)
+    return info.credibility_score if info else default
+
+
+def get_or_create_source_info(db: Session, domain: str) -> SourceInfo:
+    """Versi ter-cache dari get_or_create_source; hanya query DB jika domain belum dikenal."""
+    _source_cache.ensure_fresh(db)
+    info = _source_cache.by_domain.get(domain)
+    if info is None:
+        source = get_or_create_source(db, domain)
+        info = SourceInfo(source.id, source.domain, source.credibility_score, source.is_trusted)
+        _source_cache.put(info)
+    return info
+
+
 def get_or_create_source(db: Session, domain: str) -> NewsSource:
     """
     Cek apakah sumber berita (misal: cnbc.com) sudah ada.
@@ -41,47 +153,18 @@ def save_article(db: Session, data: ScrapedData) -> bool:
     Return: True jika berhasil disimpan, False jika duplikat/gagal.
     """
     try:
-        # 1. Pastikan Sumber Berita ada
-        source = get_or_create_source(db, data.source_domain)
+        # 1. Pastikan Sumber Berita ada (lewat cache, tanpa SELECT per artikel)
+        source = get_or_create_source_info(db, data.source_domain)
         # 2a. Dedup Level-2: Normalisasi judul (lowercase, hapus non-alphanum) dan cek kesamaan
-        try:
-            # Normalisasi judul di aplikasi
-            def _normalize_title(t: str) -> str:
-                import re
-                s = (t or "").lower()
-                s = re.sub(r'[^a-z0-9]', '', s)
-                return s
-
-            normalized = _normalize_title(data.title)
-            title_hash = hashlib.md5(normalized.encode('utf-8')).hexdigest()
-
-            # Coba normalisasi di sisi DB (Postgres regexp_replace) — jika tidak tersedia, fallback ke Python
-            try:
-                db_norm_expr = func.lower(func.regexp_replace(Article.title, '[^a-z0-9]', '', 'g'))
-                existing_by_title = db.query(Article).filter(db_norm_expr == normalized).first()
-                if existing_by_title:
-                    logger.info(f"♻️ Skip duplikat judul (norm-md5={title_hash}): {data.title[:60]}...")
-                    return False
-            except Exception:
-                # Fallback: lakukan fuzzy matching terhadap artikel dalam window 24 jam terakhir
-                window_start = datetime.now(timezone.utc) - timedelta(hours=24)
-                candidates = db.query(Article).filter(Article.scraped_at >= window_start).all()
-                for cand in candidates:
-                    try:
-                        # Compare normalized titles using fuzz.ratio on stripped lowercase strings
-                        a = (cand.title or "").strip().lower()
-                        b = (data.title or "").strip().lower()
-                        score = fuzz.ratio(a, b)
-                        if score >= 85:
-                            logger.info(f"♻️ Skip duplikat fuzzy match ({score}%): {data.title[:80]}...")
-                            return False
-                    except Exception:
-                        continue
-        except Exception:
-            # Jika ada error tak terduga saat proses normalisasi/cek, fallback ke pengecekan URL
-            logger.debug("⚠️ Normalized title check mengalami error; fallback ke pengecekan URL saja.")
+        # Normalisasi judul di aplikasi
+        title_hash = compute_title_norm_hash(data.title)
+
+        # Satu index probe ke kolom title_norm_hash — biayanya tidak tumbuh seiring ukuran tabel
+        if title_hash and db.query(Article.id).filter(Article.title_norm_hash == title_hash).first():
+            logger.info(f"♻️ Skip duplikat judul (norm-md5={title_hash}): {data.title[:60]}...")
+            return False
         # 2b. Cek apakah URL sudah pernah discrape (Idempotency)
-        existing_article = db.query(Article).filter(Article.url == data.url).first()
+        existing_article = db.query(Article.id).filter(Article.url == data.url).first()
         if existing_article:
             logger.info(f"♻️ Skip duplikat: {data.title[:30]}...")
             return False
@@ -92,9 +175,10 @@ def save_article(db: Session, data: ScrapedData) -> bool:
             url=data.url,
             title=data.title,
             content=data.content,
+            title_norm_hash=title_hash,
             # published_at bisa diparsing lebih lanjut nanti
         )
-        
+
         db.add(new_article)
         db.commit()
         logger.info(f"💾 Tersimpan: {data.title[:30]}...")
@@ -110,30 +194,175 @@ def save_article(db: Session, data: ScrapedData) -> bool:
         return False
 
 
+def _insert_stmt(db: Session, model):
+    """INSERT yang mendukung ON CONFLICT (Postgres di produksi, SQLite untuk uji lokal)."""
+    dialect = sqlite if db.get_bind().dialect.name == "sqlite" else postgresql
+    return dialect.insert(model)
+
+
+def _resolve_source_ids(db: Session, domains: set) -> dict:
+    """
+    Map domain -> news_sources.id untuk banyak domain sekaligus:
+    satu SELECT, lalu satu INSERT ... ON CONFLICT DO NOTHING untuk domain yang belum ada.
+    """
+    if not domains:
+        return {}
+
+    _source_cache.ensure_fresh(db)
+    source_ids = {
+        domain: _source_cache.by_domain[domain].id
+        for domain in domains if domain in _source_cache.by_domain
+    }
+
+    missing = domains - source_ids.keys()
+    if missing:
+        rows = []
+        for domain in sorted(missing):
+            credibility = get_credibility(domain)
+            logger.info(f"🆕 Sumber baru terdeteksi: {domain} (Credibility: {credibility:.2f})")
+            rows.append({
+                "domain": domain,
+                "name": domain,
+                "credibility_score": credibility,
+                "is_trusted": credibility >= 0.75,
+            })
+
+        stmt = (
+            _insert_stmt(db, NewsSource)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["domain"])
+            .returning(NewsSource.id, NewsSource.domain, NewsSource.credibility_score, NewsSource.is_trusted)
+        )
+        new_sources = db.execute(stmt).all()
+
+        # Domain yang di-insert proses lain di saat bersamaan tidak ikut di RETURNING
+        still_missing = missing - {row.domain for row in new_sources}
+        if still_missing:
+            new_sources += db.execute(
+                select(NewsSource.id, NewsSource.domain, NewsSource.credibility_score, NewsSource.is_trusted)
+                .where(NewsSource.domain.in_(still_missing))
+            ).all()
+
+        for row in new_sources:
+            source_ids[row.domain] = row.id
+            _source_cache.put(SourceInfo(row.id, row.domain, row.credibility_score, row.is_trusted))
+
+    return source_ids
+
+
+def save_articles_bulk(db: Session, items: list, batch_size: int = 500) -> dict:
+    """
+    Menyimpan banyak artikel sekaligus dalam beberapa round-trip saja:
+    1. Dedup di dalam batch (URL + judul ternormalisasi)
+    2. Satu query dedup judul terhadap database
+    3. Resolve semua sumber berita (1 SELECT + maksimal 1 INSERT)
+    4. INSERT ... ON CONFLICT (url) DO NOTHING RETURNING id per `batch_size` artikel
+    5. Satu commit
+
+    Return dict jumlah inserted / duplicates untuk logging pipeline.
+    """
+    result = {"received": len(items), "inserted": 0, "duplicates": 0}
+    if not items:
+        return result
+
+    # 1. Dedup di dalam batch: feed berbeda sering memuat artikel yang sama
+    unique_items = []
+    seen_urls = set()
+    seen_title_hashes = set()
+    for item in items:
+        title_hash = compute_title_norm_hash(item.title)
+        if item.url in seen_urls or (title_hash and title_hash in seen_title_hashes):
+            continue
+        seen_urls.add(item.url)
+        if title_hash:
+            seen_title_hashes.add(title_hash)
+        unique_items.append((item, title_hash))
+
+    try:
+        # 2. Dedup Level-2 terhadap database, satu index lookup untuk semua judul
+        existing_title_hashes = set(db.scalars(
+            select(Article.title_norm_hash).where(Article.title_norm_hash.in_(seen_title_hashes))
+        ).all()) if seen_title_hashes else set()
+
+        candidates = [
+            (item, title_hash) for item, title_hash in unique_items
+            if title_hash is None or title_hash not in existing_title_hashes
+        ]
+
+        # 3. Pastikan semua sumber berita ada
+        source_ids = _resolve_source_ids(db, {item.source_domain for item, _ in candidates})
+
+        # 4. Insert artikel per batch; URL yang sudah ada dilewati oleh ON CONFLICT
+        for start in range(0, len(candidates), batch_size):
+            chunk = candidates[start:start + batch_size]
+            stmt = (
+                _insert_stmt(db, Article)
+                .values([
+                    {
+                        "source_id": source_ids[item.source_domain],
+                        "url": item.url,
+                        "title": item.title,
+                        "title_norm_hash": title_hash,
+                        "content": item.content,
+                    }
+                    for item, title_hash in chunk
+                ])
+                .on_conflict_do_nothing(index_elements=["url"])
+                .returning(Article.id)
+            )
+            result["inserted"] += len(db.execute(stmt).scalars().all())
+
+        db.commit()
+        result["duplicates"] = len(items) - result["inserted"]
+        logger.info(
+            f"💾 Bulk insert selesai | Diterima: {result['received']} | "
+            f"Tersimpan: {result['inserted']} | Duplikat: {result['duplicates']}"
+        )
+        return result
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ Database Error (bulk insert): {e}")
+        result["error"] = str(e)
+        return result
+
+
+def _sentiment_log_values(article_id: int, analysis_result: dict) -> dict:
+    return {
+        "article_id": article_id,
+        "sentiment_score": analysis_result.get("integrity_score", 0.0),
+        "sentiment_label": analysis_result.get("sentiment_label", "NEUTRAL"),
+        "confidence": analysis_result.get("confidence", 0.0),
+        "source_credibility": analysis_result.get("source_credibility", 0.5),
+        "noise_probability": analysis_result.get("noise_probability", 0.0),
+        "integrity_score": analysis_result.get("integrity_score", 0.0),
+        "label_source": analysis_result.get("label_source"),
+    }
+
+
 def save_sentiment_log(db: Session, article_id: int, analysis_result: dict) -> bool:
     """
     Menyimpan hasil analisis AI ke tabel sentiment_logs.
     """
     try:
-        # Cek apakah artikel ini sudah pernah dianalisis
-        existing_log = db.query(SentimentLog).filter(SentimentLog.article_id == article_id).first()
-        if existing_log:
+        # Unique index article_id: log yang sudah ada dilewati oleh DB, tanpa SELECT terpisah
+        values = _sentiment_log_values(article_id, analysis_result)
+        stmt = (
+            _insert_stmt(db, SentimentLog)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["article_id"])
+            .returning(SentimentLog.id)
+        )
+        inserted = db.execute(stmt).first() is not None
+        # Pastikan artikel tidak diambil lagi dari antrian
+        _mark_analysis_done(db, [article_id])
+        db.commit()
+
+        if not inserted:
             logger.info(f"♻️ Sentimen untuk artikel ID {article_id} sudah ada. Skip.")
             return False
 
-        new_log = SentimentLog(
-            article_id=article_id,
-            sentiment_score=analysis_result.get("integrity_score", 0.0),
-            sentiment_label=analysis_result.get("sentiment_label", "NEUTRAL"),
-            confidence=analysis_result.get("confidence", 0.0),
-            source_credibility=analysis_result.get("source_credibility", 0.5),
-            noise_probability=analysis_result.get("noise_probability", 0.0),
-            integrity_score=analysis_result.get("integrity_score", 0.0)
-        )
-        
-        db.add(new_log)
-        db.commit()
-        logger.info(f"🧠 Sentimen Tersimpan -> Label: {new_log.sentiment_label} | Integritas: {new_log.integrity_score:.2f}")
+        logger.info(f"🧠 Sentimen Tersimpan -> Label: {values['sentiment_label']} | Integritas: {values['integrity_score']:.2f}")
         return True
 
     except Exception as e:
@@ -141,67 +370,270 @@ def save_sentiment_log(db: Session, article_id: int, analysis_result: dict) -> b
         logger.error(f"❌ Gagal menyimpan sentimen: {e}")
         return False
 
-def get_unprocessed_articles(db: Session, limit: int = 10):
+
+def save_sentiment_logs(db: Session, results: list) -> dict:
+    """
+    Menyimpan hasil analisis satu batch inferensi sekaligus.
+
+    `results` berisi pasangan (article_id, analysis_result). Semua log ditulis dengan satu
+    INSERT ... ON CONFLICT (article_id) DO NOTHING, status antrian diperbarui dengan satu UPDATE,
+    lalu satu commit.
+    """
+    summary = {"received": len(results), "inserted": 0, "duplicates": 0}
+    if not results:
+        return summary
+
+    # Article id ganda di dalam satu batch: pakai hasil pertama (sama seperti ON CONFLICT)
+    rows = {}
+    for article_id, analysis_result in results:
+        rows.setdefault(article_id, _sentiment_log_values(article_id, analysis_result))
+
+    try:
+        stmt = (
+            _insert_stmt(db, SentimentLog)
+            .values(list(rows.values()))
+            .on_conflict_do_nothing(index_elements=["article_id"])
+            .returning(SentimentLog.article_id)
+        )
+        summary["inserted"] = len(db.execute(stmt).all())
+        _mark_analysis_done(db, list(rows))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ Gagal menyimpan batch sentimen: {e}")
+        summary["error"] = str(e)
+        return summary
+
+    summary["duplicates"] = summary["received"] - summary["inserted"]
+    logger.info(
+        f"🧠 Batch sentimen tersimpan | Diterima: {summary['received']} | "
+        f"Tersimpan: {summary['inserted']} | Sudah ada: {summary['duplicates']}"
+    )
+    return summary
+
+
+def _mark_analysis_done(db: Session, article_ids) -> None:
+    """Keluarkan artikel dari antrian analisis (commit dilakukan oleh pemanggil)."""
+    if article_ids:
+        db.execute(
+            update(Article)
+            .where(Article.id.in_(article_ids))
+            .values(analysis_status=ANALYSIS_DONE, claimed_by=None, claim_expires_at=None)
+        )
+
+
+def get_unprocessed_articles(db: Session, limit: int = 10, after_id: int = 0):
+    """
+    Mengambil artikel yang belum dianalisis, dari yang paling lama (id terkecil).
+
+    Memakai index (analysis_status, id) sehingga biaya query sebanding dengan `limit`,
+    bukan dengan ukuran tabel. `after_id` dipakai untuk keyset pagination:
+    isi dengan id terakhir dari batch sebelumnya. Butuh skema yang sudah dimigrasi
+    (database.check_schema dijalankan init_db / worker saat start).
+    """
+    return db.execute(
+        select(Article)
+        .where(Article.analysis_status == ANALYSIS_PENDING, Article.id > after_id)
+        .order_by(Article.id)
+        .limit(limit)
+    ).scalars().all()
+
+
+def claim_articles(db: Session, worker_id: str, limit: int = 50, lease_seconds: int = 600,
+                   max_attempts: Optional[int] = None):
     """
-    Mengambil artikel yang belum memiliki data di tabel sentiment_logs.
+    Claim batch artikel pending secara atomik untuk satu worker.
+
+    Baris dikunci dengan FOR UPDATE SKIP LOCKED sehingga beberapa worker (di node mana pun)
+    mendapat batch yang saling lepas tanpa saling menunggu. Claim berlaku sampai
+    `claim_expires_at`; claim yang kedaluwarsa (worker crash) bisa di-claim ulang.
+
+    Setiap claim menaikkan `analysis_attempts`. Claim kedaluwarsa yang sudah mencapai
+    `max_attempts` (default ANALYSIS_MAX_ATTEMPTS) ditandai 'failed' dan tidak di-claim lagi.
+    Error database diteruskan ke pemanggil (bukan antrian kosong palsu).
     """
-    # Mencari artikel yang ID-nya TIDAK ADA di tabel sentiment_logs
-    subquery = db.query(SentimentLog.article_id)
-    articles = db.query(Article).filter(Article.id.notin_(subquery)).limit(limit).all()
-    return articles
+    max_attempts = max_attempts or ANALYSIS_MAX_ATTEMPTS
+    now = datetime.now(timezone.utc)
+    claimable = (
+        select(Article.id)
+        .where(
+            or_(
+                Article.analysis_status == ANALYSIS_PENDING,
+                and_(Article.analysis_status == ANALYSIS_PROCESSING, Article.claim_expires_at < now),
+            ),
+            Article.analysis_attempts < max_attempts,
+        )
+        .order_by(Article.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+    try:
+        # Lease worker yang crash berulang kali pada artikel yang sama: berhenti di max_attempts
+        failed = db.execute(
+            update(Article)
+            .where(
+                Article.analysis_status == ANALYSIS_PROCESSING,
+                Article.claim_expires_at < now,
+                Article.analysis_attempts >= max_attempts,
+            )
+            .values(analysis_status=ANALYSIS_FAILED, claimed_by=None, claim_expires_at=None)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if failed:
+            logger.warning(f"⚠️ {failed} artikel ditandai failed setelah {max_attempts}x claim kedaluwarsa.")
+
+        articles = db.execute(
+            update(Article)
+            .where(Article.id.in_(claimable.scalar_subquery()))
+            .values(
+                analysis_status=ANALYSIS_PROCESSING,
+                claimed_by=worker_id,
+                claim_expires_at=now + timedelta(seconds=lease_seconds),
+                analysis_attempts=Article.analysis_attempts + 1,
+            )
+            .returning(Article)
+            .execution_options(synchronize_session=False)
+        ).scalars().all()
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ Gagal claim artikel untuk {worker_id}: {e}")
+        raise
 
+    return sorted(articles, key=lambda article: article.id)
 
-def cleanup_old_data(db: Session, retention_days: int = 30) -> dict:
+
+def release_article_claims(db: Session, worker_id: str, article_ids=None,
+                           max_attempts: Optional[int] = None) -> int:
+    """
+    Kembalikan artikel yang masih di-claim worker ini ke antrian (mis. saat error/shutdown).
+    Tanpa `article_ids`, semua claim aktif milik worker dilepas. Artikel yang sudah
+    di-claim `max_attempts` kali (default ANALYSIS_MAX_ATTEMPTS) ditandai 'failed'.
+    """
+    max_attempts = max_attempts or ANALYSIS_MAX_ATTEMPTS
+    next_status = case(
+        (Article.analysis_attempts >= max_attempts, ANALYSIS_FAILED),
+        else_=ANALYSIS_PENDING,
+    )
+    stmt = (
+        update(Article)
+        .where(Article.claimed_by == worker_id, Article.analysis_status == ANALYSIS_PROCESSING)
+        .values(analysis_status=next_status, claimed_by=None, claim_expires_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    if article_ids is not None:
+        stmt = stmt.where(Article.id.in_(article_ids))
+
+    try:
+        released = db.execute(stmt).rowcount
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"❌ Gagal melepas claim {worker_id}: {e}")
+        return 0
+
+    if released:
+        logger.info(f"🔓 {released} claim artikel milik {worker_id} dilepas (pending, atau failed jika batas percobaan habis).")
+    return released
+
+
+def _chunk_timing_summary(chunk_timings_ms: list) -> dict:
+    """Ringkasan durasi chunk cleanup: total, terlama, dan median (ms)."""
+    return {
+        "chunk_total_ms": round(sum(chunk_timings_ms), 1),
+        "max_chunk_ms": max(chunk_timings_ms, default=0.0),
+        "p50_chunk_ms": round(statistics.median(chunk_timings_ms), 1) if chunk_timings_ms else 0.0,
+    }
+
+
+def cleanup_old_data(db: Session, retention_days: int = 30, chunk_size: int = 5000, archiver=None) -> dict:
     """
     Menghapus data lama untuk menjaga kapasitas database tetap stabil.
 
     Strategi:
-    1. Hapus sentiment_logs yang terkait artikel lama
-    2. Hapus articles lama berdasarkan scraped_at
+    1. Cari rentang id artikel yang lebih tua dari cutoff (index scraped_at)
+    2. Per potongan `chunk_size` id: (opsional) arsipkan ke Parquet lewat `archiver`,
+       hapus sentiment_logs terkait, lalu articles-nya, lalu commit
+       (transaksi & lock pendek, progres tidak hilang jika gagal di tengah)
 
-    Return dict untuk logging observabilitas pipeline.
+    Return dict untuk logging observabilitas pipeline, termasuk ringkasan durasi chunk
+    (jumlah, total, terlama, median) supaya baris log tetap pendek di backlog besar.
     """
-    try:
-        if retention_days <= 0:
-            retention_days = 30
+    if retention_days <= 0:
+        retention_days = 30
+    if chunk_size <= 0:
+        chunk_size = 5000
 
+    result = {
+        "retention_days": retention_days,
+        "deleted_sentiment_logs": 0,
+        "deleted_articles": 0,
+        "chunks": 0,
+    }
+    chunk_timings_ms = []
+    started = time.perf_counter()
+
+    try:
         cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
 
-        old_article_ids = db.query(Article.id).filter(Article.scraped_at < cutoff)
+        min_id, max_id = db.execute(
+            select(func.min(Article.id), func.max(Article.id)).where(Article.scraped_at < cutoff)
+        ).one()
 
-        deleted_logs = (
-            db.query(SentimentLog)
-            .filter(SentimentLog.article_id.in_(old_article_ids))
-            .delete(synchronize_session=False)
-        )
+        if min_id is not None:
+            # Batas chunk kelipatan chunk_size (bukan mulai dari min_id), supaya run ulang setelah
+            # kegagalan memakai rentang yang sama dan menimpa file arsip yang sama
+            first_start = (min_id // chunk_size) * chunk_size
+            for start in range(first_start, max_id + 1, chunk_size):
+                chunk_started = time.perf_counter()
 
-        deleted_articles = (
-            db.query(Article)
-            .filter(Article.scraped_at < cutoff)
-            .delete(synchronize_session=False)
-        )
+                # Arsip ditulis dulu; kalau gagal, exception membatalkan delete chunk ini
+                if archiver is not None:
+                    archiver.archive_chunk(db, start, start + chunk_size, cutoff)
+                expired_ids = (
+                    select(Article.id)
+                    .where(Article.id >= start, Article.id < start + chunk_size, Article.scraped_at < cutoff)
+                )
 
-        db.commit()
+                result["deleted_sentiment_logs"] += db.execute(
+                    delete(SentimentLog).where(SentimentLog.article_id.in_(expired_ids))
+                ).rowcount
+                result["deleted_articles"] += db.execute(
+                    delete(Article).where(
+                        Article.id >= start, Article.id < start + chunk_size, Article.scraped_at < cutoff
+                    )
+                ).rowcount
+                db.commit()
+
+                result["chunks"] += 1
+                chunk_timings_ms.append(round((time.perf_counter() - chunk_started) * 1000, 1))
+
+        result["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        result.update(_chunk_timing_summary(chunk_timings_ms))
+        if archiver is not None:
+            result.update(archiver.stats)
 
         logger.info(
-            "🧹 Retention cleanup selesai | Hari: %s | SentimentLog terhapus: %s | Article terhapus: %s",
+            "🧹 Retention cleanup selesai | Hari: %s | SentimentLog terhapus: %s | Article terhapus: %s | "
+            "Chunk: %s | Total: %.1f ms | Chunk terlama: %.1f ms",
             retention_days,
-            deleted_logs,
-            deleted_articles,
+            result["deleted_sentiment_logs"],
+            result["deleted_articles"],
+            result["chunks"],
+            result["total_ms"],
+            result["max_chunk_ms"],
         )
 
-        return {
-            "retention_days": retention_days,
-            "deleted_sentiment_logs": deleted_logs,
-            "deleted_articles": deleted_articles,
-        }
+        return result
 
     except Exception as e:
         db.rollback()
         logger.error(f"❌ Gagal menjalankan retention cleanup: {e}")
-        return {
-            "retention_days": retention_days,
-            "deleted_sentiment_logs": 0,
-            "deleted_articles": 0,
-            "error": str(e),
-        }
+        # Chunk yang sudah di-commit tetap terhitung
+        result["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        result.update(_chunk_timing_summary(chunk_timings_ms))
+        if archiver is not None:
+            result.update(archiver.stats)
+        result["error"] = str(e)
+        return result
@@ -1,6 +1,6 @@
 import os
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 from src.data.models import Base
 
@@ -14,10 +14,32 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 engine = create_engine(DATABASE_URL, echo=False)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+class SchemaNotMigratedError(RuntimeError):
+    """Tabel sudah ada tapi kolom dari migrasi belum ditambahkan (migrate_db.py belum dijalankan)."""
+
+
+def check_schema(bind=None):
+    """
+    Pastikan setiap kolom model ada di database. create_all tidak menambah kolom ke tabel
+    yang sudah ada, jadi database lama harus dimigrasi dulu sebelum pipeline/worker jalan.
+    """
+    inspector = inspect(bind or engine)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        missing.extend(f"{table.name}.{column.name}" for column in table.columns if column.name not in existing)
+    if missing:
+        raise SchemaNotMigratedError(
+            f"Skema database belum dimigrasi, kolom hilang: {', '.join(missing)}. Jalankan `python migrate_db.py`."
+        )
+
 def init_db():
     """Fungsi sakti untuk membuat semua tabel"""
     print("Connecting to Cloud Database...")
     Base.metadata.create_all(bind=engine)
+    check_schema()
     print("✅ Success! Tables created in the Cloud successfully.")
 
 def get_db():
@@ -0,0 +1,73 @@
+"""
+Ekstraksi isi artikel dari HTML publisher berbasis lxml.
+Fungsi di modul ini murni (tanpa state) supaya bisa dijalankan di ProcessPoolExecutor
+dan tidak menahan event loop asyncio saat parsing.
+"""
+
+import logging
+from typing import Optional
+from urllib.parse import urlparse
+
+import lxml.html
+from lxml import etree
+
+from src.config.article_selectors import get_body_xpath
+
+logger = logging.getLogger(__name__)
+
+# Paragraf pendek biasanya caption, "Baca juga", atau tombol share
+MIN_PARAGRAPH_CHARS = 50
+# Di bawah ini kemungkinan besar halaman terblokir/paywall atau salah parsing
+MIN_CONTENT_CHARS = 200
+
+_NOISE_TAGS = ("script", "style", "noscript", "iframe", "figure", "figcaption", "aside", "form")
+
+
+def _clean_text(element) -> str:
+    return " ".join(element.text_content().split())
+
+
+def _extract_title(tree) -> Optional[str]:
+    for xpath in ("//meta[@property='og:title']/@content", "//h1"):
+        found = tree.xpath(xpath)
+        if not found:
+            continue
+        title = found[0] if isinstance(found[0], str) else _clean_text(found[0])
+        title = " ".join(title.split())
+        if title:
+            return title
+    return None
+
+
+def extract_article_body(html: str, url: str) -> Optional[dict]:
+    """
+    Ekstrak judul dan isi artikel.
+    Pakai XPath khusus portal jika ada, fallback ke semua <p> yang cukup panjang.
+    Return dict {"url", "title", "content"} atau None jika konten terlalu pendek.
+    """
+    try:
+        tree = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.error(f"Error parsing HTML {url}: {e}")
+        return None
+
+    etree.strip_elements(tree, *_NOISE_TAGS, with_tail=False)
+
+    title = _extract_title(tree)
+    if not title:
+        return None
+
+    domain = urlparse(url).netloc.lower()
+    xpath = get_body_xpath(domain)
+    paragraphs = tree.xpath(xpath) if xpath else []
+    if not paragraphs:
+        paragraphs = tree.iter("p")
+
+    texts = [text for text in (_clean_text(p) for p in paragraphs) if len(text) > MIN_PARAGRAPH_CHARS]
+    content = " ".join(texts)
+
+    if len(content) < MIN_CONTENT_CHARS:
+        logger.warning(f"Konten terlalu pendek untuk {url}, mungkin terblokir atau salah parsing.")
+        return None
+
+    return {"url": url, "title": title, "content": content}
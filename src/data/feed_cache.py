@@ -0,0 +1,90 @@
+"""
+Conditional-GET cache untuk RSS feed.
+Menyimpan validator HTTP (ETag, Last-Modified) dan hash body per feed, sehingga run
+berikutnya bisa mengirim If-None-Match / If-Modified-Since dan melewati parsing
+ketika feed tidak berubah (HTTP 304 atau body identik).
+"""
+
+import hashlib
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+from src.data.local_store import cache_path, load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+# Google News selalu memperbarui <lastBuildDate> walau item-nya sama,
+# jadi tag ini dibuang sebelum body di-hash.
+_VOLATILE_FEED_TAGS = re.compile(rb"<lastBuildDate>[^<]*</lastBuildDate>", re.IGNORECASE)
+
+
+def _body_hash(body: bytes) -> str:
+    return hashlib.sha256(_VOLATILE_FEED_TAGS.sub(b"", body)).hexdigest()
+
+
+class FeedCache:
+    """
+    Penyimpan validator feed di file JSON lokal.
+
+    Entry cache di-update di memori saat feed diambil, tetapi baru ditulis ke disk
+    lewat `save()`. Panggil `save()` setelah artikel berhasil disimpan ke database,
+    supaya run yang gagal di tengah jalan tidak menandai feed sebagai "sudah diproses".
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or cache_path("feed_cache.json")
+        self._entries: Dict[str, dict] = load_json(self.path, {})
+        self.stats = {"not_modified": 0, "unchanged_body": 0, "changed": 0}
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Header If-None-Match / If-Modified-Since untuk feed yang sudah pernah diambil."""
+        entry = self._entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def is_unchanged(self, url: str, status: int, headers: Mapping[str, str], body: Optional[bytes]) -> bool:
+        """
+        Cek respons feed terhadap cache dan perbarui validatornya.
+        Return True jika feed tidak berubah sejak run terakhir (parsing bisa dilewati).
+        """
+        if status == 304:
+            self.stats["not_modified"] += 1
+            logger.info(f"🗂️ Feed tidak berubah (304): {url}")
+            return True
+
+        digest = _body_hash(body or b"")
+        previous = self._entries.get(url, {})
+        self._entries[url] = {
+            "etag": headers.get("ETag") or headers.get("etag"),
+            "last_modified": headers.get("Last-Modified") or headers.get("last-modified"),
+            "body_hash": digest,
+            "fetched_at": time.time(),
+        }
+
+        if previous.get("body_hash") == digest:
+            self.stats["unchanged_body"] += 1
+            logger.info(f"🗂️ Feed identik dengan run sebelumnya: {url}")
+            return True
+
+        self.stats["changed"] += 1
+        return False
+
+    @property
+    def unchanged_feeds(self) -> int:
+        return self.stats["not_modified"] + self.stats["unchanged_body"]
+
+    def save(self) -> None:
+        try:
+            save_json(self.path, self._entries)
+        except OSError as e:
+            logger.warning(f"⚠️ Gagal menyimpan feed cache ke {self.path}: {e}")
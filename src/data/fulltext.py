@@ -0,0 +1,86 @@
+"""
+Tahap opsional "full body": ganti konten artikel (deskripsi RSS) dengan isi berita lengkap.
+
+Alur per artikel:
+1. Resolve link Google News ke URL publisher (async, ter-cache).
+2. Ambil HTML dari cache content-addressed di disk, atau fetch lewat AsyncNewsScraper.
+3. Ekstraksi isi (CPU-bound) dikirim ke ProcessPoolExecutor supaya event loop
+   tetap fokus ke network I/O.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from src.data.extractor import extract_article_body
+from src.data.html_cache import HtmlCache
+from src.data.scraper import AsyncNewsScraper, ScrapedData
+
+logger = logging.getLogger(__name__)
+
+
+async def _enrich_one(
+    scraper: AsyncNewsScraper,
+    pool: ProcessPoolExecutor,
+    html_cache: HtmlCache,
+    article: ScrapedData,
+    publisher_url: str,
+    stats: dict,
+) -> None:
+    if 'news.google.com' in publisher_url:
+        stats["unresolved"] += 1
+        return
+
+    html = html_cache.get(publisher_url)
+    if html is None:
+        html = await scraper.fetch_html(publisher_url)
+        if not html:
+            stats["fetch_failed"] += 1
+            return
+        html_cache.put(publisher_url, html)
+
+    loop = asyncio.get_running_loop()
+    extracted = await loop.run_in_executor(pool, extract_article_body, html, publisher_url)
+    if not extracted:
+        stats["extract_failed"] += 1
+        return
+
+    article.content = extracted["content"]
+    stats["enriched"] += 1
+
+
+async def enrich_with_full_body(
+    articles: List[ScrapedData],
+    max_workers: Optional[int] = None,
+    max_concurrent_requests: int = 20,
+    html_cache: Optional[HtmlCache] = None,
+) -> dict:
+    """
+    Isi `article.content` dengan body lengkap dari halaman publisher (in-place).
+    Artikel yang gagal di-resolve/fetch/ekstrak tetap memakai deskripsi RSS.
+    Return statistik untuk logging pipeline.
+    """
+    stats = {"total": len(articles), "enriched": 0, "unresolved": 0, "fetch_failed": 0, "extract_failed": 0}
+    if not articles:
+        return stats
+
+    html_cache = html_cache or HtmlCache()
+    workers = max_workers or os.cpu_count() or 1
+    # spawn: worker tidak mewarisi event loop / socket aiohttp dari proses induk
+    mp_context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        async with AsyncNewsScraper(max_concurrent_requests=max_concurrent_requests) as scraper:
+            publisher_urls = await scraper.resolve_google_news_links([article.url for article in articles])
+            await asyncio.gather(*(
+                _enrich_one(scraper, pool, html_cache, article, publisher_urls[article.url], stats)
+                for article in articles
+            ))
+
+    html_cache.save()
+    stats["html_cache"] = html_cache.stats
+    logger.info(f"📰 Full-body selesai: {stats}")
+    return stats
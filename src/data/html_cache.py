@@ -0,0 +1,69 @@
+"""
+Cache HTML artikel di disk, content-addressed.
+Setiap halaman disimpan sekali sebagai `objects/<sha[:2]>/<sha>.html.gz`, dan index JSON
+memetakan URL ke hash kontennya. Halaman yang sama dari beberapa URL hanya disimpan sekali.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.data.local_store import cache_path, load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+
+class HtmlCache:
+    def __init__(self, root: Optional[Path] = None):
+        self.root = root or cache_path("html")
+        self.index_path = self.root / "index.json"
+        self._index: Dict[str, str] = load_json(self.index_path, {})
+        self._dirty = False
+        self.stats = {"hits": 0, "misses": 0, "stored": 0}
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.html.gz"
+
+    def get(self, url: str) -> Optional[str]:
+        digest = self._index.get(url)
+        if digest:
+            try:
+                with gzip.open(self._object_path(digest), "rt", encoding="utf-8") as fh:
+                    self.stats["hits"] += 1
+                    return fh.read()
+            except (OSError, EOFError):
+                # Object hilang/rusak: anggap miss dan ambil ulang dari network
+                self._index.pop(url, None)
+                self._dirty = True
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, url: str, html: str) -> str:
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with gzip.open(tmp_path, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, path)
+            self.stats["stored"] += 1
+
+        if self._index.get(url) != digest:
+            self._index[url] = digest
+            self._dirty = True
+        return digest
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            save_json(self.index_path, self._index)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"⚠️ Gagal menyimpan index HTML cache ke {self.index_path}: {e}")
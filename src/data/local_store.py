@@ -0,0 +1,50 @@
+"""
+Helper penyimpanan lokal berbasis file JSON.
+Dipakai oleh cache kecil (feed validator, redirect URL, dll) yang perlu bertahan
+antar cron run tanpa harus membuat tabel baru di database.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Semua cache lokal disimpan di satu folder, bisa dipindah lewat env (misal ke /var/cache di VPS)
+CACHE_DIR = Path(os.getenv("SENTI_CACHE_DIR", ".cache"))
+
+
+def cache_path(filename: str) -> Path:
+    """Path lengkap file cache di dalam CACHE_DIR."""
+    return CACHE_DIR / filename
+
+
+def load_json(path: Path, default: Any) -> Any:
+    """Baca file JSON; kembalikan `default` jika file belum ada atau rusak."""
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        logger.warning(f"⚠️ Cache {path} tidak bisa dibaca, mulai dari kosong: {e}")
+        return default
+
+
+def save_json(path: Path, data: Any) -> None:
+    """Tulis JSON secara atomik (tmp file + rename) agar cron yang terputus tidak merusak cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -1,12 +1,19 @@
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Float, Boolean, ForeignKey, Text, DateTime
+from sqlalchemy import String, Float, Boolean, ForeignKey, Integer, Text, DateTime, Index
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 class Base(DeclarativeBase):
     pass
 
+# Status antrian analisis sentimen di kolom articles.analysis_status
+ANALYSIS_PENDING = "pending"
+ANALYSIS_PROCESSING = "processing"
+ANALYSIS_DONE = "done"
+# Gagal dianalisis berkali-kali (lihat ANALYSIS_MAX_ATTEMPTS di crud.py), tidak di-claim lagi
+ANALYSIS_FAILED = "failed"
+
 class NewsSource(Base):
     __tablename__ = "news_sources"
 
@@ -21,20 +28,38 @@ class NewsSource(Base):
 
 class Article(Base):
     __tablename__ = "articles"
+    __table_args__ = (
+        # Antrian analisis: WHERE analysis_status = 'pending' AND id > :after_id ORDER BY id
+        Index("ix_articles_analysis_status_id", "analysis_status", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     source_id: Mapped[int] = mapped_column(ForeignKey("news_sources.id"))
     url: Mapped[str] = mapped_column(Text, unique=True)
     title: Mapped[str] = mapped_column(Text)
+    # md5 judul ternormalisasi (lowercase, hanya a-z0-9) untuk dedup judul lewat index probe
+    title_norm_hash: Mapped[Optional[str]] = mapped_column(String(32), index=True, nullable=True)
     content: Mapped[str] = mapped_column(Text)
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
-    scraped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    scraped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+    analysis_status: Mapped[str] = mapped_column(
+        String(16), default=ANALYSIS_PENDING, server_default=ANALYSIS_PENDING
+    )
+    # Lease worker analisis: siapa yang meng-claim dan kapan claim kedaluwarsa
+    claimed_by: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    claim_expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Berapa kali artikel sudah di-claim untuk dianalisis (naik setiap claim)
+    analysis_attempts: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     source: Mapped["NewsSource"] = relationship(back_populates="articles")
     sentiment: Mapped["SentimentLog"] = relationship(back_populates="article", uselist=False)
 
 class SentimentLog(Base):
     __tablename__ = "sentiment_logs"
+    __table_args__ = (
+        # Satu log per artikel; juga target ON CONFLICT (article_id) untuk bulk insert
+        Index("ux_sentiment_logs_article_id", "article_id", unique=True),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     article_id: Mapped[int] = mapped_column(ForeignKey("articles.id"))
@@ -44,6 +69,9 @@ class SentimentLog(Base):
     source_credibility: Mapped[float] = mapped_column(Float, default=0.5)
     noise_probability: Mapped[float] = mapped_column(Float, default=0.0)
     integrity_score: Mapped[float] = mapped_column(Float, default=0.0)
+    # Asal label: heuristic | cascade | model | gatekeeper (NULL untuk log lama);
+    # cache hit memakai asal label aslinya
+    label_source: Mapped[Optional[str]] = mapped_column(String(16), nullable=True)
     analyzed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     article: Mapped["Article"] = relationship(back_populates="sentiment")
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Rate limiter token-bucket per domain untuk AsyncNewsScraper.
+Setiap host punya bucket sendiri, jadi publisher berbeda bisa diambil paralel
+sementara satu host tetap menerima trafik yang sopan. Rate tiap host beradaptasi:
+naik perlahan saat sukses, turun drastis saat server membalas 429/503.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenBucket:
+    """Bucket token sederhana; `rate` dalam request per detik."""
+    rate: float
+    capacity: float
+    tokens: float = field(init=False)
+    updated_at: float = field(default_factory=time.monotonic)
+    blocked_until: float = 0.0
+
+    def __post_init__(self):
+        self.tokens = self.capacity
+
+    def reserve(self, now: float) -> float:
+        """
+        Ambil satu token dan kembalikan berapa detik pemanggil harus menunggu.
+        Token boleh "berhutang" (negatif) supaya request yang antre mendapat slot berurutan.
+        Selama blokir Retry-After, jadwal token dimulai dari `blocked_until` dengan maksimal
+        satu token, jadi request yang antre tetap berjarak 1/rate setelah blokir selesai
+        (bukan dilepas bersamaan).
+        """
+        if now < self.blocked_until and self.updated_at < self.blocked_until:
+            self.updated_at = self.blocked_until
+            self.tokens = min(self.tokens, 1.0)
+
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        # updated_at bisa di masa depan (akhir blokir): jadwal dihitung dari titik itu
+        self.updated_at = max(self.updated_at, now)
+        self.tokens -= 1.0
+
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return self.updated_at - now + wait
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Header Retry-After bisa berupa detik ("120") atau HTTP-date. Return detik atau None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class DomainRateLimiter:
+    """
+    Kumpulan TokenBucket per host dengan penyesuaian rate AIMD
+    (additive increase saat sukses, multiplicative decrease saat di-throttle).
+    """
+
+    def __init__(
+        self,
+        default_rate: float = 1.0,
+        burst: float = 2.0,
+        min_rate: float = 0.1,
+        max_rate: float = 4.0,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        default_retry_after: float = 30.0,
+        host_rates: Optional[Dict[str, float]] = None,
+    ):
+        self.default_rate = default_rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.default_retry_after = default_retry_after
+        self.host_rates = host_rates or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(rate=self.host_rates.get(host, self.default_rate), capacity=self.burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, host: str) -> None:
+        """Tunggu sampai host boleh menerima request berikutnya."""
+        wait = self._bucket(host).reserve(time.monotonic())
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record_success(self, host: str) -> None:
+        bucket = self._bucket(host)
+        bucket.rate = min(self.max_rate, bucket.rate + self.increase_step)
+
+    def record_throttle(self, host: str, retry_after: Optional[float] = None) -> None:
+        """Server membalas 429/503: turunkan rate dan hentikan host ini selama Retry-After."""
+        bucket = self._bucket(host)
+        bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+        pause = retry_after if retry_after is not None else self.default_retry_after
+        bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + pause)
+        logger.warning(f"🐢 {host} membatasi request, rate turun ke {bucket.rate:.2f}/s, jeda {pause:.0f}s")
@@ -0,0 +1,70 @@
+"""
+Cache persisten untuk hasil resolve URL artikel Google News.
+Memetakan link news.google.com ke URL publisher asli, dengan TTL dan negative
+caching supaya link yang gagal di-resolve tidak dicoba ulang setiap run.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.data.local_store import cache_path, load_json, save_json
+
+logger = logging.getLogger(__name__)
+
+# URL publisher praktis tidak pernah berubah, jadi hasil sukses disimpan lama.
+POSITIVE_TTL_SECONDS = 30 * 24 * 3600
+# Kegagalan resolve sering bersifat sementara (timeout, 429), jadi dicoba lagi lebih cepat.
+NEGATIVE_TTL_SECONDS = 6 * 3600
+
+
+class RedirectCache:
+    """Map `google_news_url -> resolved_url` (atau None untuk negative cache) di file JSON lokal."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        positive_ttl: int = POSITIVE_TTL_SECONDS,
+        negative_ttl: int = NEGATIVE_TTL_SECONDS,
+    ):
+        self.path = path or cache_path("google_news_redirects.json")
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[str, dict] = load_json(self.path, {})
+        self._dirty = False
+        self.stats = {"hits": 0, "negative_hits": 0, "misses": 0}
+
+    def get(self, url: str) -> Tuple[bool, Optional[str]]:
+        """
+        Return (ditemukan, resolved_url).
+        `resolved_url` None berarti URL ini baru saja gagal di-resolve (negative cache).
+        """
+        entry = self._entries.get(url)
+        if not entry or entry.get("expires_at", 0) < time.time():
+            self.stats["misses"] += 1
+            return False, None
+
+        if entry.get("resolved"):
+            self.stats["hits"] += 1
+        else:
+            self.stats["negative_hits"] += 1
+        return True, entry.get("resolved")
+
+    def set(self, url: str, resolved: Optional[str]) -> None:
+        ttl = self.positive_ttl if resolved else self.negative_ttl
+        self._entries[url] = {"resolved": resolved, "expires_at": time.time() + ttl}
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+
+        # Buang entry kedaluwarsa supaya file tidak tumbuh tanpa batas
+        now = time.time()
+        self._entries = {url: e for url, e in self._entries.items() if e.get("expires_at", 0) >= now}
+        try:
+            save_json(self.path, self._entries)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"⚠️ Gagal menyimpan redirect cache ke {self.path}: {e}")
@@ -4,11 +4,19 @@ import logging
 import cloudscraper
 import time
 import re
-from bs4 import BeautifulSoup
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator
 from datetime import datetime
+from urllib.parse import urlparse
 import random
+from html import unescape
+from io import BytesIO
+from lxml import etree
+
+from src.data.feed_cache import FeedCache
+from src.data.redirect_cache import RedirectCache
+from src.data.rate_limiter import DomainRateLimiter, parse_retry_after
+from src.data.extractor import extract_article_body
 
 # Konfigurasi Logging agar terlihat profesional
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -28,69 +36,113 @@ class AsyncNewsScraper:
     Engine scraping asinkronus (Non-blocking) dengan Rate Limiting.
     """
     
-    def __init__(self, max_concurrent_requests: int = 5):
+    def __init__(
+        self,
+        max_concurrent_requests: int = 10,
+        max_requests_per_host: int = 4,
+        feed_cache: Optional[FeedCache] = None,
+        redirect_cache: Optional[RedirectCache] = None,
+        max_concurrent_redirects: int = 20,
+        rate_limiter: Optional[DomainRateLimiter] = None,
+    ):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
         }
         self.session: Optional[aiohttp.ClientSession] = None
-        # INI LAMPUNYA: Hanya izinkan maksimal 5 request jalan bersamaan
+        # INI LAMPUNYA: Batasi jumlah request yang jalan bersamaan (total semua host)
         self.semaphore = asyncio.Semaphore(max_concurrent_requests)
+        # Jeda sopan santun per host (token bucket adaptif), menggantikan sleep(1) global
+        self.rate_limiter = rate_limiter or DomainRateLimiter()
+        # Lampu lalu lintas per host, supaya satu server tidak dibanjiri request paralel
+        self.max_requests_per_host = max_requests_per_host
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # Validator ETag/Last-Modified untuk feed (opsional)
+        self.feed_cache = feed_cache
+        # Map link Google News -> URL publisher, persisten antar run
+        self.redirect_cache = redirect_cache if redirect_cache is not None else RedirectCache()
+        # Resolve Google News punya jalur sendiri agar tidak antre di belakang fetch artikel
+        self._redirect_semaphore = asyncio.Semaphore(max_concurrent_redirects)
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Ambil (atau buat) semaphore khusus untuk host dari URL."""
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_requests_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    @staticmethod
+    def _extract_redirect_target(html: str, history_locations: List[str]) -> Optional[str]:
+        """Cari URL artikel asli dari halaman Google News. Return None jika tidak ketemu."""
+        # Look for redirect in various formats that Google News uses
+        # Method 1: Check for meta redirect
+        meta_redirect = re.search(r'<meta[^>]+?http-equiv=["\']refresh["\'][^>]*?content=["\']0;url=([^"\']+)', html, re.I)
+        if meta_redirect:
+            redirect_url = meta_redirect.group(1)
+            if 'news.google.com' not in redirect_url:
+                logger.info(f"✓ Resolved (meta redirect): {redirect_url[:70]}...")
+                return redirect_url
+
+        # Method 2: Check for onclick/href in article container
+        # Google News article usually has a link with href to actual article
+        article_link = re.search(r'href=["\']([^"\']*?(?:cnbc|kontan|liputan|kompas|detik|bisnis|antara|finance)[^"\']*?)["\']', html, re.I)
+        if article_link:
+            link = article_link.group(1)
+            if 'news.google.com' not in link and link.startswith('http'):
+                logger.info(f"✓ Resolved (article href): {link[:70]}...")
+                return link
+
+        # Method 3: Check response history for redirect
+        for location in history_locations:
+            if location and 'news.google.com' not in location:
+                logger.info(f"✓ Resolved (response history): {location[:70]}...")
+                return location
+
+        return None
 
-    def _resolve_google_news_redirect(self, url: str) -> str:
-        """Extract actual article URL from Google News article page."""
+    async def _resolve_google_news_redirect(self, url: str) -> str:
+        """Extract actual article URL from Google News article page (non-blocking, dengan cache)."""
         if 'news.google.com' not in url:
             return url  # Bukan Google News URL, langsung return
-        
+
+        found, cached = self.redirect_cache.get(url)
+        if found:
+            return cached or url
+
+        if not self.session:
+            raise RuntimeError("Session belum diinisialisasi. Gunakan 'async with'.")
+
+        resolved = None
         try:
-            import requests
-            # Fetch the Google News article page
-            response = requests.get(
-                url,
-                timeout=8,
-                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-            )
-            
-            if response.status_code != 200:
-                logger.warning(f"Google News page returned {response.status_code}")
-                return url
-            
-            html = response.text
-            
-            # Look for redirect in various formats that Google News uses
-            # Method 1: Check for meta redirect
-            import re
-            meta_redirect = re.search(r'<meta[^>]+?http-equiv=["\']refresh["\'][^>]*?content=["\']0;url=([^"\']+)', html, re.I)
-            if meta_redirect:
-                redirect_url = meta_redirect.group(1)
-                if 'news.google.com' not in redirect_url:
-                    logger.info(f"✓ Resolved (meta redirect): {redirect_url[:70]}...")
-                    return redirect_url
-            
-            # Method 2: Check for onclick/href in article container
-            # Google News article usually has a link with href to actual article
-            article_link = re.search(r'href=["\']([^"\']*?(?:cnbc|kontan|liputan|kompas|detik|bisnis|antara|finance)[^"\']*?)["\']', html, re.I)
-            if article_link:
-                link = article_link.group(1)
-                if 'news.google.com' not in link and link.startswith('http'):
-                    logger.info(f"✓ Resolved (article href): {link[:70]}...")
-                    return link
-            
-            # Method 3: Check response history for redirect
-            if response.history:
-                for resp in response.history:
-                    if resp.status_code in [301, 302, 303, 307, 308]:
-                        location = resp.headers.get('location', '')
-                        if location and 'news.google.com' not in location:
-                            logger.info(f"✓ Resolved (response history): {location[:70]}...")
-                            return location
-            
-            logger.warning(f"Could not extract article URL from Google News page")
-            return url
-            
+            async with self._redirect_semaphore:
+                timeout = aiohttp.ClientTimeout(total=8)
+                async with self.session.get(url, timeout=timeout) as response:
+                    if response.status != 200:
+                        logger.warning(f"Google News page returned {response.status}")
+                    else:
+                        history_locations = [
+                            resp.headers.get('Location', '')
+                            for resp in response.history
+                            if resp.status in (301, 302, 303, 307, 308)
+                        ]
+                        html = await response.text()
+                        resolved = self._extract_redirect_target(html, history_locations)
+                        if not resolved:
+                            logger.warning("Could not extract article URL from Google News page")
         except Exception as e:
             logger.warning(f"Error resolving Google News URL: {str(e)[:60]}")
-            return url
+
+        # Hasil gagal juga disimpan (negative cache, TTL lebih pendek)
+        self.redirect_cache.set(url, resolved)
+        return resolved or url
+
+    async def resolve_google_news_links(self, urls: List[str]) -> Dict[str, str]:
+        """Resolve banyak link Google News sekaligus secara paralel. Return map url -> url asli."""
+        unique_urls = list(dict.fromkeys(urls))
+        resolved = await asyncio.gather(*(self._resolve_google_news_redirect(url) for url in unique_urls))
+        return dict(zip(unique_urls, resolved))
 
     async def __aenter__(self):
         """Context Manager entry"""
@@ -99,6 +151,7 @@ class AsyncNewsScraper:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context Manager exit"""
+        self.redirect_cache.save()
         if self.session:
             await self.session.close()
 
@@ -108,64 +161,220 @@ class AsyncNewsScraper:
             if not self.session:
                 raise RuntimeError("Session belum diinisialisasi. Gunakan 'async with'.")
 
+            # Tunggu giliran host ini DI LUAR semaphore, supaya host lain tetap bisa jalan
+            host = urlparse(url).netloc.lower()
+            await self.rate_limiter.acquire(host)
+
             # Minta izin ke lampu lalu lintas sebelum mengeksekusi request network
             async with self.semaphore:
-                await asyncio.sleep(1) # Jeda sopan santun ke server (1 detik)
-                
-                async with self.session.get(url, timeout=10) as response:
+                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
                     if response.status == 200:
+                        self.rate_limiter.record_success(host)
                         return await response.text()
-                    else:
-                        logger.warning(f"Gagal fetch {url}: Status {response.status}")
-                        return None
+                    if response.status in (429, 503):
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        self.rate_limiter.record_throttle(host, retry_after)
+                    logger.warning(f"Gagal fetch {url}: Status {response.status}")
+                    return None
         except Exception as e:
             logger.error(f"Error koneksi ke {url}: {e}")
             return None
 
     def parse_html(self, html: str, url: str) -> Optional[ScrapedData]:
-        """Logika ekstraksi data menggunakan BeautifulSoup."""
-        try:
-            soup = BeautifulSoup(html, 'lxml') # Untuk HTML web biasa, 'lxml' sudah benar
-            
-            title_tag = soup.find('h1')
-            if not title_tag:
-                return None
-            title = title_tag.get_text(strip=True)
-
-            paragraphs = soup.find_all('p')
-            content_text = " ".join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
-            
-            if len(content_text) < 200:
-                logger.warning(f"Konten terlalu pendek untuk {url}, mungkin terblokir atau salah parsing.")
-                return None
+        """Logika ekstraksi data (lxml + selector per portal, lihat src/data/extractor.py)."""
+        extracted = extract_article_body(html, url)
+        if not extracted:
+            return None
 
-            domain = url.split("//")[-1].split("/")[0]
+        domain = url.split("//")[-1].split("/")[0]
 
-            return ScrapedData(
-                url=url,
-                title=title,
-                content=content_text,
-                source_domain=domain,
-                published_at=datetime.now().isoformat()
-            )
-
-        except Exception as e:
-            logger.error(f"Error parsing HTML {url}: {e}")
-            return None
+        return ScrapedData(
+            url=url,
+            title=extracted["title"],
+            content=extracted["content"],
+            source_domain=domain,
+            published_at=datetime.now().isoformat()
+        )
 
     async def scrape_url(self, url: str) -> Optional[ScrapedData]:
         """Fungsi utama: Resolve redirect (jika Google News) -> Fetch -> Parse"""
         # Jika dari Google News, resolve redirect ke artikel asli terlebih dahulu
-        actual_url = self._resolve_google_news_redirect(url)
+        actual_url = await self._resolve_google_news_redirect(url)
         
         html = await self.fetch_html(actual_url)
         if html:
             return self.parse_html(html, actual_url)
         return None
 
+    def _fetch_feed_with_cloudscraper(self, url: str) -> Optional[bytes]:
+        """Fallback blocking untuk feed yang diproteksi Cloudflare (dijalankan di thread)."""
+        return _get_feed_body(cloudscraper.create_scraper(), url, self.feed_cache)
+
+    async def fetch_feed(self, url: str) -> Optional[bytes]:
+        """
+        Mengambil raw XML RSS feed secara async dengan batas per host.
+        Semua query Google News menuju satu host, jadi feed memakai token bucket yang sama
+        dengan fetch artikel (termasuk jeda Retry-After setelah 429/503).
+        Return None jika gagal, atau jika feed tidak berubah menurut `feed_cache`.
+        """
+        if not self.session:
+            raise RuntimeError("Session belum diinisialisasi. Gunakan 'async with'.")
+
+        headers = self.feed_cache.conditional_headers(url) if self.feed_cache else {}
+        host = urlparse(url).netloc.lower()
+
+        try:
+            # Tunggu giliran host ini DI LUAR semaphore, supaya host lain tetap bisa jalan
+            await self.rate_limiter.acquire(host)
+            async with self.semaphore, self._get_host_semaphore(url):
+                print(f"📡 Mengambil RSS Feed dari: {url}...")
+                timeout = aiohttp.ClientTimeout(total=15)
+                async with self.session.get(url, headers=headers, timeout=timeout) as response:
+                    if response.status in (200, 304):
+                        self.rate_limiter.record_success(host)
+                        body = await response.read() if response.status == 200 else None
+                        if self.feed_cache and self.feed_cache.is_unchanged(url, response.status, response.headers, body):
+                            return None
+                        return body
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if response.status == 429 or (response.status == 503 and retry_after is not None):
+                        # Throttle sungguhan (bukan challenge Cloudflare): hormati Retry-After
+                        self.rate_limiter.record_throttle(host, retry_after)
+                        print(f"⚠️ HTTP {response.status} dari {url}")
+                        return None
+                    if response.status not in (403, 503):
+                        print(f"⚠️ HTTP {response.status} dari {url}")
+                        return None
+
+            # 403/503 biasanya challenge Cloudflare: coba ulang dengan cloudscraper di thread terpisah
+            # agar event loop tetap bebas untuk feed lain.
+            logger.info(f"🛡️ Feed {url} terblokir, fallback ke cloudscraper...")
+            await self.rate_limiter.acquire(host)
+            return await asyncio.to_thread(self._fetch_feed_with_cloudscraper, url)
+        except Exception as e:
+            print(f"⚠️ Error saat membaca RSS {url}: {str(e)[:80]}")
+            return None
+
+    async def _fetch_and_parse_feed(self, url: str) -> List[ScrapedData]:
+        xml_data = await self.fetch_feed(url)
+        if xml_data is None:
+            return []
+        try:
+            articles = list(iter_rss_items(xml_data, url))
+        except (etree.XMLSyntaxError, ValueError) as e:
+            # Body kosong / bukan XML: lewati feed ini saja, feed lain di gather tetap jalan
+            logger.warning(f"⚠️ Feed {url} tidak bisa di-parse sebagai XML: {str(e)[:80]}")
+            return []
+        print(f"✅ Berhasil mengekstrak {len(articles)} artikel dari {url}")
+        return articles
+
+    async def fetch_rss_items(self, rss_urls: list) -> List[ScrapedData]:
+        """Mengambil semua feed sekaligus; urutan hasil mengikuti urutan `rss_urls`."""
+        results = await asyncio.gather(*(self._fetch_and_parse_feed(url) for url in rss_urls))
+        return [article for feed_articles in results for article in feed_articles]
+
 # --- FUNGSI RSS PARSER -------------------------------------------------------
-def parse_rss_items_directly(rss_urls: list) -> list:
-    """Extract article data directly from RSS items without scraping HTML."""
+def _get_feed_body(scraper, url: str, feed_cache: Optional[FeedCache] = None) -> Optional[bytes]:
+    """
+    GET feed lewat session blocking (cloudscraper) dengan conditional headers.
+    Return None jika HTTP error atau feed tidak berubah sejak run terakhir.
+    """
+    headers = feed_cache.conditional_headers(url) if feed_cache else {}
+    response = scraper.get(url, headers=headers, timeout=15)
+
+    if response.status_code not in (200, 304):
+        print(f"⚠️ HTTP {response.status_code} dari {url}")
+        return None
+
+    body = response.content if response.status_code == 200 else None
+    if feed_cache and feed_cache.is_unchanged(url, response.status_code, response.headers, body):
+        return None
+    return body
+
+
+# Hanya cocokkan tag HTML sungguhan, supaya teks seperti "laba < 5%" tidak ikut terhapus
+_HTML_TAG_RE = re.compile(r'<(?:[a-zA-Z/!?][^>]*)>')
+_DOMAIN_RE = re.compile(r'(?:https?://)?(?:www\.)?([^/]+)')
+
+
+def _strip_html(fragment: str) -> str:
+    """
+    Buang tag HTML dan decode entity dalam satu lintasan.
+    Hasilnya setara dengan BeautifulSoup(fragment, "html.parser").get_text(" ", strip=True).
+    """
+    parts = (unescape(chunk).strip() for chunk in _HTML_TAG_RE.split(fragment))
+    return " ".join(part for part in parts if part)
+
+
+def _element_text(element) -> str:
+    if element is None:
+        return ""
+    return "".join(element.itertext()).strip()
+
+
+def _extract_source_domain(link: Optional[str], source_url: str, source_name: str) -> str:
+    """Domain sumber berita: atribut url <source>, lalu nama <source>, lalu domain link item."""
+    if source_url:
+        match = _DOMAIN_RE.search(source_url)
+        if match:
+            return match.group(1)
+    elif source_name:
+        return source_name
+    elif link:
+        # Fallback domain dari link item
+        match = _DOMAIN_RE.search(link)
+        if match:
+            return match.group(1)
+    return "unknown"
+
+
+def iter_rss_items(xml_data: bytes, feed_url: str) -> Iterator[ScrapedData]:
+    """
+    Parser RSS streaming berbasis lxml iterparse.
+    Setiap <item> langsung diubah menjadi ScrapedData lalu dibuang dari memori,
+    sehingga feed besar tidak pernah dibangun utuh sebagai tree.
+    """
+    context = etree.iterparse(BytesIO(xml_data), events=("end",), tag="item", recover=True)
+
+    for _, item in context:
+        try:
+            title_el = item.find("title")
+            link_el = item.find("link")
+            source_el = item.find("source")
+
+            title = _element_text(title_el) if title_el is not None else "No title"
+            link = _element_text(link_el) if link_el is not None else None
+            # Google News description biasanya berisi HTML (<a>, <font>, dll), jadi dibersihkan dulu.
+            description = _strip_html(_element_text(item.find("description")))
+            pubdate_el = item.find("pubDate")
+            pub_date = _element_text(pubdate_el) if pubdate_el is not None else datetime.now().isoformat()
+
+            source_url = (source_el.get("url") or "").strip() if source_el is not None else ""
+            source_name = _element_text(source_el)
+
+            yield ScrapedData(
+                url=link or feed_url,
+                title=title,
+                content=description or title,  # Use description if available, else title
+                source_domain=_extract_source_domain(link, source_url, source_name),
+                published_at=pub_date
+            )
+        except Exception as e:
+            logger.warning(f"Gagal parse item: {str(e)[:50]}")
+        finally:
+            # Bebaskan memori item yang sudah diproses beserta sibling sebelumnya
+            item.clear(keep_tail=True)
+            parent = item.getparent()
+            if parent is not None:
+                while item.getprevious() is not None:
+                    del parent[0]
+
+
+def parse_rss_items_directly(rss_urls: list, feed_cache: Optional[FeedCache] = None) -> list:
+    """
+    Extract article data directly from RSS items without scraping HTML.
+    Jika `feed_cache` diberikan, feed yang tidak berubah (304 / body identik) dilewati.
+    """
     articles = []
     
     scraper = cloudscraper.create_scraper()
@@ -175,64 +384,12 @@ def parse_rss_items_directly(rss_urls: list) -> list:
             print(f"📡 Mengambil RSS Feed dari: {url}...")
             time.sleep(random.uniform(0.3, 0.8))
             
-            response = scraper.get(url, timeout=15)
+            xml_data = _get_feed_body(scraper, url, feed_cache)
             
-            if response.status_code == 200:
-                xml_data = response.text
-                soup = BeautifulSoup(xml_data, "xml")
-                items = soup.find_all("item")
-                
-                count = 0
-                for item in items:
-                    try:
-                        title_el = item.find("title")
-                        link_el = item.find("link")
-                        description_el = item.find("description")
-                        pubdate_el = item.find("pubDate")
-                        source_el = item.find("source")
-                        
-                        title = title_el.text.strip() if title_el else "No title"
-                        link = link_el.text.strip() if link_el else None
-                        description_raw = description_el.text.strip() if description_el else ""
-                        # Google News description biasanya berisi HTML (<a>, <font>, dll), jadi dibersihkan dulu.
-                        description = BeautifulSoup(description_raw, "html.parser").get_text(" ", strip=True)
-                        pub_date = pubdate_el.text.strip() if pubdate_el else datetime.now().isoformat()
-                        
-                        # Extract domain from link
-                        domain = "unknown"
-                        source_url = source_el.get("url", "").strip() if source_el else ""
-                        source_name = source_el.text.strip() if source_el and source_el.text else ""
-
-                        if source_url:
-                            source_domain_match = re.search(r'(?:https?://)?(?:www\.)?([^/]+)', source_url)
-                            if source_domain_match:
-                                domain = source_domain_match.group(1)
-                        elif source_name:
-                            domain = source_name
-                        elif link:
-                            # Fallback domain dari link item
-                            domain_match = re.search(r'(?:https?://)?(?:www\.)?([^/]+)', link)
-                            if domain_match:
-                                domain = domain_match.group(1)
-                        
-                        # Create ScrapedData from RSS item
-                        article = ScrapedData(
-                            url=link or url,
-                            title=title,
-                            content=description or title,  # Use description if available, else title
-                            source_domain=domain,
-                            published_at=pub_date
-                        )
-                        
-                        articles.append(article)
-                        count += 1
-                    except Exception as e:
-                        logger.warning(f"Gagal parse item: {str(e)[:50]}")
-                        continue
-                
-                print(f"✅ Berhasil mengekstrak {count} artikel dari {url}")
-            else:
-                print(f"⚠️ HTTP {response.status_code} dari {url}")
+            if xml_data is not None:
+                feed_articles = list(iter_rss_items(xml_data, url))
+                articles.extend(feed_articles)
+                print(f"✅ Berhasil mengekstrak {len(feed_articles)} artikel dari {url}")
                 
         except Exception as e:
             print(f"⚠️ Error saat membaca RSS {url}: {str(e)[:80]}")
@@ -241,10 +398,33 @@ def parse_rss_items_directly(rss_urls: list) -> list:
     return articles
 
 
-def fetch_rss_links(rss_urls: list) -> list:
+async def parse_rss_items_concurrently(
+    rss_urls: list,
+    max_concurrent_requests: int = 20,
+    max_requests_per_host: int = 4,
+    feed_cache: Optional[FeedCache] = None,
+) -> list:
+    """
+    Versi async dari `parse_rss_items_directly`.
+    Semua feed diambil bersamaan lewat satu sesi aiohttp, sehingga durasi fase fetch
+    kira-kira sama dengan feed paling lambat, bukan jumlah semua feed.
+    """
+    async with AsyncNewsScraper(
+        max_concurrent_requests=max_concurrent_requests,
+        max_requests_per_host=max_requests_per_host,
+        feed_cache=feed_cache,
+    ) as scraper:
+        articles = await scraper.fetch_rss_items(rss_urls)
+
+    print(f"\n📊 Total: {len(articles)} artikel diektrak langsung dari RSS items")
+    return articles
+
+
+def fetch_rss_links(rss_urls: list, feed_cache: Optional[FeedCache] = None) -> list:
     """Menyedot ratusan link artikel terbaru dari RSS Feed, with error handling & Cloudflare bypass."""
     all_links = []
     successful_feeds = 0
+    unchanged_feeds = 0
     failed_feeds = []
     
     # Gunakan cloudscraper untuk bypass Cloudflare challenges
@@ -255,21 +435,22 @@ def fetch_rss_links(rss_urls: list) -> list:
             print(f"📡 Mengambil RSS Feed dari: {url}...")
             time.sleep(random.uniform(0.3, 0.8))  # Sopan santun ke server
             
-            response = scraper.get(url, timeout=15)
+            headers = feed_cache.conditional_headers(url) if feed_cache else {}
+            response = scraper.get(url, headers=headers, timeout=15)
             
-            if response.status_code == 200:
-                xml_data = response.text
-                
-                # Gunakan "xml" parser untuk RSS/Atom feeds
-                soup = BeautifulSoup(xml_data, "xml")
-                
-                items = soup.find_all("item")
-                
+            if response.status_code in (200, 304):
+                body = response.content if response.status_code == 200 else None
+                if feed_cache and feed_cache.is_unchanged(url, response.status_code, response.headers, body):
+                    # Feed sama dengan run sebelumnya: tidak perlu parse ulang
+                    unchanged_feeds += 1
+                    successful_feeds += 1
+                    continue
+
                 count = 0
-                for item in items:
-                    link = item.find("link")
-                    if link and link.text:
-                        all_links.append(link.text.strip())
+                for article in iter_rss_items(body, url):
+                    # Item tanpa <link> jatuh ke URL feed; itu bukan link artikel
+                    if article.url != url:
+                        all_links.append(article.url)
                         count += 1
                         
                 print(f"✅ Berhasil mendapatkan {count} link dari {url}")
@@ -282,9 +463,9 @@ def fetch_rss_links(rss_urls: list) -> list:
             failed_feeds.append((url, str(e)[:50]))
     
     unique_links = list(set(all_links))
-    print(f"\n📊 RSS Summary: {successful_feeds} feeds OK, {len(failed_feeds)} feeds failed, {len(unique_links)} total unique links")
+    print(f"\n📊 RSS Summary: {successful_feeds} feeds OK ({unchanged_feeds} unchanged), {len(failed_feeds)} feeds failed, {len(unique_links)} total unique links")
     
-    if not unique_links:
+    if not unique_links and not unchanged_feeds:
         print("⚠️ WARNING: No RSS links fetched! Pipeline may have limited data.")
     
     return unique_links
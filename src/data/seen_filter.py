@@ -0,0 +1,136 @@
+"""
+Filter "sudah pernah dilihat" sebelum menyentuh database.
+
+Menyimpan hash 64-bit dari URL dan judul ternormalisasi setiap artikel yang sudah
+ada di tabel `articles`, dalam array terurut yang ringkas (8 byte per key).
+Item RSS yang URL atau judulnya sudah dikenal langsung dibuang, sehingga hanya
+artikel yang benar-benar baru yang masuk ke `save_article`.
+
+Filter dipersist ke disk dan di-warm ulang dari database jika sudah terlalu tua,
+supaya tetap sinkron dengan retention cleanup dan insert dari proses lain.
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterable, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.data.crud import normalize_title
+from src.data.local_store import cache_path
+from src.data.models import Article
+from src.data.scraper import ScrapedData
+
+logger = logging.getLogger(__name__)
+
+# Header file: versi format + waktu warm terakhir dari DB (epoch detik)
+_HEADER = struct.Struct("<Id")
+_FORMAT_VERSION = 1
+
+
+def _key_hash(prefix: str, value: str) -> int:
+    digest = hashlib.blake2b(f"{prefix}:{value}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _item_keys(url: str, title: str) -> Iterable[int]:
+    yield _key_hash("u", url)
+    normalized = normalize_title(title)
+    # Judul tanpa huruf latin/angka menjadi string kosong; jangan dijadikan key
+    # karena semua judul seperti itu akan dianggap sama.
+    if normalized:
+        yield _key_hash("t", normalized)
+
+
+class SeenFilter:
+    """Sorted hash array (exact membership, tanpa false negative; peluang tabrakan ~N/2^64)."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or cache_path("seen_articles.bin")
+        self._sorted = array("Q")
+        self._pending: Set[int] = set()
+        self.warmed_at = 0.0
+        self.stats = {"checked": 0, "seen": 0}
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._pending)
+
+    def _contains(self, key: int) -> bool:
+        if key in self._pending:
+            return True
+        idx = bisect_left(self._sorted, key)
+        return idx < len(self._sorted) and self._sorted[idx] == key
+
+    def is_seen(self, item: ScrapedData) -> bool:
+        self.stats["checked"] += 1
+        seen = any(self._contains(key) for key in _item_keys(item.url, item.title))
+        if seen:
+            self.stats["seen"] += 1
+        return seen
+
+    def add(self, item: ScrapedData) -> None:
+        self._pending.update(_item_keys(item.url, item.title))
+
+    def _compact(self) -> None:
+        if self._pending:
+            merged = sorted(set(self._sorted).union(self._pending))
+            self._sorted = array("Q", merged)
+            self._pending.clear()
+
+    def warm_from_db(self, db: Session, batch_size: int = 5000) -> None:
+        """Bangun ulang filter dari semua (url, title) di tabel articles dalam satu query streaming."""
+        keys: Set[int] = set()
+        rows = db.execute(select(Article.url, Article.title).execution_options(yield_per=batch_size))
+        for url, title in rows:
+            keys.update(_item_keys(url, title))
+
+        self._sorted = array("Q", sorted(keys))
+        self._pending.clear()
+        self.warmed_at = time.time()
+        logger.info(f"🧮 Seen-filter di-warm dari database: {len(self._sorted)} key")
+
+    def load(self) -> bool:
+        try:
+            with open(self.path, "rb") as fh:
+                version, warmed_at = _HEADER.unpack(fh.read(_HEADER.size))
+                if version != _FORMAT_VERSION:
+                    return False
+                data = array("Q")
+                data.frombytes(fh.read())
+        except (OSError, struct.error, ValueError):
+            return False
+
+        self._sorted = data
+        self._pending.clear()
+        self.warmed_at = warmed_at
+        return True
+
+    def save(self) -> None:
+        self._compact()
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as fh:
+                fh.write(_HEADER.pack(_FORMAT_VERSION, self.warmed_at))
+                fh.write(self._sorted.tobytes())
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"⚠️ Gagal menyimpan seen-filter ke {self.path}: {e}")
+
+    @classmethod
+    def load_or_warm(cls, db: Session, max_age_hours: float = 24.0, path: Optional[Path] = None) -> "SeenFilter":
+        """Pakai file persisten jika masih segar, selain itu warm ulang dari database."""
+        seen_filter = cls(path)
+        if seen_filter.load() and time.time() - seen_filter.warmed_at < max_age_hours * 3600:
+            logger.info(f"🧮 Seen-filter dimuat dari {seen_filter.path}: {len(seen_filter)} key")
+            return seen_filter
+
+        seen_filter.warm_from_db(db)
+        return seen_filter
@@ -3,10 +3,17 @@ import json
 import logging
 import os
 from src.data.database import init_db, get_db
-from src.data.scraper import parse_rss_items_directly
-from src.data.crud import save_article, get_unprocessed_articles, save_sentiment_log, cleanup_old_data
-from src.analysis.sentiment import TruthEngineAI
+from src.data.scraper import parse_rss_items_concurrently
+from src.data.feed_cache import FeedCache
+from src.data.fulltext import enrich_with_full_body
+from src.data.seen_filter import SeenFilter
+from src.data.archive import ArticleArchiver
+from src.data.crud import (
+    save_articles_bulk, claim_articles, cleanup_old_data, preload_sources,
+)
+from src.analysis.inference_server import get_inference_engine
 from src.bot.summary_broadcaster import broadcast_summary
+from src.worker import make_worker_id, process_claimed_batch
 
 # Setup Logging Profesional
 logging.basicConfig(
@@ -36,51 +43,104 @@ async def run_pipeline():
     
     # 3. Extract artikel langsung dari RSS items (tidak perlu scraping HTML lagi)
     # Google News RSS sudah berisi title, description, link, pubDate
+    # Semua feed diambil paralel, jadi menambah feed tidak menambah durasi secara linear
     logger.info("📰 Mengekstrak artikel dari RSS feed items...")
-    articles = parse_rss_items_directly(rss_sources)
+    # Feed yang tidak berubah sejak run terakhir (304 / body identik) tidak di-parse ulang
+    feed_cache = FeedCache()
+    articles = await parse_rss_items_concurrently(rss_sources, feed_cache=feed_cache)
     logger.info(f"✅ Berhasil mengekstrak {len(articles)} artikel dari RSS.")
     
-    # Handle case where RSS fetch fails (e.g., blocked by Cloudflare in GitHub Actions)
-    if len(articles) == 0:
+    if len(articles) == 0 and feed_cache.unchanged_feeds:
+        # Run sepi: tidak ada berita baru, tapi antrian analisis, cleanup, dan broadcast tetap jalan
+        logger.info(f"🗂️ {feed_cache.unchanged_feeds} feed tidak berubah sejak run terakhir. Lewati fase ingest.")
+    elif len(articles) == 0:
+        # Handle case where RSS fetch fails (e.g., blocked by Cloudflare in GitHub Actions)
         logger.warning("⚠️ PERINGATAN: Tidak ada artikel yang diektrak dari RSS feeds!")
         logger.warning("Penyebab: RSS feeds mungkin diblokir (Cloudflare/WAF), redirect, atau tidak tersedia.")
         logger.info("Pipeline akan dilewati untuk run ini. Akan dicoba ulang pada run berikutnya.")
         return  # Exit gracefully instead of failing
-
-    logger.info(f"Sample extracted content: {articles[0].content[:100]}")
+    else:
+        logger.info(f"Sample extracted content: {articles[0].content[:100]}")
 
     # 3. Load (Saving to DB)
     db_gen = get_db()
     db = next(db_gen)
     
     try:
-        # Simpan artikel
-        for item in articles:
-            save_article(db, item)
+        # Semua news_sources dimuat sekali; lookup domain/kredibilitas berikutnya tanpa query
+        source_count = preload_sources(db)
+        logger.info(f"🗂️ Cache sumber berita dimuat: {source_count} domain.")
+
+        # Buang artikel yang URL / judulnya sudah dikenal SEBELUM query ke database
+        if articles:
+            seen_filter = SeenFilter.load_or_warm(db)
+            new_articles = [item for item in articles if not seen_filter.is_seen(item)]
+            logger.info(
+                f"🧮 Seen-filter: {len(articles) - len(new_articles)} artikel sudah dikenal, "
+                f"{len(new_articles)} kandidat baru."
+            )
+        else:
+            new_articles = []
+
+        # Opsional: ganti deskripsi RSS dengan isi berita lengkap dari halaman publisher
+        if new_articles and os.getenv("FULL_BODY_ENABLED", "false").lower() in ("1", "true", "yes"):
+            logger.info("📰 Mengambil isi lengkap artikel dari publisher (FULL_BODY_ENABLED)...")
+            await enrich_with_full_body(new_articles)
+
+        # Simpan artikel dalam beberapa round-trip (bulk insert, bukan commit per artikel)
+        save_result = save_articles_bulk(db, new_articles)
+        ingest_failed = "error" in save_result
+
+        if articles and not ingest_failed:
+            # Bulk insert sukses: setiap item tersimpan atau dikonfirmasi duplikat oleh DB.
+            # Jika gagal, filter tidak diubah supaya artikelnya dicoba lagi run berikutnya.
+            for item in new_articles:
+                seen_filter.add(item)
+            seen_filter.save()
+
+        # Validator feed baru disimpan hanya jika artikel masuk DB, supaya run yang
+        # insert-nya gagal tidak mendapat 304 dan tetap mengambil ulang feed-nya
+        if ingest_failed:
+            logger.warning("⚠️ Bulk insert gagal, validator feed tidak disimpan. Feed diambil ulang run berikutnya.")
+        else:
+            feed_cache.save()
             
         # --- FASE 2: AI SENTIMENT ANALYSIS ---
         logger.info("🔍 Memulai Fase AI: Analisis Sentimen (Truth Engine)...")
         
-        unprocessed_articles = get_unprocessed_articles(db, limit=100)
-        
-        if not unprocessed_articles:
-            logger.info("✅ Semua artikel sudah dianalisis. Tidak ada antrian baru.")
-        else:
-            # Panggil model AI HANYA JIKA ada artikel yang harus dianalisis
-            # Ini menghemat memory jika tidak ada data baru
-            ai_engine = TruthEngineAI()
-            
-            for article in unprocessed_articles:
-                logger.info(f"Menganalisis: {article.title[:40]}...")
-                
-                # Ambil credibility score dari sumber artikel
-                source_credibility = article.source.credibility_score
-                
-                # Eksekusi AI dengan credibility score
-                analysis_result = ai_engine.analyze(article.content, source_credibility)
-                
-                # Simpan ke Database
-                save_sentiment_log(db, article.id, analysis_result)
+        # Claim (bukan sekadar SELECT) supaya run cron yang tumpang tindih / src.worker
+        # tidak menganalisis artikel yang sama
+        worker_id = make_worker_id()
+        try:
+            unprocessed_articles = claim_articles(db, worker_id, limit=100)
+
+            if not unprocessed_articles:
+                logger.info("✅ Semua artikel sudah dianalisis. Tidak ada antrian baru.")
+            else:
+                # Panggil model AI HANYA JIKA ada artikel yang harus dianalisis
+                # Ini menghemat memory jika tidak ada data baru.
+                # Daemon inferensi (jika hidup) dipakai supaya model tidak dimuat ulang tiap cron run
+                ai_engine = get_inference_engine()
+
+                # Credibility diambil dari cache sumber, hasil disimpan per artikel
+                process_claimed_batch(db, ai_engine, worker_id, unprocessed_articles)
+
+                # Lewat daemon: statistik daemon (kumulatif sejak start), selain itu proses ini
+                engine_stats = ai_engine.stats()
+                if engine_stats["inference_cache"] is not None:
+                    logger.info(
+                        "PIPELINE_INFERENCE_CACHE_METRICS=%s",
+                        json.dumps(engine_stats["inference_cache"], ensure_ascii=False),
+                    )
+                if engine_stats["cascade"] is not None:
+                    logger.info(
+                        "PIPELINE_CASCADE_METRICS=%s",
+                        json.dumps(engine_stats["cascade"], ensure_ascii=False),
+                    )
+        except Exception as e:
+            # Claim sudah dilepas oleh process_claimed_batch; cleanup & broadcast tetap jalan
+            db.rollback()
+            logger.error(f"❌ Fase analisis sentimen gagal, dilanjutkan ke cleanup & broadcast: {e}")
                 
         # --- FASE 3: RETENTION CLEANUP ---
         retention_days_raw = os.getenv("RETENTION_DAYS", "30")
@@ -90,7 +150,19 @@ async def run_pipeline():
             logger.warning("⚠️ RETENTION_DAYS tidak valid (%s). Fallback ke 30 hari.", retention_days_raw)
             retention_days = 30
 
-        cleanup_result = cleanup_old_data(db, retention_days=retention_days)
+        chunk_size_raw = os.getenv("RETENTION_CHUNK_SIZE", "5000")
+        try:
+            chunk_size = int(chunk_size_raw)
+        except ValueError:
+            logger.warning("⚠️ RETENTION_CHUNK_SIZE tidak valid (%s). Fallback ke 5000 artikel.", chunk_size_raw)
+            chunk_size = 5000
+
+        # Opsional: arsipkan data kedaluwarsa ke Parquet sebelum dihapus
+        archiver = ArticleArchiver() if os.getenv("ARCHIVE_DIR") else None
+
+        cleanup_result = cleanup_old_data(
+            db, retention_days=retention_days, chunk_size=chunk_size, archiver=archiver
+        )
         logger.info("🧾 Ringkasan cleanup: %s", cleanup_result)
         logger.info(
             "PIPELINE_CLEANUP_METRICS=%s",
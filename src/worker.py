@@ -0,0 +1,198 @@
+"""
+Worker analisis sentimen paralel.
+
+Setiap proses worker meng-claim batch artikel pending lewat claim_articles
+(FOR UPDATE SKIP LOCKED), jadi beberapa worker di satu atau beberapa node
+tidak pernah menganalisis artikel yang sama. Claim yang ditinggal worker crash
+kedaluwarsa setelah --lease-seconds dan diambil worker lain. Artikel yang sudah
+di-claim ANALYSIS_MAX_ATTEMPTS kali tanpa berhasil ditandai 'failed'.
+
+Setiap proses memuat model sendiri (kecuali memakai daemon inferensi), jadi core CPU dibagi:
+default `cpu_count // --workers` thread per proses (--threads-per-worker untuk mengubahnya).
+Tanpa pembagian, N proses x thread torch default (= semua core) saling berebut CPU.
+
+Contoh:
+    python -m src.worker --workers 4
+    python -m src.worker --workers 2 --follow --poll-interval 30
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.analysis.inference_pool import default_threads_per_worker, limit_process_threads
+from src.data.crud import (
+    claim_articles, release_article_claims, save_sentiment_logs, preload_sources, get_source_credibility,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def make_worker_id() -> str:
+    """ID unik per proses (muat di kolom claimed_by VARCHAR(64))."""
+    return f"{socket.gethostname()[:40]}-{os.getpid()}"
+
+
+def _analyze_articles(ai_engine, worker_id: str, articles, credibilities) -> list:
+    """
+    analyze_batch untuk seluruh batch; jika gagal, ulangi per artikel supaya satu teks
+    bermasalah tidak ikut menggagalkan artikel lain. Return pasangan (article_id, hasil)
+    untuk artikel yang berhasil dianalisis.
+    """
+    try:
+        analysis_results = ai_engine.analyze_batch([article.content for article in articles], credibilities)
+        return [(article.id, analysis_result) for article, analysis_result in zip(articles, analysis_results)]
+    except Exception as e:
+        logger.error(f"❌ [{worker_id}] Analisis batch gagal ({e}), diulang per artikel...")
+
+    results = []
+    for article, credibility in zip(articles, credibilities):
+        try:
+            results.append((article.id, ai_engine.analyze(article.content, credibility)))
+        except Exception as e:
+            logger.error(f"❌ [{worker_id}] Artikel ID {article.id} gagal dianalisis: {e}")
+    return results
+
+
+def process_claimed_batch(db, ai_engine, worker_id: str, articles) -> int:
+    """
+    Analisis satu batch artikel yang sudah di-claim worker ini, lalu simpan sekaligus.
+
+    Artikel yang gagal dianalisis, atau seluruh batch jika penyimpanan gagal, langsung dilepas
+    kembali ke antrian (atau ditandai 'failed' jika batas percobaan habis).
+    Return jumlah artikel yang tersimpan.
+    """
+    article_ids = [article.id for article in articles]
+    try:
+        logger.info(f"[{worker_id}] Menganalisis {len(articles)} artikel...")
+        credibilities = [get_source_credibility(db, article.source_id) for article in articles]
+        results = _analyze_articles(ai_engine, worker_id, articles, credibilities)
+
+        # Satu INSERT ... ON CONFLICT untuk seluruh batch (bukan SELECT + INSERT + commit per artikel)
+        summary = save_sentiment_logs(db, results)
+    except BaseException:
+        # Sisa batch langsung kembali ke antrian untuk worker lain, lalu error diteruskan
+        release_article_claims(db, worker_id, article_ids)
+        raise
+
+    if "error" in summary:
+        # save_sentiment_logs sudah rollback: jangan biarkan batch ter-claim sampai lease habis
+        release_article_claims(db, worker_id, article_ids)
+        return 0
+
+    analyzed_ids = {article_id for article_id, _ in results}
+    failed_ids = [article_id for article_id in article_ids if article_id not in analyzed_ids]
+    if failed_ids:
+        release_article_claims(db, worker_id, failed_ids)
+    return len(results)
+
+
+def analyze_claimed_articles(db, ai_engine, worker_id: str, batch_size: int = 50,
+                             lease_seconds: int = 600, max_batches: int = None) -> int:
+    """
+    Claim -> analisis -> simpan, batch demi batch sampai antrian kosong
+    (atau `max_batches` tercapai). Return jumlah artikel yang dianalisis.
+    """
+    analyzed = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        articles = claim_articles(db, worker_id, limit=batch_size, lease_seconds=lease_seconds)
+        if not articles:
+            break
+        batches += 1
+        analyzed += process_claimed_batch(db, ai_engine, worker_id, articles)
+
+    return analyzed
+
+
+def _run_worker(index: int, batch_size: int, lease_seconds: int, follow: bool, poll_interval: float,
+                threads: int) -> int:
+    # Sebelum model (torch/onnxruntime) di-import di proses ini
+    limit_process_threads(threads)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - [%(module)s] - %(message)s'
+    )
+    # Import di dalam proses worker: engine SQLAlchemy & model tidak boleh dibagi antar proses
+    from src.data.database import SessionLocal, check_schema
+    from src.analysis.inference_server import get_inference_engine
+
+    # Skema lama (migrate_db.py belum dijalankan) tidak punya kolom antrian: gagal di awal
+    check_schema()
+    worker_id = make_worker_id()
+    db = SessionLocal()
+    analyzed = 0
+    ai_engine = None
+
+    try:
+        preload_sources(db)
+        # Semua worker berbagi daemon inferensi jika hidup (request mereka digabung jadi satu batch)
+        ai_engine = get_inference_engine()
+        logger.info(f"👷 Worker #{index} ({worker_id}) siap ({threads} thread CPU).")
+
+        while True:
+            try:
+                analyzed += analyze_claimed_articles(db, ai_engine, worker_id, batch_size, lease_seconds)
+            except Exception as e:
+                # Mis. database tidak bisa dihubungi: mode --follow mencoba lagi di polling berikutnya
+                logger.error(f"❌ Worker #{index} ({worker_id}) gagal memproses antrian: {e}")
+            if not follow:
+                break
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        logger.info(f"🛑 Worker #{index} ({worker_id}) dihentikan.")
+    finally:
+        release_article_claims(db, worker_id)
+        db.close()
+
+    engine_stats = ai_engine.stats() if ai_engine else {"inference_cache": None, "cascade": None}
+    cache_summary, cascade_summary = engine_stats["inference_cache"], engine_stats["cascade"]
+    logger.info(
+        f"✅ Worker #{index} ({worker_id}) selesai: {analyzed} artikel. "
+        f"Inference cache: {cache_summary}. Cascade: {cascade_summary}"
+    )
+    return analyzed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker analisis sentimen paralel Senti-Quant")
+    parser.add_argument("--workers", type=int, default=1, help="Jumlah proses worker (default: 1)")
+    parser.add_argument("--batch-size", type=int, default=50, help="Artikel per claim (default: 50)")
+    parser.add_argument("--lease-seconds", type=int, default=600, help="Durasi lease claim (default: 600)")
+    parser.add_argument("--follow", action="store_true", help="Terus polling antrian, jangan berhenti saat kosong")
+    parser.add_argument("--poll-interval", type=float, default=30.0, help="Jeda polling dalam detik (mode --follow)")
+    parser.add_argument("--threads-per-worker", type=int, default=None,
+                        help="Thread CPU inferensi per proses (default: jumlah core / --workers)")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - [%(module)s] - %(message)s'
+    )
+
+    workers = max(1, args.workers)
+    threads = max(1, args.threads_per_worker or default_threads_per_worker(workers))
+    started = time.perf_counter()
+
+    # spawn: setiap worker memuat model & koneksi DB sendiri
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [
+            pool.submit(
+                _run_worker, index, args.batch_size, args.lease_seconds, args.follow, args.poll_interval, threads
+            )
+            for index in range(workers)
+        ]
+        total = sum(future.result() for future in futures)
+
+    elapsed = time.perf_counter() - started
+    rate = total / elapsed if elapsed > 0 else 0.0
+    logger.info(f"🏁 {workers} worker selesai: {total} artikel dalam {elapsed:.1f}s ({rate:.2f} artikel/detik).")
+
+
+if __name__ == "__main__":
+    main()
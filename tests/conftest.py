@@ -0,0 +1,12 @@
+import sys
+from pathlib import Path
+
+# Add project root to sys.path so `src` imports resolve when running tests directly
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "postgres: butuh Postgres sungguhan (set TEST_DATABASE_URL), dilewati jika tidak ada"
+    )
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from src.data import crud
+from src.data.archive import ArticleArchiver, load_archive
+from src.data.crud import cleanup_old_data
+from src.data.models import Article, Base, NewsSource, SentimentLog
+
+SCRAPED_AT = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0) - timedelta(days=40)
+
+
+def _add_articles(db, ids, scraped_at=SCRAPED_AT):
+    db.add_all(
+        Article(id=i, source_id=1, url=f"https://example.com/{i}", title=f"Judul {i}", content=f"isi {i}",
+                scraped_at=scraped_at)
+        for i in ids
+    )
+    db.add_all(SentimentLog(article_id=i, sentiment_score=0.0, sentiment_label="NEUTRAL", confidence=0.5,
+                            label_source="model") for i in ids)
+    db.commit()
+
+
+@pytest.fixture
+def Session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'archive.db'}")
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(engine)
+    with Session() as db:
+        db.add(NewsSource(id=1, domain="example.com", name="example.com", credibility_score=0.5))
+        db.commit()
+    crud.invalidate_source_cache()
+    yield Session
+    engine.dispose()
+
+
+def _archived_ids(root):
+    return sorted(load_archive(root).to_table(columns=["article_id"])["article_id"].to_pylist())
+
+
+def test_second_cleanup_in_same_chunk_keeps_earlier_archive(Session, tmp_path):
+    root = tmp_path / "archive"
+    with Session() as db:
+        _add_articles(db, [1, 2])
+        first = cleanup_old_data(db, retention_days=30, archiver=ArticleArchiver(root))
+        # Artikel baru yang kedaluwarsa di tanggal & chunk yang sama
+        _add_articles(db, [3, 4])
+        second = cleanup_old_data(db, retention_days=30, archiver=ArticleArchiver(root))
+        remaining = db.scalar(select(func.count()).select_from(Article))
+
+    assert first["deleted_articles"] == 2
+    assert second["deleted_articles"] == 2
+    assert remaining == 0
+    assert _archived_ids(root) == [1, 2, 3, 4]
+    assert len(list(root.glob("date=*/*.parquet"))) == 1
+
+
+def test_rearchiving_chunk_before_delete_does_not_duplicate(Session, tmp_path):
+    # Cleanup gagal setelah arsip ditulis tapi sebelum delete di-commit, lalu dijalankan ulang
+    root = tmp_path / "archive"
+    cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+    with Session() as db:
+        _add_articles(db, [1, 2])
+        ArticleArchiver(root).archive_chunk(db, 0, 5000, cutoff)
+        ArticleArchiver(root).archive_chunk(db, 0, 5000, cutoff)
+
+    assert _archived_ids(root) == [1, 2]
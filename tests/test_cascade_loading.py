@@ -0,0 +1,38 @@
+import logging
+import pickle
+
+import pytest
+
+from src.analysis.cascade import load_cascade
+
+
+class StubEstimator:
+    classes_ = ["NEGATIVE", "NEUTRAL", "POSITIVE"]
+
+    def predict_proba(self, texts):
+        return [[0.1, 0.1, 0.8] for _ in texts]
+
+
+def _write(path, payload):
+    path.write_bytes(pickle.dumps(payload))
+    return path
+
+
+def test_valid_payload_loads(tmp_path):
+    path = _write(tmp_path / "cascade.pkl", {"estimator": StubEstimator(), "metadata": {"samples": 10}})
+    cascade = load_cascade(path, threshold=0.9, shadow_rate=0.0)
+    assert cascade is not None
+    assert cascade.threshold == 0.9
+
+
+@pytest.mark.parametrize("payload", [
+    {"metadata": {}},                                # tanpa estimator
+    {"estimator": object(), "metadata": {}},         # bukan classifier
+    {"estimator": StubEstimator(), "metadata": []},  # metadata rusak
+    [StubEstimator()],                               # format lain sama sekali
+])
+def test_malformed_payload_disables_cascade(tmp_path, caplog, payload):
+    path = _write(tmp_path / "cascade.pkl", payload)
+    with caplog.at_level(logging.WARNING, logger="src.analysis.cascade"):
+        assert load_cascade(path, threshold=0.9, shadow_rate=0.0) is None
+    assert "cascade nonaktif" in caplog.text
@@ -0,0 +1,68 @@
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from src.data.rate_limiter import DomainRateLimiter
+from src.data.scraper import AsyncNewsScraper
+
+
+async def _fetch_with_server(responses, fetches=1, cloudscraper_body=None):
+    """Jalankan feed server lokal yang membalas `responses` berurutan; return (bodies, scraper, host, fallbacks)."""
+    replies = iter(responses)
+
+    async def handler(request):
+        status, headers = next(replies)
+        return web.Response(status=status, headers=headers, body=b"<rss/>" if status == 200 else b"")
+
+    app = web.Application()
+    app.router.add_get("/rss", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    host = f"127.0.0.1:{runner.addresses[0][1]}"
+
+    fallbacks = []
+    limiter = DomainRateLimiter(default_rate=2.0, burst=5.0)
+    try:
+        async with AsyncNewsScraper(rate_limiter=limiter) as scraper:
+            def fake_cloudscraper(url):
+                fallbacks.append(url)
+                return cloudscraper_body
+
+            scraper._fetch_feed_with_cloudscraper = fake_cloudscraper
+            bodies = [await scraper.fetch_feed(f"http://{host}/rss") for _ in range(fetches)]
+    finally:
+        await runner.cleanup()
+    return bodies, limiter, host, fallbacks
+
+
+def test_feed_fetch_uses_host_token_bucket():
+    bodies, limiter, host, _ = asyncio.run(_fetch_with_server([(200, {}), (200, {})], fetches=2))
+
+    assert bodies == [b"<rss/>", b"<rss/>"]
+    bucket = limiter._buckets[host]
+    # Dua token terpakai dari bucket host feed, dan sukses menaikkan rate (AIMD)
+    assert bucket.tokens < limiter.burst - 1.5
+    assert bucket.rate == pytest.approx(2.2)
+
+
+def test_feed_429_blocks_host_for_retry_after():
+    bodies, limiter, host, fallbacks = asyncio.run(_fetch_with_server([(429, {"Retry-After": "120"})]))
+
+    assert bodies == [None]
+    assert fallbacks == []
+    bucket = limiter._buckets[host]
+    assert bucket.blocked_until > time.monotonic() + 100
+    assert bucket.rate == pytest.approx(1.0)
+
+
+def test_feed_503_challenge_without_retry_after_still_uses_cloudscraper():
+    bodies, limiter, host, fallbacks = asyncio.run(
+        _fetch_with_server([(503, {})], cloudscraper_body=b"<rss/>")
+    )
+
+    assert bodies == [b"<rss/>"]
+    assert fallbacks == [f"http://{host}/rss"]
+    assert limiter._buckets[host].blocked_until == 0.0
@@ -0,0 +1,162 @@
+import threading
+
+import pytest
+
+from src.analysis.inference_server import BatchingEngine, InferenceClient, InferenceEngineError, InferenceServer
+
+
+class EchoEngine:
+    """Hasil = teks + credibility, supaya salah slicing langsung terlihat."""
+
+    inference_cache = None
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = fail_on
+
+    def stats(self):
+        return {"inference_cache": {"lookups": len(self.calls)}, "cascade": None}
+
+    def analyze_batch(self, texts, credibilities, batch_size=None):
+        self.calls.append(list(texts))
+        if self.fail_on in texts:
+            raise RuntimeError("inference error")
+        return [{"text": text, "credibility": cred} for text, cred in zip(texts, credibilities)]
+
+
+def _submit_concurrently(batcher, requests):
+    results = [None] * len(requests)
+    errors = [None] * len(requests)
+    barrier = threading.Barrier(len(requests))
+
+    def client(index, texts):
+        barrier.wait()
+        try:
+            results[index] = batcher.analyze_batch(texts, [index / 10] * len(texts))
+        except Exception as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=client, args=item) for item in enumerate(requests)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results, errors
+
+
+def test_concurrent_requests_are_merged_and_sliced_back():
+    engine = EchoEngine()
+    batcher = BatchingEngine(engine, max_batch_texts=1000, max_wait_ms=200)
+    requests = [[f"r{index}-t{i}" for i in range(index % 4)] for index in range(8)]
+    try:
+        results, errors = _submit_concurrently(batcher, requests)
+    finally:
+        batcher.stop()
+
+    assert errors == [None] * len(requests)
+    for index, texts in enumerate(requests):
+        assert [result["text"] for result in results[index]] == texts
+        assert all(result["credibility"] == index / 10 for result in results[index])
+    # Request yang datang bersamaan digabung (lebih sedikit batch daripada request)
+    assert len(engine.calls) < len(requests)
+    assert batcher.stats["requests"] == len(requests)
+    assert batcher.stats["texts"] == sum(len(texts) for texts in requests)
+
+
+def test_batch_respects_max_batch_texts():
+    engine = EchoEngine()
+    batcher = BatchingEngine(engine, max_batch_texts=4, max_wait_ms=200)
+    try:
+        results, errors = _submit_concurrently(batcher, [["a", "b", "c"]] * 4)
+    finally:
+        batcher.stop()
+
+    assert errors == [None] * 4
+    assert all([result["text"] for result in request_results] == ["a", "b", "c"] for request_results in results)
+    # Batch ditutup begitu mencapai >= 4 teks: paling banyak dua request per batch
+    assert all(len(call) <= 6 for call in engine.calls)
+
+
+def test_engine_error_is_raised_in_every_request_of_the_batch():
+    engine = EchoEngine(fail_on="bad")
+    batcher = BatchingEngine(engine, max_batch_texts=1000, max_wait_ms=200)
+    try:
+        results, errors = _submit_concurrently(batcher, [["ok"], ["bad"]])
+        merged = len(engine.calls) == 1
+        # Batch berikutnya tetap dilayani
+        assert batcher.analyze_batch(["later"], [0.5]) == [{"text": "later", "credibility": 0.5}]
+    finally:
+        batcher.stop()
+
+    assert isinstance(errors[1], RuntimeError)
+    if merged:
+        # Satu batch: semua request di dalamnya menerima error yang sama
+        assert isinstance(errors[0], RuntimeError)
+    else:
+        assert results[0] == [{"text": "ok", "credibility": 0.0}]
+    assert batcher.stats["errors"] >= 1
+
+
+def test_stopped_batcher_rejects_requests():
+    batcher = BatchingEngine(EchoEngine())
+    batcher.stop()
+    with pytest.raises(RuntimeError):
+        batcher.analyze_batch(["x"], [0.5])
+
+
+@pytest.fixture
+def start_daemon(tmp_path):
+    servers = []
+
+    def _start(engine):
+        server = InferenceServer(tmp_path / "inference.sock", engine, max_wait_ms=1.0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        servers.append((server, thread))
+        return server
+
+    yield _start
+    for server, thread in servers:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+def test_daemon_round_trip_does_not_truncate_texts(start_daemon):
+    # Pemotongan/windowing urusan TruthEngineAI._prepare_input, bukan transport daemon
+    engine = EchoEngine()
+    server = start_daemon(engine)
+    long_text = "Laba BBRI naik. " * 200
+    client = InferenceClient(server.socket_path, timeout=10.0, fallback=False)
+    results = client.analyze_batch([long_text, "pendek"], [0.9, 0.1])
+
+    assert [r["text"] for r in results] == [long_text, "pendek"]
+    assert engine.calls == [[long_text, "pendek"]]
+
+
+def test_engine_error_is_passed_through_without_local_fallback(start_daemon, monkeypatch):
+    server = start_daemon(EchoEngine(fail_on="bad"))
+    client = InferenceClient(server.socket_path, timeout=10.0, fallback=True)
+    monkeypatch.setattr(client, "_local", lambda: pytest.fail("model lokal tidak boleh dimuat"))
+
+    with pytest.raises(InferenceEngineError, match="inference error"):
+        client.analyze_batch(["bad"], [0.5])
+    # Daemon tetap dipakai untuk request berikutnya
+    assert client.analyze("good", 0.5) == {"text": "good", "credibility": 0.5}
+
+
+def test_unreachable_daemon_falls_back_to_local_engine(tmp_path, monkeypatch):
+    client = InferenceClient(tmp_path / "missing.sock", timeout=1.0, fallback=True)
+    local = EchoEngine()
+    monkeypatch.setattr(client, "_local", lambda: local)
+
+    assert client.analyze_batch(["x"], [0.4]) == [{"text": "x", "credibility": 0.4}]
+    assert local.calls == [["x"]]
+
+
+def test_stats_are_served_by_the_daemon(start_daemon):
+    server = start_daemon(EchoEngine())
+    client = InferenceClient(server.socket_path, timeout=10.0, fallback=False)
+    client.analyze_batch(["a", "b"], [0.5, 0.5])
+
+    assert client.stats() == {"inference_cache": {"lookups": 1}, "cascade": None}
@@ -0,0 +1,58 @@
+import pytest
+
+from src.analysis.inference_cache import InferenceCache
+from src.analysis.sentiment import TruthEngineAI
+
+
+def _fake_pipeline(texts, batch_size=1, **kwargs):
+    return [{"label": "LABEL_0", "score": 0.9} for _ in texts]
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    def _make():
+        engine = TruthEngineAI(load_model=False, use_cache=False, use_cascade=False)
+        engine.nlp_pipeline = _fake_pipeline
+        engine.inference_cache = InferenceCache(path=tmp_path / "inference_cache.sqlite3")
+        return engine
+    return _make
+
+
+TEXTS = [
+    "Saham bank di bursa bergerak datar, investor menunggu data hari ini",  # Indo-BERT
+    "Laba bersih BBRI naik, bank bagikan dividen",                          # heuristik
+    "Resep masakan rumahan untuk akhir pekan",                              # gatekeeper
+]
+
+
+def _without_marker(results):
+    return [{key: value for key, value in result.items() if key != "cache_hit"} for result in results]
+
+
+def test_cache_hits_keep_original_label_source(make_engine):
+    engine = make_engine()
+    first = engine.analyze_batch(TEXTS, [0.7, 0.7, 0.7])
+    assert [result["label_source"] for result in first] == ["model", "heuristic", "gatekeeper"]
+    assert not any("cache_hit" in result for result in first)
+
+    memory_hits = engine.analyze_batch(TEXTS, [0.7, 0.7, 0.7])
+    disk_hits = [make_engine().analyze(text, 0.7) for text in TEXTS]
+
+    for hits in (memory_hits, disk_hits):
+        assert all(result["cache_hit"] for result in hits)
+        assert _without_marker(hits) == first
+
+
+def test_cache_hit_recomputes_integrity_for_new_source(make_engine):
+    engine = make_engine()
+    engine.analyze(TEXTS[0], 0.7)
+    hit = engine.analyze(TEXTS[0], 0.2)
+
+    assert hit["label_source"] == "model"
+    assert hit["integrity_score"] == pytest.approx(-0.2)
+
+
+def test_duplicate_texts_in_batch_keep_label_source(make_engine):
+    results = make_engine().analyze_batch([TEXTS[0], TEXTS[0]], [0.7, 0.3])
+    assert [result["label_source"] for result in results] == ["model", "model"]
+    assert results[1]["cache_hit"] is True
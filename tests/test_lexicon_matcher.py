@@ -0,0 +1,77 @@
+import random
+import re
+
+import pytest
+
+from src.analysis.lexicon_matcher import SUBSTRING, WORD, LexiconMatcher, boundary_pattern_to_phrase
+
+WORD_PHRASES = ["bbri", "bi rate", "e-commerce", "laba", "laba bersih", "rp", "+5%", "(tbk)", "_x", "naik"]
+SUBSTRING_PHRASES = ["laba bersih naik", "rugi", "phk", "bi rate", "naik"]
+
+
+def _reference(text):
+    """Semantik helper regex lama yang digantikan matcher."""
+    return {
+        "word": frozenset(p for p in WORD_PHRASES if re.search(rf"\b{re.escape(p.lower())}\b", text)),
+        "substring": frozenset(p for p in SUBSTRING_PHRASES if p in text),
+    }
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return LexiconMatcher({"word": (WORD_PHRASES, WORD), "substring": (SUBSTRING_PHRASES, SUBSTRING)})
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "laba",
+    "labarugi",
+    "pelaba",
+    "laba bersih naik 5%",
+    "saham bbri.",
+    "bbri_2024 bbri2 xbbri",
+    "e-commerce tumbuh, ke-e-commerce-an",
+    "ecommerce",
+    "bi rate naik; bi ratex",
+    "rp1.000 rp 1.000 rprp",
+    "naik +5% hari ini, a+5%",
+    "emiten (tbk) dan x(tbk)y",
+    "a_x _x _xy",
+    "phk massal, rugikan",
+    "laba bersih naik laba bersih naik",
+    "labá bersih naïk",
+])
+def test_match_equals_regex_helpers(matcher, text):
+    assert matcher.match(text) == _reference(text)
+
+
+def test_match_random_texts_equal_regex_helpers(matcher):
+    rng = random.Random(7)
+    alphabet = ["laba", "bersih", "naik", "bbri", "bi", "rate", "e-commerce", "rp", "+5%", "(tbk)", "_x",
+                "rugi", "phk", "a", "1", "-", ".", ",", " ", "_", "é"]
+    for _ in range(2000):
+        text = "".join(rng.choice(alphabet) + rng.choice(["", " ", " "]) for _ in range(rng.randint(0, 12)))
+        assert matcher.match(text) == _reference(text), text
+
+
+def test_word_mode_lowercases_phrases_and_keeps_original_for_substring():
+    matcher = LexiconMatcher({"ticker": (["BBRI"], WORD), "raw": (["BBRI"], SUBSTRING)})
+    assert matcher.match("saham bbri naik") == {"ticker": frozenset({"bbri"}), "raw": frozenset()}
+
+
+def test_categories_without_hits_are_empty():
+    matcher = LexiconMatcher({"a": (["x"], WORD), "b": (["y"], SUBSTRING)})
+    assert matcher.match("tidak ada") == {"a": frozenset(), "b": frozenset()}
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        LexiconMatcher({"a": (["x"], "regex")})
+
+
+def test_boundary_pattern_to_phrase():
+    assert boundary_pattern_to_phrase(r"\bcuan\s+luber\b") == "cuan luber"
+    with pytest.raises(ValueError):
+        boundary_pattern_to_phrase(r"cuan\b")
+    with pytest.raises(ValueError):
+        boundary_pattern_to_phrase(r"\bcuan.*\b")
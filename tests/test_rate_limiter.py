@@ -0,0 +1,48 @@
+import pytest
+
+from src.data.rate_limiter import DomainRateLimiter, TokenBucket, parse_retry_after
+
+
+def _wake_times(bucket, now, count):
+    return [now + bucket.reserve(now) for _ in range(count)]
+
+
+def test_reserve_allows_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=2.0, capacity=2.0, updated_at=0.0)
+    assert _wake_times(bucket, 0.0, 4) == pytest.approx([0.0, 0.0, 0.5, 1.0])
+
+
+def test_reserve_refills_over_time():
+    bucket = TokenBucket(rate=1.0, capacity=2.0, updated_at=0.0)
+    _wake_times(bucket, 0.0, 2)
+    assert bucket.reserve(5.0) == 0.0
+
+
+def test_reserve_during_block_spaces_queued_requests_after_block():
+    bucket = TokenBucket(rate=1.0, capacity=2.0, updated_at=0.0)
+    bucket.blocked_until = 10.0
+
+    # Semua request datang saat blokir: bangun satu per satu mulai akhir blokir, tanpa burst
+    assert _wake_times(bucket, 1.0, 4) == pytest.approx([10.0, 11.0, 12.0, 13.0])
+    # Request yang datang belakangan tetap antre di belakang jadwal tersebut
+    assert 10.5 + bucket.reserve(10.5) == pytest.approx(14.0)
+
+
+def test_reserve_after_block_returns_to_normal():
+    bucket = TokenBucket(rate=1.0, capacity=2.0, updated_at=0.0)
+    bucket.blocked_until = 10.0
+    bucket.reserve(1.0)
+    assert bucket.reserve(30.0) == 0.0
+
+
+def test_record_throttle_halves_rate_and_blocks_host():
+    limiter = DomainRateLimiter(default_rate=1.0, min_rate=0.1)
+    limiter.record_throttle("example.com", retry_after=60)
+    bucket = limiter._bucket("example.com")
+    assert bucket.rate == pytest.approx(0.5)
+    assert bucket.blocked_until > 0
+
+
+@pytest.mark.parametrize("value, expected", [("120", 120.0), (None, None), ("soon", None)])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from src.data.crud import _chunk_timing_summary, cleanup_old_data
+from src.data.models import Article, Base, NewsSource, SentimentLog
+
+NOW = datetime.now(timezone.utc)
+OLD = NOW - timedelta(days=40)
+NEW_IDS = {8, 13}
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cleanup.db'}")
+    Base.metadata.create_all(engine)
+    with sessionmaker(engine)() as session:
+        session.add(NewsSource(id=1, domain="example.com", name="example.com", credibility_score=0.5))
+        # id 6..15: min_id tidak kelipatan chunk_size, chunk terakhir tidak penuh,
+        # dan artikel baru (8, 13) berada di tengah chunk yang dihapus
+        for article_id in range(6, 16):
+            session.add(Article(
+                id=article_id, source_id=1, url=f"https://example.com/{article_id}",
+                title=f"Judul {article_id}", content="isi",
+                scraped_at=NOW if article_id in NEW_IDS else OLD,
+            ))
+            session.add(SentimentLog(
+                article_id=article_id, sentiment_score=0.0, sentiment_label="NEUTRAL", confidence=0.5,
+            ))
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def test_chunked_cleanup_keeps_rows_newer_than_cutoff(db):
+    result = cleanup_old_data(db, retention_days=30, chunk_size=4)
+
+    assert sorted(db.scalars(select(Article.id))) == sorted(NEW_IDS)
+    assert sorted(db.scalars(select(SentimentLog.article_id))) == sorted(NEW_IDS)
+    assert result["deleted_articles"] == 8
+    assert result["deleted_sentiment_logs"] == 8
+    # Chunk [4, 8), [8, 12), [12, 16): batas kelipatan chunk_size, chunk terakhir sebagian
+    assert result["chunks"] == 3
+    assert result["max_chunk_ms"] >= result["p50_chunk_ms"] >= 0
+    assert result["chunk_total_ms"] >= result["max_chunk_ms"]
+
+
+def test_cleanup_without_expired_rows_reports_zero_chunks(db):
+    result = cleanup_old_data(db, retention_days=60, chunk_size=4)
+
+    assert result["chunks"] == 0
+    assert result["deleted_articles"] == 0
+    assert (result["chunk_total_ms"], result["max_chunk_ms"], result["p50_chunk_ms"]) == (0, 0.0, 0.0)
+
+
+def test_chunk_timing_summary():
+    assert _chunk_timing_summary([3.0, 1.0, 2.0, 10.0]) == {
+        "chunk_total_ms": 16.0,
+        "max_chunk_ms": 10.0,
+        "p50_chunk_ms": 2.5,
+    }
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from lxml import etree
+
+from src.data.scraper import AsyncNewsScraper, iter_rss_items
+
+FEED_URL = "https://news.example.com/rss"
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Feed</title>
+<item>
+  <title>Laba BBRI naik</title>
+  <link>https://www.kontan.co.id/a</link>
+  <description>&lt;a href="x"&gt;Laba bersih&lt;/a&gt; naik &amp;amp; dividen</description>
+  <pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>
+  <source url="https://www.kontan.co.id">Kontan</source>
+</item>
+<item><title>Tanpa link</title></item>
+</channel></rss>"""
+
+
+def test_iter_rss_items_parses_items():
+    items = list(iter_rss_items(FEED, FEED_URL))
+
+    assert [item.title for item in items] == ["Laba BBRI naik", "Tanpa link"]
+    assert items[0].url == "https://www.kontan.co.id/a"
+    assert items[0].content == "Laba bersih naik & dividen"
+    assert items[0].source_domain == "kontan.co.id"
+    # Item tanpa link/description: url feed dan judul sebagai konten
+    assert items[1].url == FEED_URL
+    assert items[1].content == "Tanpa link"
+
+
+def test_iter_rss_items_truncated_feed_keeps_complete_items():
+    truncated = FEED[:FEED.index(b"<item><title>Tanpa")] + b"<item><tit"
+    items = list(iter_rss_items(truncated, FEED_URL))
+    assert items[0].title == "Laba BBRI naik"
+    assert items[0].url == "https://www.kontan.co.id/a"
+
+
+@pytest.mark.parametrize("body", [b"not xml at all", b"<html><body>Access denied</body></html>"])
+def test_iter_rss_items_non_feed_body_yields_nothing(body):
+    assert list(iter_rss_items(body, FEED_URL)) == []
+
+
+def test_iter_rss_items_empty_body_raises():
+    with pytest.raises(etree.XMLSyntaxError):
+        list(iter_rss_items(b"", FEED_URL))
+
+
+def test_bad_feed_does_not_abort_other_feeds():
+    bodies = {"https://a/rss": b"", "https://b/rss": FEED}
+
+    async def run():
+        scraper = AsyncNewsScraper()
+
+        async def fake_fetch_feed(url):
+            return bodies[url]
+
+        scraper.fetch_feed = fake_fetch_feed
+        return await scraper.fetch_rss_items(list(bodies))
+
+    items = asyncio.run(run())
+    assert [item.title for item in items] == ["Laba BBRI naik", "Tanpa link"]
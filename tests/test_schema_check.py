@@ -0,0 +1,48 @@
+import importlib
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.data.models import Base
+
+# Tabel articles versi awal, sebelum kolom dedup & antrian ditambahkan migrate_db.py
+BASELINE_ARTICLES_DDL = """
+CREATE TABLE articles (
+    id INTEGER PRIMARY KEY,
+    source_id INTEGER,
+    url TEXT UNIQUE,
+    title TEXT,
+    content TEXT,
+    published_at DATETIME,
+    scraped_at DATETIME DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+@pytest.fixture
+def database(monkeypatch):
+    # src.data.database membuat engine dari DATABASE_URL saat import
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    return importlib.import_module("src.data.database")
+
+
+def test_migrated_schema_passes(database, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrated.db'}")
+    Base.metadata.create_all(engine)
+    database.check_schema(engine)
+
+
+def test_baseline_schema_fails_fast_with_migration_hint(database, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(BASELINE_ARTICLES_DDL))
+    # create_all hanya membuat tabel yang belum ada; articles lama tidak disentuh
+    Base.metadata.create_all(engine)
+
+    with pytest.raises(database.SchemaNotMigratedError) as excinfo:
+        database.check_schema(engine)
+
+    message = str(excinfo.value)
+    assert "articles.analysis_status" in message
+    assert "articles.title_norm_hash" in message
+    assert "migrate_db.py" in message
@@ -0,0 +1,51 @@
+from src.data.scraper import ScrapedData
+from src.data.seen_filter import SeenFilter
+
+
+def _item(url, title):
+    return ScrapedData(url=url, title=title, content=title, source_domain="example.com")
+
+
+def test_seen_filter_matches_url_or_normalized_title(tmp_path):
+    seen_filter = SeenFilter(tmp_path / "seen.bin")
+    seen_filter.add(_item("https://a/1", "Laba BBRI Naik!"))
+
+    assert seen_filter.is_seen(_item("https://a/1", "Judul lain"))
+    assert seen_filter.is_seen(_item("https://b/2", "laba bbri naik"))
+    assert not seen_filter.is_seen(_item("https://b/3", "Laba BMRI naik"))
+
+
+def test_seen_filter_ignores_empty_normalized_titles(tmp_path):
+    seen_filter = SeenFilter(tmp_path / "seen.bin")
+    seen_filter.add(_item("https://a/1", "!!!"))
+    assert not seen_filter.is_seen(_item("https://a/2", "???"))
+
+
+def test_seen_filter_round_trip(tmp_path):
+    path = tmp_path / "cache" / "seen.bin"
+    items = [_item(f"https://a/{i}", f"Judul berita {i}") for i in range(50)]
+
+    seen_filter = SeenFilter(path)
+    seen_filter.warmed_at = 1234.5
+    for item in items[:25]:
+        seen_filter.add(item)
+    seen_filter.save()
+    # Key yang di-add setelah save (dan sebelum save berikutnya) ikut tersimpan juga
+    for item in items[25:]:
+        seen_filter.add(item)
+    seen_filter.save()
+
+    loaded = SeenFilter(path)
+    assert loaded.load()
+    assert loaded.warmed_at == 1234.5
+    assert len(loaded) == len(seen_filter) == 100
+    assert all(loaded.is_seen(item) for item in items)
+    assert not loaded.is_seen(_item("https://a/999", "Judul berita 999"))
+
+
+def test_seen_filter_load_rejects_missing_or_corrupt_file(tmp_path):
+    path = tmp_path / "seen.bin"
+    assert not SeenFilter(path).load()
+
+    path.write_bytes(b"\x00")
+    assert not SeenFilter(path).load()
@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from src.analysis.inference_pool import cpu_thread_budget, default_threads_per_worker, limit_process_threads
+
+THREAD_ENV = ("SENTIMENT_CPU_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS", "ONNX_INTRA_OP_THREADS")
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    # delenv mendaftarkan nilai lama, jadi perubahan os.environ oleh limit_process_threads dipulihkan
+    for name in THREAD_ENV:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_default_budget_is_all_cores_split_per_worker(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    assert cpu_thread_budget() == 8
+    assert default_threads_per_worker(4) == 2
+    assert default_threads_per_worker(16) == 1
+
+
+def test_worker_budget_is_divided_again_by_the_pool(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    # src.worker --workers 2: tiap proses dapat 4 thread; pool 2 worker di dalamnya -> 2 thread
+    limit_process_threads(default_threads_per_worker(2))
+
+    assert cpu_thread_budget() == 4
+    assert default_threads_per_worker(2) == 2
+    assert os.environ["OMP_NUM_THREADS"] == "4"
+    assert os.environ["ONNX_INTRA_OP_THREADS"] == "4"
+
+
+def test_explicit_thread_settings_are_kept(monkeypatch):
+    monkeypatch.setenv("ONNX_INTRA_OP_THREADS", "1")
+    limit_process_threads(3)
+
+    assert os.environ["ONNX_INTRA_OP_THREADS"] == "1"
+    assert os.environ["MKL_NUM_THREADS"] == "3"
@@ -0,0 +1,130 @@
+import pytest
+
+from src.analysis.windowing import SentenceWindower, TickerMatcher, split_sentences
+
+MAPPING = {"bank rakyat indonesia": "BBRI", "telkom indonesia": "TLKM"}
+CONTEXT_WORDS = ("laba", "saham", "dividen")
+
+
+def _word_counter(texts):
+    return [len(text.split()) for text in texts]
+
+
+def _is_context(sentence):
+    lowered = sentence.lower()
+    return any(word in lowered for word in CONTEXT_WORDS)
+
+
+def _windower(**kwargs):
+    return SentenceWindower(_word_counter, _is_context, TickerMatcher(MAPPING), **kwargs)
+
+
+def test_split_sentences_keeps_abbreviations_together():
+    text = "PT. Bank Rakyat Indonesia Tbk. mencatat laba Rp. 10 triliun. Saham naik!\nDividen dibagikan."
+    assert split_sentences(text) == [
+        "PT. Bank Rakyat Indonesia Tbk. mencatat laba Rp. 10 triliun.",
+        "Saham naik!",
+        "Dividen dibagikan.",
+    ]
+
+
+def test_ticker_matcher_finds_codes_and_company_names():
+    matcher = TickerMatcher(MAPPING)
+    assert matcher.find("$BBRI dan Telkom Indonesia menguat.") == frozenset({"BBRI", "TLKM"})
+    assert matcher.find("Kode ABCD bukan emiten terdaftar.") == frozenset()
+
+
+def test_build_returns_none_without_relevant_sentences():
+    assert _windower().build("Cuaca cerah hari ini. Jalanan ramai.") is None
+
+
+def test_build_groups_sentences_per_ticker_and_drops_noise():
+    text = (
+        "BBRI mencatat laba tinggi. "
+        "Cuaca cerah hari ini. "
+        "TLKM membagikan dividen. "
+        "Saham perbankan menguat. "
+        "BBRI juga menambah cabang. "
+        "BBRI dan TLKM masuk indeks."
+    )
+    result = _windower().build(text)
+
+    assert [window.text for window in result.windows] == [
+        "BBRI mencatat laba tinggi. BBRI juga menambah cabang.",
+        "TLKM membagikan dividen.",
+        "Saham perbankan menguat.",
+        "BBRI dan TLKM masuk indeks.",
+    ]
+    assert [window.tickers for window in result.windows] == [
+        frozenset({"BBRI"}),
+        frozenset({"TLKM"}),
+        frozenset(),
+        frozenset({"BBRI", "TLKM"}),
+    ]
+    assert result.tickers == frozenset({"BBRI", "TLKM"})
+    assert "Cuaca" not in result.text
+    assert result.text == " ".join(window.text for window in result.windows)
+
+
+def test_build_packs_windows_within_token_budget():
+    sentences = [f"Saham kalimat nomor {i} naik." for i in range(6)]  # 5 token per kalimat
+    result = _windower(max_tokens=11, max_windows=10).build(" ".join(sentences))
+
+    # 5 + 1 pemisah + 5 = 11 muat, kalimat ketiga memulai window baru
+    assert [window.text for window in result.windows] == [
+        " ".join(sentences[0:2]),
+        " ".join(sentences[2:4]),
+        " ".join(sentences[4:6]),
+    ]
+    assert all(window.tokens <= 11 for window in result.windows)
+
+
+def test_build_caps_number_of_windows():
+    sentences = [f"Saham kalimat nomor {i} naik." for i in range(6)]
+    result = _windower(max_tokens=5, max_windows=2).build(" ".join(sentences))
+
+    assert [window.text for window in result.windows] == sentences[:2]
+    assert result.text == " ".join(sentences[:2])
+
+
+@pytest.mark.parametrize("max_sentence_chars", [10, 40])
+def test_build_truncates_overlong_sentences(max_sentence_chars):
+    sentence = "Laba " + "x" * 100
+    result = _windower(max_sentence_chars=max_sentence_chars).build(sentence)
+    assert result.windows[0].text == sentence[:max_sentence_chars]
+
+
+def test_window_mode_features_use_the_same_input_as_the_label():
+    from src.analysis.sentiment import TruthEngineAI
+
+    engine = TruthEngineAI(load_model=False, use_cache=False, use_cascade=False, input_mode="window")
+    boilerplate = "Baca juga artikel lainnya di situs kami. Ikuti kami di media sosial. " * 10
+    text = boilerplate + "Saham BBRI naik karena laba bersih bank tumbuh dan dividen besar."
+
+    features = engine.extract_features_batch([text])[0]
+
+    # Kalimat finansial ada setelah 512 karakter pertama; fitur tetap melihatnya
+    assert repr(features) == repr(engine.extract_features(engine._prepare_input(text)[0]))
+    assert engine._is_financial(features)
+    assert engine.analyze(text)["label_source"] != "gatekeeper"
+
+
+def test_build_splits_sentences_longer_than_the_token_budget():
+    words = [f"saham{i}" for i in range(30)]
+    result = _windower(max_tokens=8, max_windows=10).build(" ".join(words) + ".")
+
+    assert all(window.tokens <= 8 for window in result.windows)
+    assert all(count <= 8 for count in _word_counter([window.text for window in result.windows]))
+    assert " ".join(window.text for window in result.windows).split() == words[:-1] + [words[-1] + "."]
+
+
+def test_build_splits_overlong_words_without_spaces():
+    def char_counter(texts):
+        return [len(text) for text in texts]
+
+    windower = SentenceWindower(char_counter, _is_context, max_tokens=10, max_windows=10)
+    sentence = "Laba" + "x" * 36
+    result = windower.build(sentence)
+
+    assert all(window.tokens <= 10 for window in result.windows)
+    assert "".join(window.text.replace(" ", "") for window in result.windows) == sentence
@@ -0,0 +1,166 @@
+import os
+import threading
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from src.data import crud
+from src.data.crud import claim_articles, release_article_claims
+from src.data.models import (
+    ANALYSIS_DONE, ANALYSIS_FAILED, ANALYSIS_PENDING, ANALYSIS_PROCESSING, Article, Base, NewsSource, SentimentLog,
+)
+from src.worker import process_claimed_batch
+
+
+def _seed(Session, count):
+    with Session() as db:
+        db.add(NewsSource(id=1, domain="example.com", name="example.com", credibility_score=0.5))
+        db.add_all(
+            Article(id=i, source_id=1, url=f"https://example.com/{i}", title=f"Judul {i}", content=f"isi {i}")
+            for i in range(1, count + 1)
+        )
+        db.commit()
+
+
+@pytest.fixture
+def Session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}")
+    Base.metadata.create_all(engine)
+    _seed(sessionmaker(engine), 6)
+    crud.invalidate_source_cache()
+    yield sessionmaker(engine)
+    engine.dispose()
+
+
+class FakeEngine:
+    """analyze_batch gagal jika batch memuat teks `poison`; analyze per teks hanya gagal untuk teks itu."""
+
+    def __init__(self, poison=None):
+        self.poison = poison
+
+    def analyze(self, text, source_credibility=0.5):
+        if text == self.poison:
+            raise RuntimeError("inference error")
+        return {"sentiment_label": "NEUTRAL", "confidence": 0.5, "integrity_score": 0.0,
+                "source_credibility": source_credibility, "noise_probability": 0.0, "label_source": "model"}
+
+    def analyze_batch(self, texts, credibilities):
+        return [self.analyze(text, credibility) for text, credibility in zip(texts, credibilities)]
+
+
+def _statuses(db):
+    return dict(db.execute(select(Article.id, Article.analysis_status).order_by(Article.id)).all())
+
+
+def test_claim_is_ordered_and_counts_attempts(Session):
+    with Session() as db:
+        first = claim_articles(db, "w1", limit=4)
+        second = claim_articles(db, "w2", limit=4)
+
+        assert [article.id for article in first] == [1, 2, 3, 4]
+        assert [article.id for article in second] == [5, 6]
+        assert all(article.analysis_attempts == 1 for article in first + second)
+        assert claim_articles(db, "w3", limit=4) == []
+
+
+def test_release_returns_claims_then_fails_after_max_attempts(Session):
+    with Session() as db:
+        for attempt in range(1, 3):
+            claimed = claim_articles(db, "w1", limit=1, max_attempts=2)
+            assert [article.id for article in claimed] == [1]
+            assert release_article_claims(db, "w1", max_attempts=2) == 1
+            expected = ANALYSIS_PENDING if attempt < 2 else ANALYSIS_FAILED
+            assert _statuses(db)[1] == expected
+
+        # Artikel failed tidak di-claim lagi
+        assert [article.id for article in claim_articles(db, "w1", limit=1, max_attempts=2)] == [2]
+
+
+def test_expired_lease_at_max_attempts_is_marked_failed(Session):
+    with Session() as db:
+        claim_articles(db, "crashed", limit=1, lease_seconds=-1, max_attempts=1)
+        claimed = claim_articles(db, "w2", limit=1, max_attempts=1)
+
+        assert [article.id for article in claimed] == [2]
+        assert _statuses(db)[1] == ANALYSIS_FAILED
+
+
+def test_process_claimed_batch_isolates_failing_text(Session):
+    with Session() as db:
+        articles = claim_articles(db, "w1", limit=3)
+        analyzed = process_claimed_batch(db, FakeEngine(poison="isi 2"), "w1", articles)
+
+        assert analyzed == 2
+        statuses = _statuses(db)
+        assert [statuses[1], statuses[2], statuses[3]] == [ANALYSIS_DONE, ANALYSIS_PENDING, ANALYSIS_DONE]
+        assert db.scalars(select(SentimentLog.article_id).order_by(SentimentLog.article_id)).all() == [1, 3]
+
+
+def test_process_claimed_batch_releases_claims_when_save_fails(Session, monkeypatch):
+    monkeypatch.setattr("src.worker.save_sentiment_logs", lambda db, results: {"error": "db down"})
+    with Session() as db:
+        articles = claim_articles(db, "w1", limit=3)
+
+        assert process_claimed_batch(db, FakeEngine(), "w1", articles) == 0
+        statuses = _statuses(db)
+        assert [statuses[1], statuses[2], statuses[3]] == [ANALYSIS_PENDING] * 3
+
+
+def test_claim_articles_propagates_database_errors(Session, monkeypatch):
+    with Session() as db:
+        def broken_execute(*args, **kwargs):
+            raise OperationalError("UPDATE articles", {}, RuntimeError("db down"))
+
+        monkeypatch.setattr(db, "execute", broken_execute)
+        # Bukan [] (yang akan terbaca "antrian kosong" oleh pipeline)
+        with pytest.raises(OperationalError):
+            claim_articles(db, "w1")
+
+
+@pytest.mark.postgres
+def test_concurrent_claims_are_disjoint():
+    """
+    Satu-satunya test jalur FOR UPDATE SKIP LOCKED (SQLite mengabaikannya). Tidak ada CI di repo,
+    jadi jalankan manual dengan TEST_DATABASE_URL sebelum mengubah claim_articles (lihat README).
+    """
+    url = os.getenv("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL tidak di-set")
+
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(engine)
+    _seed(Session, 400)
+
+    claimed = {}
+    barrier = threading.Barrier(8)
+
+    def worker(index):
+        worker_id = f"w{index}"
+        ids = []
+        with Session() as db:
+            barrier.wait()
+            while True:
+                batch = claim_articles(db, worker_id, limit=7)
+                if not batch:
+                    break
+                ids.extend(article.id for article in batch)
+        claimed[worker_id] = ids
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    all_ids = [article_id for ids in claimed.values() for article_id in ids]
+    try:
+        assert len(all_ids) == len(set(all_ids)) == 400
+        with Session() as db:
+            assert set(_statuses(db).values()) == {ANALYSIS_PROCESSING}
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
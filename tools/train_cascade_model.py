@@ -0,0 +1,168 @@
+"""
+Latih model linear cascade TruthEngineAI dari riwayat sentiment_logs (distilasi label Indo-BERT).
+
+Data: sentiment_logs + articles dalam --days terakhir dengan label POSITIVE/NEGATIVE/NEUTRAL.
+- label_source = 'model'  : label Indo-BERT, dipakai
+- label_source NULL       : log lama sebelum kolom ada; dipakai jika teksnya tidak akan dijawab
+                            gatekeeper/heuristik (dicek ulang dengan kamus saat ini)
+- sumber lain (heuristic, cascade, gatekeeper) tidak dipakai, supaya model tidak belajar dari dirinya sendiri
+
+Output: akurasi holdout terhadap Indo-BERT dan tabel threshold (porsi teks yang dijawab model
+linear vs agreement). Threshold terendah dengan agreement >= --target-agreement disimpan
+sebagai `suggested_threshold` (bisa ditimpa CASCADE_CONFIDENCE_THRESHOLD). Model final
+dilatih ulang dengan seluruh data lalu disimpan ke CASCADE_MODEL_PATH / SENTI_CACHE_DIR.
+
+Contoh:
+    python tools/train_cascade_model.py
+    python tools/train_cascade_model.py --days 180 --target-agreement 0.97
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parents[1]
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+import numpy as np
+from sqlalchemy import or_, select
+
+from src.analysis.cascade import CASCADE_LABELS, build_estimator, default_model_path, save_model
+from src.analysis.sentiment import MODEL_NAME, TruthEngineAI
+from src.data.database import SessionLocal
+from src.data.models import Article, SentimentLog
+
+THRESHOLDS = (0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95)
+
+
+def load_training_rows(days: int, limit: int):
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    db = SessionLocal()
+    try:
+        stmt = (
+            select(Article.content, SentimentLog.sentiment_label, SentimentLog.label_source)
+            .join(SentimentLog, SentimentLog.article_id == Article.id)
+            .where(
+                SentimentLog.analyzed_at >= since,
+                SentimentLog.sentiment_label.in_(CASCADE_LABELS),
+                or_(SentimentLog.label_source == "model", SentimentLog.label_source.is_(None)),
+            )
+            .order_by(SentimentLog.id.desc())
+            .limit(limit)
+        )
+        return db.execute(stmt).all()
+    finally:
+        db.close()
+
+
+def select_model_labels(rows, engine: TruthEngineAI):
+    """Teks unik (sama seperti input model: 512 karakter) yang memang sampai ke tier model."""
+    texts, labels, seen = [], [], set()
+    skipped = 0
+    for content, label, label_source in rows:
+        safe_text = (content or "")[:512]
+        if not safe_text or safe_text in seen:
+            continue
+        if label_source is None:
+            features = engine.extract_features(safe_text)
+            # Log lama: buang yang dijawab gatekeeper / frase absolut / kamus
+            if not engine._is_financial(features) or features.has_absolute_positive or features.dictionary_label:
+                skipped += 1
+                continue
+        seen.add(safe_text)
+        texts.append(safe_text)
+        labels.append(label)
+    return texts, labels, skipped
+
+
+def threshold_table(probabilities: np.ndarray, predicted: np.ndarray, truth: np.ndarray):
+    confidence = probabilities.max(axis=1)
+    rows = []
+    for threshold in THRESHOLDS:
+        answered = confidence >= threshold
+        coverage = float(answered.mean())
+        agreement = float((predicted[answered] == truth[answered]).mean()) if answered.any() else None
+        rows.append((threshold, coverage, agreement))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=90, help="Riwayat sentiment_logs yang dipakai (hari)")
+    parser.add_argument("--limit", type=int, default=200000, help="Maksimal baris yang dibaca")
+    parser.add_argument("--min-samples", type=int, default=300)
+    parser.add_argument("--holdout", type=float, default=0.2)
+    parser.add_argument("--target-agreement", type=float, default=0.95)
+    parser.add_argument("--C", type=float, default=4.0, help="Regularisasi LogisticRegression")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=None, help="Default: CASCADE_MODEL_PATH / SENTI_CACHE_DIR")
+    args = parser.parse_args()
+
+    from sklearn.model_selection import train_test_split
+
+    engine = TruthEngineAI(load_model=False, use_cache=False)
+    rows = load_training_rows(args.days, args.limit)
+    texts, labels, skipped = select_model_labels(rows, engine)
+    counts = {label: labels.count(label) for label in CASCADE_LABELS}
+    print(f"Baris dibaca: {len(rows)}, teks unik label Indo-BERT: {len(texts)} (heuristik dilewati: {skipped})")
+    print(f"Distribusi label: {counts}")
+
+    if len(texts) < args.min_samples or sum(1 for count in counts.values() if count >= 2) < 2:
+        print(f"GAGAL: data terlalu sedikit (minimal {args.min_samples} teks, >= 2 kelas). Model tidak disimpan.")
+        return 1
+
+    stratify = labels if min(count for count in counts.values() if count) >= 2 else None
+    train_texts, test_texts, train_labels, test_labels = train_test_split(
+        texts, labels, test_size=args.holdout, random_state=args.seed, stratify=stratify
+    )
+
+    estimator = build_estimator(C=args.C)
+    estimator.fit(train_texts, train_labels)
+    probabilities = estimator.predict_proba(test_texts)
+    predicted = estimator.classes_[probabilities.argmax(axis=1)]
+    truth = np.asarray(test_labels)
+    accuracy = float((predicted == truth).mean())
+
+    print(f"\nHoldout: {len(test_texts)} teks, akurasi vs Indo-BERT {accuracy:.3f}")
+    print(f"{'threshold':>9} {'dijawab':>8} {'agreement':>9}")
+    suggested = None
+    for threshold, coverage, agreement in threshold_table(probabilities, predicted, truth):
+        agreement_text = f"{agreement:.3f}" if agreement is not None else "-"
+        print(f"{threshold:>9.2f} {coverage:>8.1%} {agreement_text:>9}")
+        if suggested is None and agreement is not None and agreement >= args.target_agreement:
+            suggested = (threshold, coverage, agreement)
+
+    if suggested is None:
+        suggested = (THRESHOLDS[-1], None, None)
+        print(f"⚠️ Tidak ada threshold dengan agreement >= {args.target_agreement}, pakai {THRESHOLDS[-1]}")
+    else:
+        print(
+            f"Saran threshold: {suggested[0]} (dijawab {suggested[1]:.1%}, agreement {suggested[2]:.3f}, "
+            f"transformer dipanggil untuk ~{1 - suggested[1]:.1%} teks non-heuristik)"
+        )
+
+    # Model final: seluruh data
+    final_estimator = build_estimator(C=args.C)
+    final_estimator.fit(texts, labels)
+    path = save_model(
+        final_estimator,
+        {
+            "teacher_model": MODEL_NAME,
+            "samples": len(texts),
+            "label_counts": counts,
+            "days": args.days,
+            "holdout_accuracy": round(accuracy, 4),
+            "suggested_threshold": suggested[0],
+            "suggested_coverage": suggested[1],
+            "suggested_agreement": suggested[2],
+        },
+        args.output or default_model_path(),
+    )
+    print(f"SUKSES! Model cascade disimpan ke {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())